@@ -0,0 +1,87 @@
+"""OptionCatalog build time, memory and query latency on a large catalog.
+
+Queries are compared with a linear scan over folded option labels, which is
+what filtering a plain list of SelectOptions costs.
+
+Run from a checkout with ``python benchmarks/bench_catalog.py [count]``
+(default 1,000,000 options).
+"""
+import os
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from discord_components.catalog import OptionCatalog
+from discord_components.component import SelectOption
+
+ADJECTIVES = ['Red', 'Blue', 'Crème', 'Über', 'Small', 'Large', 'Vintage', 'Café', 'Smart', 'Silent', 'Rapid', 'Golden']
+NOUNS = ['Lamp', 'Chair', 'Desk', 'Brûlée', 'Keyboard', 'Monitor', 'Kettle', 'Sofa', 'Shelf', 'Clock', 'Mug', 'Fan']
+QUERIES = ['lamp', 'creme', 'vint chair', 'uber key', 'gold clock 77', 'sku 123456', 'zzz', 'c']
+
+
+def make_options(count: int):
+    rng = random.Random(1)
+    for i in range(count):
+        label = f'{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.randrange(1000)}'
+        yield SelectOption(label=label, value=f'sku-{i}', description=f'{rng.choice(ADJECTIVES)} edition')
+
+
+def measure(name: str, func, number: int) -> None:
+    elapsed = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f'  {name:<28} {elapsed * 1e6:12.1f} us')
+
+
+def main(count: int = 1_000_000) -> None:
+    options = list(make_options(count))
+    
+    start = time.perf_counter()
+    catalog = OptionCatalog(options)
+    built = time.perf_counter() - start
+    
+    # Measured on a second build: tracemalloc slows allocation down a lot.
+    del catalog
+    tracemalloc.start()
+    catalog = OptionCatalog(options)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f'{count} options: built in {built:.2f}s, index uses {memory / 2**20:.1f} MiB '
+          f'({memory / count:.0f} B/option, options themselves excluded), {len(catalog._tokens)} distinct words')
+    
+    labels = [(catalog.fold(option.label), option) for option in options]
+    
+    def linear(query):
+        words = catalog.tokenize(query)
+        found = []
+        for label, option in labels:
+            if all(word in label for word in words):
+                found.append(option)
+                if len(found) == 25:
+                    break
+        return found
+    
+    print('query latency (top 25):')
+    for query in QUERIES:
+        hits = len(catalog.search(query))
+        measure(f'{query!r} ({hits} hits)', lambda: catalog.search(query), 200)
+    
+    print('linear scan (top 25):')
+    for query in ('lamp', 'gold clock 77', 'zzz'):
+        measure(repr(query), lambda: linear(query), 1)
+    
+    extra = SelectOption(label='Brand new widget', value='sku-new', description='Fresh')
+    
+    def add_remove():
+        catalog.add(extra)
+        catalog.remove('sku-new')
+    
+    print('incremental:')
+    measure('add + remove', add_remove, 200)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
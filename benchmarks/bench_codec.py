@@ -0,0 +1,59 @@
+"""Encode/decode cost and size of CustomIdCodec custom_ids.
+
+Compares the codec, with and without an HMAC, against JSON in the custom_id
+and against a dict lookup standing in for the server-side state it replaces.
+
+Run from a checkout with ``python benchmarks/bench_codec.py``.
+"""
+import enum
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import discord
+
+from discord_components.codec import CustomIdCodec, get_codec
+
+
+class Sort(enum.IntEnum):
+    newest = 0
+    oldest = 1
+    popular = 2
+
+
+FIELDS = {'user': discord.abc.Snowflake, 'page': int, 'item': str, 'sort': Sort}
+VALUES = {'user': 272394939481718784, 'page': 17, 'item': 'sku-4411', 'sort': Sort.popular}
+
+
+def report(name: str, func, number: int) -> None:
+    elapsed = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f'{name:<24} {elapsed * 1e6:8.3f} us/call  {1 / elapsed:12.0f} ops/s')
+
+
+def main(number: int = 100000) -> None:
+    plain = CustomIdCodec('bench', FIELDS)
+    signed = CustomIdCodec('bench-signed', FIELDS, secret=b'correct horse battery staple')
+    plain_id = plain.encode(**VALUES)
+    signed_id = signed.encode(**VALUES)
+    json_id = 'bench:' + json.dumps({**VALUES, 'sort': int(VALUES['sort'])}, separators=(',', ':'))
+    table = {plain_id: dict(VALUES)}
+    
+    print(f'codec:        {len(plain_id):3} chars  {plain_id}')
+    print(f'codec + hmac: {len(signed_id):3} chars  {signed_id}')
+    print(f'json:         {len(json_id):3} chars  {json_id}')
+    print()
+    
+    report('encode', lambda: plain.encode(**VALUES), number)
+    report('encode + hmac', lambda: signed.encode(**VALUES), number)
+    report('decode', lambda: plain.decode(plain_id), number)
+    report('decode + hmac', lambda: signed.decode(signed_id), number)
+    report('lookup + decode', lambda: get_codec(plain_id).decode(plain_id), number)
+    report('json.loads', lambda: json.loads(json_id[6:]), number)
+    report('dict lookup (no I/O)', lambda: table[plain_id], number)
+
+
+if __name__ == '__main__':
+    main()
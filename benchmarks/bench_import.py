@@ -0,0 +1,81 @@
+"""Import cost of the package, measured with ``python -X importtime``.
+
+Each scenario runs in a fresh interpreter so nothing is cached in
+``sys.modules``. The reported time is the sum of the cumulative times of
+the top-level imports the scenario triggers (the interpreter's own startup
+is left out), the best of ``--repeat`` runs. Also reports how many modules
+were imported and whether discord.ui was loaded.
+
+Run from a checkout with ``python benchmarks/bench_import.py [--repeat N]``.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+SCENARIOS = {
+    'builders': 'from discord_components import Button, SelectMenu, SelectOption',
+    'builders + payload': (
+        'from discord_components import Button, ComponentMessage\n'
+        "ComponentMessage(components=[[Button(label='a', custom_id='a')]]).to_dict()"
+    ),
+    'package (lazy)': 'import discord_components',
+    'router': 'from discord_components import component_handler, get_router',
+    'everything': 'import discord_components.component, discord_components.snapshot, discord_components.persistence',
+    'discord (reference)': 'import discord'
+}
+
+# Printed after the scenario; read back from stdout.
+REPORT = "\nimport sys\nprint(len(sys.modules), 'discord.ui' in sys.modules)"
+
+
+def startup_modules() -> set:
+    # Modules the bare interpreter imports at startup; they are excluded.
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, text=True).stderr
+    return {line.split('|')[2].strip() for line in output.splitlines() if line.startswith('import time:') and '|' in line}
+
+
+def run(code: str, startup: set):
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code + REPORT],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    if result.returncode:
+        raise RuntimeError(f'{code!r} failed:\n{result.stderr[-2000:]}')
+    
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        # Top-level imports have no indentation before the name.
+        if not name.startswith('  ') and name.strip() not in startup:
+            total += int(cumulative)
+    
+    modules, ui_loaded = result.stdout.split()[-2:]
+    return total, int(modules), ui_loaded == 'True'
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+    
+    startup = startup_modules()
+    print(f'{"scenario":<22} {"import ms":>10} {"modules":>8}  discord.ui')
+    for name, code in SCENARIOS.items():
+        runs = [run(code, startup) for _ in range(args.repeat)]
+        best = min(total for total, _, _ in runs)
+        _, modules, ui_loaded = runs[0]
+        print(f'{name:<22} {best / 1000:10.1f} {modules:8d}  {"yes" if ui_loaded else "no"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Per-instance size and catalog footprint of the slot-based component classes.
+
+Compares against plain ``__dict__`` classes equivalent to the previous
+implementation. Run from a checkout with ``python benchmarks/bench_memory.py``.
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import discord
+
+from discord_components.component import Button, SelectMenu, SelectOption
+
+
+class LegacySelectOption:
+    def __init__(self, *, label, value, description=None, emoji=None, default=False):
+        self.label = label
+        self.value = value
+        self.description = description
+        self.emoji = emoji
+        self.default = default
+
+
+class LegacySelectMenu:
+    def __init__(self, *, custom_id, options, placeholder=None, min_values=1, max_values=1, disabled=False, row=None):
+        self.custom_id = custom_id
+        self.disabled = disabled
+        self.options = options
+        self.placeholder = placeholder
+        self.min_values = min_values
+        self.max_values = max_values
+        self.row = row
+
+
+class LegacyButton:
+    def __init__(self, *, style=discord.ButtonStyle.secondary, label=None, emoji=None, url=None, custom_id=None, disabled=False, row=None):
+        self.custom_id = custom_id
+        self.disabled = disabled
+        self.style = style
+        self.label = label
+        self.emoji = emoji
+        self.url = url
+        self.row = row
+
+
+def measure(factory, count: int) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = factory(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return total
+
+
+def options(cls):
+    # Labels and values are interned up front so only the instances are measured.
+    labels = [f'Product {i}' for i in range(100_000)]
+    values = [str(i) for i in range(100_000)]
+    
+    def factory(count):
+        return [cls(label=labels[i], value=values[i]) for i in range(count)]
+    return factory
+
+
+def buttons(cls):
+    def factory(count):
+        return [cls(label='Buy', custom_id='shop:buy') for _ in range(count)]
+    return factory
+
+
+def catalog(menu_cls, option_cls):
+    # One select menu per page of 25 options, labels and values included.
+    def factory(count):
+        return [
+            menu_cls(custom_id=f'catalog:{page}', options=[
+                option_cls(label=f'Product {i}', value=str(i))
+                for i in range(page * 25, min((page + 1) * 25, count))
+            ])
+            for page in range((count + 24) // 25)
+        ]
+    return factory
+
+
+def main(count: int = 100_000) -> None:
+    for name, legacy, current in (
+        ('SelectOption', options(LegacySelectOption), options(SelectOption)),
+        ('Button', buttons(LegacyButton), buttons(Button)),
+    ):
+        before = measure(legacy, count) / count
+        after = measure(current, count) / count
+        print(f'{name:>13}: {before:7.1f} B/instance -> {after:7.1f} B/instance ({after / before:.0%})')
+    
+    before = measure(catalog(LegacySelectMenu, LegacySelectOption), count)
+    after = measure(catalog(SelectMenu, SelectOption), count)
+    print(f'{count} option catalog: {before / 2**20:7.2f} MiB -> {after / 2**20:7.2f} MiB ({after / before:.0%})')
+
+
+if __name__ == '__main__':
+    main()
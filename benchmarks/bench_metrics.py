@@ -0,0 +1,70 @@
+"""Per-event overhead of the built-in metrics.
+
+Times ``Metrics.observe`` on its own and end-to-end dispatch (route lookup,
+handler, one ``ctx.defer``) with metrics enabled and disabled. A dispatch
+records three events: dispatch latency, handler duration and the defer's
+REST duration plus time-to-first-response.
+
+Run from a checkout with ``python benchmarks/bench_metrics.py``.
+"""
+import asyncio
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from discord_components.component import component_handler
+from discord_components.metrics import Metrics, get_metrics
+from discord_components.testing import FakeBot, button_interaction
+
+EVENTS_PER_DISPATCH = 4
+
+
+def bench_observe(number: int) -> None:
+    metrics = Metrics()
+    metrics.observe('handler_duration', 0.001, 'approve', 2)
+
+    elapsed = min(timeit.repeat(lambda: metrics.observe('handler_duration', 0.001, 'approve', 2), number=number, repeat=5))
+    baseline = min(timeit.repeat(lambda: None, number=number, repeat=5))
+    print(f'observe: {(elapsed - baseline) / number * 1e9:8.1f} ns/event')
+
+
+def bench_dispatch(number: int) -> None:
+    bot = FakeBot()
+
+    @component_handler(bot, 'approve')
+    async def approve(ctx):
+        await ctx.defer()
+
+    loop = asyncio.new_event_loop()
+    interactions = [button_interaction('approve') for _ in range(number)]
+
+    def run():
+        async def dispatch_all():
+            for interaction in interactions:
+                interaction.response._done = False
+                await bot.emit('on_interaction', interaction)
+        loop.run_until_complete(dispatch_all())
+
+    metrics = get_metrics()
+    results = {}
+    for enabled in (False, True, False, True):
+        metrics.enabled = enabled
+        elapsed = min(timeit.repeat(run, number=1, repeat=5)) / number
+        results[enabled] = min(results.get(enabled, elapsed), elapsed)
+    loop.close()
+
+    overhead = results[True] - results[False]
+    print(f'dispatch (metrics off): {results[False] * 1e6:8.3f} us')
+    print(f'dispatch (metrics on):  {results[True] * 1e6:8.3f} us')
+    print(f'overhead: {overhead * 1e9:8.1f} ns/dispatch, {overhead / EVENTS_PER_DISPATCH * 1e9:8.1f} ns/event')
+
+
+def main(number: int = 20000) -> None:
+    bench_observe(number * 10)
+    bench_dispatch(number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Startup rehydration time for 50k persistent menus.
+
+Run from a checkout with ``python benchmarks/bench_persistence.py``.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from discord_components.component import Button, ComponentMessage
+from discord_components.persistence import MemoryStore, PersistentRecord, PersistentRegistry, SQLiteStore
+from discord_components.router import InteractionRouter
+
+
+class FakeBot:
+    def listen(self, name):
+        def decorator(func):
+            return func
+        return decorator
+
+
+async def approve(ctx):
+    pass
+
+
+async def deny(ctx):
+    pass
+
+
+def records(count: int):
+    template = ComponentMessage(components=[[
+        Button(label='Approve', custom_id='approve'),
+        Button(label='Deny', custom_id='deny')
+    ]]).to_dict()['components']
+    
+    for i in range(count):
+        components = [{
+            'type': 1,
+            'components': [
+                dict(template[0]['components'][0], custom_id=f'ticket:{i}:approve'),
+                dict(template[0]['components'][1], custom_id=f'ticket:{i}:deny')
+            ]
+        }]
+        yield PersistentRecord(
+            f'ticket:{i}',
+            components,
+            {f'ticket:{i}:approve': 'approve', f'ticket:{i}:deny': 'deny'},
+            message_id=10**17 + i
+        )
+
+
+def bench(name: str, store, count: int) -> None:
+    start = time.perf_counter()
+    store.save_many(records(count))
+    saved = time.perf_counter() - start
+    
+    registry = PersistentRegistry(FakeBot(), store, router=InteractionRouter())
+    registry.add_handler('approve', approve)
+    registry.add_handler('deny', deny)
+    
+    start = time.perf_counter()
+    routes = registry.rehydrate()
+    elapsed = time.perf_counter() - start
+    print(f'{name:>7}: save {saved * 1e3:8.1f} ms   rehydrate {routes} routes in {elapsed * 1e3:7.1f} ms')
+
+
+def main(count: int = 50_000) -> None:
+    bench('memory', MemoryStore(), count)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteStore(os.path.join(directory, 'components.db'))
+        bench('sqlite', store, count)
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
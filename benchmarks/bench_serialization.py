@@ -0,0 +1,64 @@
+"""Cold vs warm ``ComponentMessage.to_dict`` on a full 5x5 layout.
+
+``warm`` is the public ``to_dict``, which copies the cached payload and
+serializes the embeds; ``cached`` is the internal ``_payload`` that sends
+and views read, without the copy.
+
+Run from a checkout with ``python benchmarks/bench_serialization.py``.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import discord
+
+from discord_components.component import ActionRow, Button, ComponentMessage
+
+
+def build_message() -> ComponentMessage:
+    embed = discord.Embed(title='Dashboard', description='Live status')
+    for i in range(10):
+        embed.add_field(name=f'Metric {i}', value=str(i * 42))
+    
+    rows = [
+        ActionRow(*[
+            Button(label=f'Button {r}-{c}', custom_id=f'dash:{r}:{c}', emoji='\N{BLACK SQUARE BUTTON}')
+            for c in range(5)
+        ])
+        for r in range(5)
+    ]
+    return ComponentMessage(content='Dashboard', embeds=[embed], components=rows)
+
+
+def drop_caches(message: ComponentMessage) -> None:
+    for row in message.components:
+        for component in row.components:
+            object.__setattr__(component, '_cache', None)
+        object.__setattr__(row, '_cache', None)
+    object.__setattr__(message, '_cache', None)
+
+
+def main(number: int = 20000) -> None:
+    message = build_message()
+    
+    def cold():
+        drop_caches(message)
+        message.to_dict()
+    
+    def warm():
+        message.to_dict()
+    
+    def cached():
+        message._payload()
+    
+    message.to_dict()
+    for name, func in (('cold', cold), ('warm', warm), ('cached', cached)):
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        per_call = elapsed / number
+        print(f'{name:>6}: {per_call * 1e6:9.3f} us/call  {1 / per_call:12.0f} ops/s')
+
+
+if __name__ == '__main__':
+    main()
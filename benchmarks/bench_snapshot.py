@@ -0,0 +1,131 @@
+"""Binary snapshots against JSON for storing many menu layouts.
+
+Each record is a message with a row of buttons and a 10-option select, plus
+its message/channel ids and handler names. JSON is one ``to_dict`` payload
+per line, loaded back through ``ActionRow.from_dict``. Snapshots are written
+with a ``SnapshotWriter`` and read back streamed from the file and through a
+memory map.
+
+Run from a checkout with ``python benchmarks/bench_snapshot.py [count]``
+(default 100,000 records).
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from discord_components.component import ActionRow, Button, ComponentMessage, SelectMenu, SelectOption
+from discord_components.snapshot import SnapshotWriter, load_snapshot_file, load_snapshots
+
+
+def make_message(i: int) -> ComponentMessage:
+    return ComponentMessage(
+        content=f'Order #{i}',
+        components=[
+            [
+                Button(label='Approve', custom_id=f'approve:{i}'),
+                Button(label='Deny', custom_id=f'deny:{i}'),
+                Button(label='Details', custom_id=f'details:{i}', disabled=True)
+            ],
+            [SelectMenu(
+                custom_id=f'status:{i}',
+                placeholder='Set a status',
+                options=[SelectOption(label=f'Status {n}', value=str(n), description='A status') for n in range(10)]
+            )]
+        ]
+    )
+
+
+def handlers(i: int):
+    return {f'approve:{i}': 'orders.approve', f'deny:{i}': 'orders.deny', f'status:{i}': 'orders.status'}
+
+
+def dump_json(messages, path: str) -> None:
+    with open(path, 'w') as fp:
+        for i, message in enumerate(messages):
+            record = {
+                'message_id': 10**17 + i,
+                'channel_id': 10**17,
+                'layout': message.to_dict(),
+                'handlers': handlers(i)
+            }
+            fp.write(json.dumps(record, separators=(',', ':')))
+            fp.write('\n')
+
+
+def load_json(path: str) -> int:
+    count = 0
+    with open(path) as fp:
+        for line in fp:
+            record = json.loads(line)
+            layout = record['layout']
+            ComponentMessage(
+                content=layout.get('content'),
+                components=[ActionRow.from_dict(row) for row in layout.get('components', ())]
+            )
+            count += 1
+    return count
+
+
+def dump_binary(messages, path: str) -> None:
+    # Same ids and handler names as the JSON records.
+    with open(path, 'wb') as fp:
+        writer = SnapshotWriter(fp)
+        for i, message in enumerate(messages):
+            writer.write(message, handlers=handlers(i), message_id=10**17 + i, channel_id=10**17)
+
+
+def load_binary(path: str) -> int:
+    with open(path, 'rb') as fp:
+        return sum(1 for _ in load_snapshots(fp))
+
+
+def load_mapped(path: str) -> int:
+    return sum(1 for _ in load_snapshot_file(path))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    messages = [make_message(i) for i in range(count)]
+    for message in messages:
+        message.to_dict()
+    
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, 'layouts.jsonl')
+    binary_path = os.path.join(directory, 'layouts.snap')
+    try:
+        _, json_dump = timed(dump_json, messages, json_path)
+        _, binary_dump = timed(dump_binary, messages, binary_path)
+        json_size = os.path.getsize(json_path)
+        binary_size = os.path.getsize(binary_path)
+        
+        loaded, json_load = timed(load_json, json_path)
+        assert loaded == count
+        loaded, binary_load = timed(load_binary, binary_path)
+        assert loaded == count
+        loaded, mapped_load = timed(load_mapped, binary_path)
+        assert loaded == count
+    finally:
+        for path in (json_path, binary_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(directory)
+    
+    print(f'{count} records')
+    print(f'  size        json {json_size / count:7.0f} B/record   snapshot {binary_size / count:7.0f} B/record'
+          f'   ({json_size / binary_size:.1f}x smaller)')
+    print(f'  dump        json {count / json_dump:9.0f} rec/s   snapshot {count / binary_dump:9.0f} rec/s')
+    print(f'  load        json {count / json_load:9.0f} rec/s   snapshot {count / binary_load:9.0f} rec/s'
+          f'   mmap {count / mapped_load:9.0f} rec/s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
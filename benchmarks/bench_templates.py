@@ -0,0 +1,55 @@
+"""Template instantiation vs building the same layout by hand.
+
+Run from a checkout with ``python benchmarks/bench_templates.py``.
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import discord
+
+from discord_components.component import Button, ComponentMessage, SelectMenu, SelectOption
+from discord_components.template import ComponentTemplate, Slot
+
+
+def by_hand(user_id: int, locked: bool) -> ComponentMessage:
+    message = ComponentMessage(content=f'Shop for <@{user_id}>')
+    for i in range(4):
+        message.add_component(Button(label=f'Item {i}', custom_id=f'shop:{user_id}:buy:{i}', disabled=locked), row=0)
+    message.add_component(Button(label='Close', custom_id=f'shop:{user_id}:close', style=discord.ButtonStyle.danger), row=0)
+    message.add_component(SelectMenu(custom_id=f'shop:{user_id}:category', options=[
+        SelectOption(label=f'Category {i}', value=str(i)) for i in range(25)
+    ]), row=1)
+    return message
+
+
+def compile_template() -> ComponentTemplate:
+    message = ComponentMessage(content='Shop for <@{user_id}>')
+    for i in range(4):
+        message.add_component(Button(label=f'Item {i}', custom_id=f'shop:{{user_id}}:buy:{i}', disabled=Slot('locked')), row=0)
+    message.add_component(Button(label='Close', custom_id='shop:{user_id}:close', style=discord.ButtonStyle.danger), row=0)
+    message.add_component(SelectMenu(custom_id='shop:{user_id}:category', options=[
+        SelectOption(label=f'Category {i}', value=str(i)) for i in range(25)
+    ]), row=1)
+    return ComponentTemplate(message)
+
+
+def main(number: int = 5000) -> None:
+    template = compile_template()
+    assert template.render(user_id=42, locked=True) == by_hand(42, True).to_dict()
+    
+    cases = (
+        ('by hand + to_dict', lambda: by_hand(42, True).to_dict()),
+        ('template.render', lambda: template.render(user_id=42, locked=True)),
+        ('template.instantiate', lambda: template.instantiate(user_id=42, locked=True).to_dict()),
+    )
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        per_call = elapsed / number
+        print(f'{name:>22}: {per_call * 1e6:9.2f} us/call  {1 / per_call:10.0f} ops/s')
+
+
+if __name__ == '__main__':
+    main()
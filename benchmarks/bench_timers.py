@@ -0,0 +1,129 @@
+"""Cost of tracking expiry for many live menus.
+
+Compares a shared TimerWheel with what ``ui.View`` does on its own: one task
+per view, sleeping until the timeout and re-checking the deadline after
+every interaction. Reports per-timer memory, the time to arm, reset and
+cancel timers, and how long one event-loop iteration takes while they are
+pending. Arming is timed under tracemalloc, so both sides read slower than
+they run.
+
+Run from a checkout with ``python benchmarks/bench_timers.py [count]``
+(default 50,000 timers).
+"""
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from discord_components.timers import TimerWheel
+
+TIMEOUT = 180.0
+
+
+class ViewTimer:
+    # The per-view timeout of discord.py's View, reduced to its scheduling.
+    def __init__(self):
+        self.expiry = time.monotonic() + TIMEOUT
+        self.task = asyncio.ensure_future(self.run())
+    
+    async def run(self):
+        while True:
+            now = time.monotonic()
+            if now >= self.expiry:
+                return
+            await asyncio.sleep(self.expiry - now)
+    
+    def reset(self):
+        self.expiry = time.monotonic() + TIMEOUT
+
+
+def report(name: str, count: int, arm: float, memory: int, reset: float, tick: float, cancel: float) -> None:
+    print(f'{name:<12} arm {arm / count * 1e6:6.2f} us  reset {reset / count * 1e6:6.2f} us  '
+          f'cancel {cancel / count * 1e6:6.2f} us  {memory / count:6.0f} B/timer  loop iteration {tick * 1e3:7.3f} ms')
+
+
+async def loop_iteration() -> float:
+    # Time for the loop to come back to us once, with every timer pending.
+    start = time.perf_counter()
+    await asyncio.sleep(0)
+    return time.perf_counter() - start
+
+
+async def bench_views(count: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    timers = [ViewTimer() for _ in range(count)]
+    await asyncio.sleep(0)
+    arm = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    for timer in timers:
+        timer.reset()
+    reset = time.perf_counter() - start
+    
+    tick = min([await loop_iteration() for _ in range(5)])
+    
+    start = time.perf_counter()
+    for timer in timers:
+        timer.task.cancel()
+    await asyncio.gather(*[timer.task for timer in timers], return_exceptions=True)
+    cancel = time.perf_counter() - start
+    report('view tasks', count, arm, memory, reset, tick, cancel)
+
+
+async def bench_wheel(count: int) -> None:
+    wheel = TimerWheel(timeout=TIMEOUT)
+    keys = [object() for _ in range(count)]
+    
+    tracemalloc.start()
+    start = time.perf_counter()
+    for key in keys:
+        wheel.schedule(key)
+    await asyncio.sleep(0)
+    arm = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    for key in keys:
+        wheel.reset(key)
+    reset = time.perf_counter() - start
+    
+    tick = min([await loop_iteration() for _ in range(5)])
+    
+    start = time.perf_counter()
+    for key in keys:
+        wheel.cancel(key)
+    cancel = time.perf_counter() - start
+    report('timer wheel', count, arm, memory, reset, tick, cancel)
+    await wheel.close()
+
+
+def bench_expiry(count: int) -> None:
+    # One sweep expiring everything, delivered as a single batch.
+    now = [0.0]
+    batches = []
+    wheel = TimerWheel(timeout=TIMEOUT, clock=lambda: now[0], on_expire=batches.append)
+    for i in range(count):
+        wheel.schedule(i)
+    now[0] = TIMEOUT + 1
+    start = time.perf_counter()
+    wheel.advance()
+    elapsed = time.perf_counter() - start
+    print(f'expiry: {count} timers in {len(batches)} batch(es), {elapsed * 1e3:.1f} ms ({elapsed / count * 1e6:.2f} us/timer)')
+
+
+def main(count: int = 50_000) -> None:
+    print(f'{count} timers, {TIMEOUT:.0f}s timeout')
+    asyncio.run(bench_views(count))
+    asyncio.run(bench_wheel(count))
+    bench_expiry(count)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,313 @@
+"""Offline load test of the component interaction path.
+
+Replays a stream of fake component interactions through the same two paths
+Discord's gateway events take: the bot's ``on_interaction`` event, where
+``component_handler`` routes live, and the view of every sent
+``ComponentMessage``, where its ``on_interaction`` listeners run. Nothing
+touches the network; responses go to ``FakeInteraction`` and, with
+``--rest-latency``, through a ``FakeTransport`` that sleeps like a REST call.
+
+The stream is synthetic (buttons and selects over ``--ids`` custom_ids with
+Zipf-skewed popularity) or recorded: a JSON lines file of interaction data
+(``custom_id``, ``component_type``, ``values``), optionally with an ``at``
+offset in seconds that is replayed as recorded unless ``--rate`` is given.
+
+Arrivals are open-loop: each interaction is dispatched at its scheduled time
+whether or not earlier ones finished, and latency is measured from that
+scheduled time to the end of its dispatch, so a backed-up loop shows up as
+latency instead of a lower send rate. Reports the achieved throughput,
+p50/p99/p99.9 dispatch latency, event-loop lag (how late a 10 ms ticker
+wakes up) and peak memory.
+    
+    python benchmarks/loadtest.py --rate 5000 --duration 10
+    python benchmarks/loadtest.py --replay spike.jsonl --rest-latency 0.05
+"""
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from discord_components.component import Button, ComponentMessage, SelectMenu, SelectOption, component_handler
+from discord_components.testing import FakeBot, FakeInteraction, FakeTransport
+
+BUTTON = 2
+SELECT = 3
+LAG_INTERVAL = 0.01
+# Components on each of the synthetic messages: four buttons and a select.
+MESSAGE_BUTTONS = 4
+
+
+def percentile(ordered, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def peak_rss() -> int:
+    # Bytes; ru_maxrss is in KiB on Linux and in bytes on macOS.
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Target:
+    # The handlers under test: routed handlers on the bot and listeners on
+    # ``messages`` sent ComponentMessages, all answering with one response.
+    def __init__(self, bot: FakeBot, messages: int, rest_latency: float):
+        self.bot = bot
+        self.transport = FakeTransport(limit=1 << 30, latency=rest_latency) if rest_latency else None
+        self.handled = 0
+        self.errors = 0
+        self.messages = []
+        # custom_id -> (view, item) for the message listeners, like the
+        # gateway's view store.
+        self.items = {}
+        
+        @component_handler(bot, prefix='item:')
+        async def item(ctx):
+            self.handled += 1
+            await ctx.defer()
+        
+        @component_handler(bot, pattern=r'pick:(\d+)')
+        async def pick(ctx):
+            self.handled += 1
+            ctx.match.group(1)
+            await ctx.update(content=f'Picked {", ".join(ctx.values)}')
+        
+        for m in range(messages):
+            self.messages.append(self._message(m))
+    
+    def _message(self, m: int) -> ComponentMessage:
+        message = ComponentMessage(content=f'Menu {m}', timeout=None)
+        for j in range(MESSAGE_BUTTONS):
+            message.add_component(Button(label=f'Action {j}', custom_id=f'menu:{m}:{j}'))
+        message.add_component(SelectMenu(
+            custom_id=f'menu:{m}:select',
+            options=[SelectOption(label=f'Option {n}', value=str(n)) for n in range(5)]
+        ))
+        
+        async def listener(interaction):
+            self.handled += 1
+            await interaction.response.defer()
+        
+        for row in message.components:
+            for component in row.components:
+                message.on_interaction(component.custom_id)(listener)
+        return message
+    
+    def start(self) -> None:
+        # Views need a running loop.
+        for message in self.messages:
+            view = message.to_view()
+            for item in view.children:
+                self.items[item.custom_id] = (view, item)
+    
+    def custom_ids(self):
+        # (custom_id, component_type, values) for every component under test.
+        ids = []
+        for message in self.messages:
+            for row in message.components:
+                for component in row.components:
+                    if isinstance(component, SelectMenu):
+                        ids.append((component.custom_id, SELECT, [component.options[0].value]))
+                    else:
+                        ids.append((component.custom_id, BUTTON, None))
+        return ids
+    
+    async def dispatch(self, data) -> None:
+        interaction = FakeInteraction(data, client=self.bot, transport=self.transport)
+        try:
+            await self.bot.emit('on_interaction', interaction)
+            entry = self.items.get(data['custom_id'])
+            if entry is not None:
+                view, item = entry
+                task = view._dispatch_item(item, interaction)
+                if task is not None:
+                    await task
+        except Exception:
+            self.errors += 1
+
+
+def synthetic(target: Target, count: int, ids: int, skew: float, select_ratio: float, seed: int):
+    # Interaction data for ``count`` events. Popularity follows a Zipf law
+    # with exponent ``skew`` over the routed custom_ids and the messages'
+    # components together, shuffled so the hot ids are not all one kind.
+    rng = random.Random(seed)
+    universe = []
+    for k in range(ids):
+        if rng.random() < select_ratio:
+            universe.append((f'pick:{k}', SELECT, [str(rng.randrange(25))]))
+        else:
+            universe.append((f'item:{k}', BUTTON, None))
+    universe.extend(target.custom_ids())
+    rng.shuffle(universe)
+    
+    weights = list(itertools.accumulate(1 / (rank ** skew) for rank in range(1, len(universe) + 1)))
+    stream = []
+    for custom_id, component_type, values in rng.choices(universe, cum_weights=weights, k=count):
+        data = {'component_type': component_type, 'custom_id': custom_id}
+        if values is not None:
+            data['values'] = values
+        stream.append((None, data))
+    return stream
+
+
+def recorded(path: str):
+    stream = []
+    with open(path) as fp:
+        for line in fp:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                stream.append((record.pop('at', None), record))
+    return stream
+
+
+def schedule(stream, rate):
+    # Arrival offsets in seconds: evenly spaced at ``rate`` per second, or
+    # the recorded ones when no rate is given.
+    if rate:
+        return [i / rate for i in range(len(stream))]
+    if any(at is None for at, _ in stream):
+        raise SystemExit('--rate is required unless every record has an "at" offset')
+    start = stream[0][0]
+    return [at - start for at, _ in stream]
+
+
+async def monitor_lag(lags, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(max(loop.time() - expected, 0.0))
+
+
+async def run(target: Target, stream, offsets):
+    target.start()
+    loop = asyncio.get_running_loop()
+    latencies = []
+    lags = []
+    pending = set()
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(monitor_lag(lags, stop))
+    
+    async def timed(data, due: float) -> None:
+        await target.dispatch(data)
+        latencies.append(loop.time() - due)
+    
+    start = loop.time()
+    index = 0
+    total = len(stream)
+    while index < total:
+        now = loop.time()
+        # Everything due by now goes out in this wakeup; at high rates one
+        # sleep per event would be slower than the rate itself.
+        while index < total and start + offsets[index] <= now:
+            task = loop.create_task(timed(stream[index][1], start + offsets[index]))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+            index += 1
+        if index < total:
+            await asyncio.sleep(max(start + offsets[index] - loop.time(), 0))
+    
+    sent = loop.time() - start
+    while pending:
+        await asyncio.gather(*list(pending))
+    elapsed = loop.time() - start
+    
+    stop.set()
+    await monitor
+    return latencies, lags, sent, elapsed
+
+
+def report(args, target: Target, latencies, lags, sent: float, elapsed: float, memory) -> dict:
+    latencies.sort()
+    lags.sort()
+    count = len(latencies)
+    result = {
+        'interactions': count,
+        'handled': target.handled,
+        'errors': target.errors,
+        'target_rate': args.rate,
+        'offered_rate': count / sent if sent else 0.0,
+        'throughput': count / elapsed if elapsed else 0.0,
+        'latency_p50_ms': percentile(latencies, 0.5) * 1e3,
+        'latency_p99_ms': percentile(latencies, 0.99) * 1e3,
+        'latency_p999_ms': percentile(latencies, 0.999) * 1e3,
+        'latency_max_ms': (latencies[-1] if latencies else 0.0) * 1e3,
+        'loop_lag_p99_ms': percentile(lags, 0.99) * 1e3,
+        'loop_lag_max_ms': (lags[-1] if lags else 0.0) * 1e3,
+        'peak_rss_bytes': peak_rss()
+    }
+    if memory is not None:
+        result['peak_traced_bytes'] = memory
+    
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return result
+    
+    print(f'{count} interactions in {elapsed:.2f}s ({target.handled} handler calls, {target.errors} errors)')
+    print(f'  throughput   {result["throughput"]:10.0f} /s   (offered {result["offered_rate"]:.0f} /s)')
+    print(f'  latency      p50 {result["latency_p50_ms"]:8.3f} ms   p99 {result["latency_p99_ms"]:8.3f} ms   '
+          f'p99.9 {result["latency_p999_ms"]:8.3f} ms   max {result["latency_max_ms"]:8.3f} ms')
+    print(f'  loop lag     p99 {result["loop_lag_p99_ms"]:8.3f} ms   max {result["loop_lag_max_ms"]:8.3f} ms')
+    print(f'  memory       peak RSS {result["peak_rss_bytes"] / 2**20:.1f} MiB', end='')
+    if memory is not None:
+        print(f'   peak traced {memory / 2**20:.1f} MiB')
+    else:
+        print()
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rate', type=float, default=None, help='interactions per second (default 2000 for synthetic streams)')
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds of synthetic traffic (default 5)')
+    parser.add_argument('--replay', default=None, help='JSON lines file of interaction data to replay')
+    parser.add_argument('--ids', type=int, default=1000, help='distinct routed custom_ids (default 1000)')
+    parser.add_argument('--skew', type=float, default=1.1, help='Zipf exponent of custom_id popularity (default 1.1)')
+    parser.add_argument('--select-ratio', type=float, default=0.3, help='fraction of routed custom_ids that are selects')
+    parser.add_argument('--messages', type=int, default=50, help='sent ComponentMessages with listeners (default 50)')
+    parser.add_argument('--rest-latency', type=float, default=0.0, help='seconds each fake REST call takes')
+    parser.add_argument('--trace-memory', action='store_true', help='also report the tracemalloc peak (slows the run)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args(argv)
+    
+    target = Target(FakeBot(), args.messages, args.rest_latency)
+    if args.replay:
+        stream = recorded(args.replay)
+        if not stream:
+            raise SystemExit(f'{args.replay} holds no interactions')
+    else:
+        if args.rate is None:
+            args.rate = 2000.0
+        stream = synthetic(target, int(args.rate * args.duration), args.ids, args.skew, args.select_ratio, args.seed)
+    offsets = schedule(stream, args.rate)
+    
+    gc.collect()
+    if args.trace_memory:
+        tracemalloc.start()
+    try:
+        latencies, lags, sent, elapsed = asyncio.run(run(target, stream, offsets))
+        memory = tracemalloc.get_traced_memory()[1] if args.trace_memory else None
+    finally:
+        if args.trace_memory:
+            tracemalloc.stop()
+    
+    report(args, target, latencies, lags, sent, elapsed, memory)
+    return 1 if target.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,324 @@
+"""Microbenchmark and regression suite for the component hot paths.
+
+Each case reports ops/sec, microseconds per call and the memory allocated
+per call (bytes and net blocks, via tracemalloc). Results can be saved as a
+JSON baseline and later runs compared against it; the run exits with status
+1 when any case is slower than the baseline by more than ``--threshold``.
+    
+    python benchmarks/suite.py --save                  # record a baseline
+    python benchmarks/suite.py                         # compare against it
+    python benchmarks/suite.py --filter dispatch -t 0.1
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import discord
+
+from discord_components.component import (
+    ActionRow,
+    Button,
+    ChannelSelect,
+    ComponentMessage,
+    MentionableSelect,
+    RoleSelect,
+    SelectMenu,
+    SelectOption,
+    TextInput,
+    UserSelect,
+    component_handler
+)
+from discord_components.testing import FakeBot, FakeChannel, button_interaction, select_interaction
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def full_layout() -> ComponentMessage:
+    rows = [
+        ActionRow(*[
+            Button(label=f'Button {r}-{c}', custom_id=f'grid:{r}:{c}', emoji='\N{BLACK SQUARE BUTTON}')
+            for c in range(5)
+        ])
+        for r in range(4)
+    ]
+    rows.append(ActionRow(SelectMenu(
+        custom_id='grid:select',
+        placeholder='Pick one',
+        options=[SelectOption(label=f'Option {i}', value=str(i), description=f'Item {i}') for i in range(25)]
+    )))
+    return ComponentMessage(content='Grid', embeds=[discord.Embed(title='Grid')], components=rows)
+
+
+def drop_caches(message: ComponentMessage) -> None:
+    for row in message.components:
+        for component in row.components:
+            for option in getattr(component, 'options', ()):
+                object.__setattr__(option, '_cache', None)
+            object.__setattr__(component, '_cache', None)
+        object.__setattr__(row, '_cache', None)
+    object.__setattr__(message, '_cache', None)
+
+
+def serialization_cases():
+    components = {
+        'button': Button(label='Approve', custom_id='approve', emoji='\N{WHITE HEAVY CHECK MARK}'),
+        'link_button': Button(style=discord.ButtonStyle.link, label='Docs', url='https://example.com'),
+        'select_option': SelectOption(label='Red', value='red', description='The colour red', default=True),
+        'select_menu': SelectMenu(
+            custom_id='colour',
+            options=[SelectOption(label=f'Colour {i}', value=str(i)) for i in range(25)]
+        ),
+        'channel_select': ChannelSelect(custom_id='channel', channel_types=[discord.ChannelType.text]),
+        'role_select': RoleSelect(custom_id='role'),
+        'user_select': UserSelect(custom_id='user', max_values=5),
+        'mentionable_select': MentionableSelect(custom_id='mention'),
+        'text_input': TextInput(label='Reason', custom_id='reason', placeholder='Why?'),
+        'action_row': ActionRow(*[Button(label=str(i), custom_id=f'row:{i}') for i in range(5)])
+    }
+    
+    for name, component in components.items():
+        cls = type(component)
+        data = component.to_dict()
+        
+        def to_dict(component=component):
+            object.__setattr__(component, '_cache', None)
+            component.to_dict()
+        
+        def from_dict(cls=cls, data=data):
+            cls.from_dict(data)
+        
+        yield f'{name}.to_dict', to_dict
+        yield f'{name}.from_dict', from_dict
+
+
+def message_cases():
+    message = full_layout()
+    message.to_dict()
+    
+    def to_dict_cold():
+        drop_caches(message)
+        message.to_dict()
+    
+    yield 'message.to_dict.cold', to_dict_cold
+    yield 'message.to_dict.warm', message.to_dict
+    
+    # Dropping the caches keeps the verified flags, so this is a full rebuild
+    # that skips the limit checks.
+    verified = full_layout()
+    verified.validate()
+    
+    def to_dict_verified():
+        drop_caches(verified)
+        verified.to_dict()
+    
+    yield 'message.to_dict.verified', to_dict_verified
+    
+    def to_view_cold():
+        message._view = None
+        message._view_items = []
+        message.to_view()
+    
+    def to_view_patched():
+        button.label = 'Toggled' if button.label != 'Toggled' else 'Button 0-0'
+        message.to_view()
+    
+    button = message.components[0].components[0]
+    yield 'message.to_view.cold', to_view_cold
+    yield 'message.to_view.patched', to_view_patched
+    
+    full = full_layout()
+    spare = Button(label='Spare', custom_id='grid:spare')
+    full.remove_component('grid:3:4')
+    
+    def add_remove():
+        full.add_component(spare, row=3)
+        full.remove_component('grid:spare')
+    
+    yield 'message.add_remove_component', add_remove
+
+
+def edit_cases(loop: asyncio.AbstractEventLoop):
+    # A polling update that changes nothing is dropped without a request;
+    # one that changes the content sends only the content.
+    channel = FakeChannel()
+    message = full_layout()
+    loop.run_until_complete(message.send(types.SimpleNamespace(channel=channel, send=channel.send)))
+    
+    def edit_noop():
+        loop.run_until_complete(message.edit())
+    
+    def edit_content():
+        message.content = 'Tick' if message.content != 'Tick' else 'Tock'
+        loop.run_until_complete(message.edit())
+        del message.message.edits[:]
+    
+    yield 'message.edit.noop', edit_noop
+    yield 'message.edit.content', edit_content
+
+
+def dispatch_cases(loop: asyncio.AbstractEventLoop):
+    bot = FakeBot()
+    
+    @component_handler(bot, 'approve')
+    async def approve(ctx):
+        await ctx.defer()
+    
+    @component_handler(bot, prefix='ticket:')
+    async def ticket(ctx):
+        await ctx.defer()
+    
+    @component_handler(bot, pattern=r'vote:(\d+)')
+    async def vote(ctx):
+        ctx.match.group(1)
+        await ctx.update(content='Voted')
+    
+    @component_handler(bot, 'colour')
+    async def colour(ctx):
+        ctx.values
+        await ctx.reply('Noted', ephemeral=True)
+    
+    interactions = {
+        'dispatch.exact': lambda: button_interaction('approve'),
+        'dispatch.prefix': lambda: button_interaction('ticket:1234:close'),
+        'dispatch.pattern': lambda: button_interaction('vote:42'),
+        'dispatch.select': lambda: select_interaction('colour', ['red', 'blue']),
+        'dispatch.unrouted': lambda: button_interaction('nobody:home')
+    }
+    
+    for name, factory in interactions.items():
+        def dispatch(factory=factory):
+            loop.run_until_complete(bot.emit('on_interaction', factory()))
+        yield name, dispatch
+
+
+def allocations(func, calls: int = 200):
+    # Peak bytes allocated while a single call runs (its working set) and
+    # the blocks still held after it returns, both averaged over ``calls``.
+    func()
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        for _ in range(calls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            peak_total += tracemalloc.get_traced_memory()[1] - before
+        retained = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename')) - blocks
+    finally:
+        tracemalloc.stop()
+    return peak_total / calls, retained / calls
+
+
+def measure(func, repeat: int, min_time: float):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(int(number * min_time / 0.2), 1)
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    alloc_bytes, alloc_blocks = allocations(func)
+    return {
+        'ops_per_sec': 1 / best,
+        'us_per_op': best * 1e6,
+        'alloc_bytes': round(alloc_bytes, 1),
+        'alloc_blocks': round(alloc_blocks, 2)
+    }
+
+
+def collect(loop: asyncio.AbstractEventLoop):
+    yield from serialization_cases()
+    yield from message_cases()
+    yield from edit_cases(loop)
+    yield from dispatch_cases(loop)
+
+
+def run(name_filter, repeat: int, min_time: float):
+    # ui.View needs a current event loop, and the dispatch cases drive one
+    # directly, so the whole suite runs with a loop installed but idle.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        for name, func in collect(loop):
+            if name_filter and name_filter not in name:
+                continue
+            yield name, measure(func, repeat, min_time)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def compare(results, baseline, threshold: float):
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = result['ops_per_sec'] / reference['ops_per_sec'] - 1
+        result['change'] = change
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON file')
+    parser.add_argument('--save', action='store_true', help='write this run as the new baseline')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2, help='allowed slowdown, as a fraction (default 0.2)')
+    parser.add_argument('-k', '--filter', default=None, help='only run cases whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timing repeat')
+    args = parser.parse_args(argv)
+    
+    baseline = {}
+    if not args.save and os.path.exists(args.baseline):
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)['cases']
+    
+    print(f'{"case":<36} {"ops/s":>12} {"us/op":>10} {"peak B/op":>10} {"kept blk/op":>12} {"vs base":>9}')
+    results = {}
+    for name, result in run(args.filter, args.repeat, args.min_time):
+        results[name] = result
+        reference = baseline.get(name)
+        change = ''
+        if reference is not None:
+            change = f'{(result["ops_per_sec"] / reference["ops_per_sec"] - 1) * 100:+8.1f}%'
+        print(
+            f'{name:<36} {result["ops_per_sec"]:12.0f} {result["us_per_op"]:10.3f} '
+            f'{result["alloc_bytes"]:10.0f} {result["alloc_blocks"]:12.2f} {change:>9}'
+        )
+    
+    if args.save:
+        with open(args.baseline, 'w') as fp:
+            json.dump({
+                'python': platform.python_version(),
+                'discord.py': discord.__version__,
+                'cases': results
+            }, fp, indent=2, sort_keys=True)
+        print(f'\nSaved baseline for {len(results)} cases to {args.baseline}')
+        return 0
+    
+    if not baseline:
+        print('\nNo baseline to compare against; run with --save to record one.')
+        return 0
+    
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f'\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}:')
+        for name in regressions:
+            print(f'  {name}: {results[name]["change"]:+.1%}')
+        return 1
+    
+    print(f'\nNo regressions beyond {args.threshold:.0%}.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
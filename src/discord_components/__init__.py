@@ -1,17 +1,116 @@
-from .component import (
-    ComponentMessage,
-    Button,
-    SelectMenu,
-    SelectOption,
-    ComponentContext,
-    component_handler
-)
+from typing import TYPE_CHECKING
+import importlib
+
+# Names are imported from their submodule on first access (PEP 562), so
+# ``from discord_components import Button`` loads the payload models only,
+# without discord or discord.ui.
+_exports = {
+    'ComponentMessage': 'message',
+    'Button': 'models',
+    'SelectMenu': 'models',
+    'SelectOption': 'models',
+    'ComponentContext': 'context',
+    'component_handler': 'handler',
+    'register_component_type': 'models',
+    'LayoutError': 'models',
+    'InteractionRouter': 'router',
+    'BroadcastResult': 'broadcast',
+    'CustomIdCodec': 'codec',
+    'EditCoalescer': 'coalesce',
+    'Histogram': 'metrics',
+    'Metrics': 'metrics',
+    'get_metrics': 'metrics',
+    'OutboundScheduler': 'outbound',
+    'Priority': 'outbound',
+    'QueueFull': 'outbound',
+    'HandlerPool': 'pool',
+    'get_router': 'router',
+    'ComponentTemplate': 'template',
+    'Slot': 'template',
+    'PaginatedSelect': 'paginate',
+    'OptionCatalog': 'catalog',
+    'SessionStore': 'session',
+    'disable_components': 'session',
+    'TimerWheel': 'timers',
+    'disable_expired': 'timers',
+    'Snapshot': 'snapshot',
+    'SnapshotWriter': 'snapshot',
+    'dump_snapshots': 'snapshot',
+    'load_snapshots': 'snapshot',
+    'load_snapshot_file': 'snapshot',
+    'PersistentRegistry': 'persistence',
+    'PersistentStore': 'persistence',
+    'MemoryStore': 'persistence',
+    'SQLiteStore': 'persistence'
+}
+
+if TYPE_CHECKING:
+    from .models import Button, SelectMenu, SelectOption, register_component_type, LayoutError
+    from .message import ComponentMessage
+    from .context import ComponentContext
+    from .handler import component_handler
+    from .broadcast import BroadcastResult
+    from .codec import CustomIdCodec
+    from .coalesce import EditCoalescer
+    from .metrics import Histogram, Metrics, get_metrics
+    from .outbound import OutboundScheduler, Priority, QueueFull
+    from .pool import HandlerPool
+    from .router import InteractionRouter, get_router
+    from .template import ComponentTemplate, Slot
+    from .paginate import PaginatedSelect
+    from .catalog import OptionCatalog
+    from .session import SessionStore, disable_components
+    from .timers import TimerWheel, disable_expired
+    from .snapshot import Snapshot, SnapshotWriter, dump_snapshots, load_snapshots, load_snapshot_file
+    from .persistence import PersistentRegistry, PersistentStore, MemoryStore, SQLiteStore
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
 
 __all__ = [
     'ComponentMessage',
-    'Button', 
+    'Button',
     'SelectMenu',
     'SelectOption',
     'ComponentContext',
-    'component_handler'
-]
\ No newline at end of file
+    'component_handler',
+    'register_component_type',
+    'LayoutError',
+    'InteractionRouter',
+    'BroadcastResult',
+    'CustomIdCodec',
+    'EditCoalescer',
+    'Histogram',
+    'Metrics',
+    'get_metrics',
+    'OutboundScheduler',
+    'Priority',
+    'QueueFull',
+    'HandlerPool',
+    'get_router',
+    'ComponentTemplate',
+    'Slot',
+    'PaginatedSelect',
+    'OptionCatalog',
+    'SessionStore',
+    'disable_components',
+    'TimerWheel',
+    'disable_expired',
+    'Snapshot',
+    'SnapshotWriter',
+    'dump_snapshots',
+    'load_snapshots',
+    'load_snapshot_file',
+    'PersistentRegistry',
+    'PersistentStore',
+    'MemoryStore',
+    'SQLiteStore'
+]
@@ -0,0 +1,65 @@
+import discord
+from typing import Iterable, Iterator, List, Callable, Any, Awaitable, Tuple
+from array import array
+import asyncio
+
+__all__ = (
+    'BroadcastResult',
+)
+
+class BroadcastResult:
+    # Outcome of a fan-out send or edit. Delivered messages are kept as two
+    # parallel unsigned 64-bit arrays of channel and message ids rather than
+    # Message objects, so tracking thousands of deliveries stays cheap.
+    __slots__ = ('channel_ids', 'message_ids', 'failures')
+    
+    def __init__(self):
+        self.channel_ids = array('Q')
+        self.message_ids = array('Q')
+        self.failures: List[Tuple[Any, Exception]] = []
+    
+    def __len__(self) -> int:
+        return len(self.message_ids)
+    
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.channel_ids, self.message_ids)
+    
+    def __repr__(self) -> str:
+        return f'<BroadcastResult delivered={len(self)} failed={len(self.failures)}>'
+    
+    def add(self, channel_id: int, message_id: int) -> None:
+        self.channel_ids.append(channel_id)
+        self.message_ids.append(message_id)
+    
+    def partial_messages(self, client: discord.Client) -> Iterator[discord.PartialMessage]:
+        for channel_id, message_id in self:
+            yield client.get_partial_messageable(channel_id).get_partial_message(message_id)
+
+async def fan_out(
+    targets: Iterable[Any],
+    func: Callable[[Any], Awaitable[Any]],
+    *,
+    concurrency: int
+) -> BroadcastResult:
+    # Runs ``func`` for every target with at most ``concurrency`` calls in
+    # flight. Failures are recorded per target and never stop the batch.
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+    
+    result = BroadcastResult()
+    iterator = iter(targets)
+    
+    async def worker():
+        for target in iterator:
+            try:
+                message = await func(target)
+                # Both ids are read (and range-checked) before either is
+                # stored, so a bad result only fails its own target.
+                channel_id, message_id = array('Q', (message.channel.id, message.id))
+            except Exception as error:
+                result.failures.append((target, error))
+            else:
+                result.add(channel_id, message_id)
+    
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return result
@@ -0,0 +1,272 @@
+from typing import Optional, Union, List, Dict, Iterable, Iterator, Tuple
+from array import array
+from bisect import bisect_left, insort
+import re
+import unicodedata
+
+from .models import SelectMenu, SelectOption
+
+__all__ = (
+    'OptionCatalog',
+)
+
+MAX_OPTIONS = 25
+
+_word = re.compile(r'\w+')
+# The combining diacritical mark blocks; stripping them with one regex after
+# NFKD is much faster than testing every character with unicodedata.
+_combining = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]+')
+
+def _has(ids: Union[int, array], option_id: int) -> bool:
+    if type(ids) is int:
+        return ids == option_id
+    index = bisect_left(ids, option_id)
+    return index < len(ids) and ids[index] == option_id
+
+def _copy_option(option: SelectOption) -> SelectOption:
+    # An unlinked copy that starts with the original's cached payload, so the
+    # copy costs no serialization.
+    copy = SelectOption.__new__(SelectOption)
+    for name in SelectOption.__slots__:
+        object.__setattr__(copy, name, getattr(option, name))
+    object.__setattr__(copy, '_cache', option._cache)
+    object.__setattr__(copy, '_verified', option._verified)
+    return copy
+
+class OptionCatalog:
+    # A searchable set of SelectOptions, unique by value.
+    #
+    # The words of each option's ``fields`` are folded (case and/or
+    # diacritics) and indexed in two structures: a token index mapping every
+    # word to its option ids (a sorted array, or the bare id of a word only
+    # one option has), and a sorted list of the distinct words, which acts as
+    # a flattened prefix trie: all words starting with a prefix form one
+    # contiguous slice found with two bisections. The words each option was
+    # indexed under are kept, so removing it still works after the option
+    # itself was edited.
+    #
+    # ``search`` matches every query word as a prefix of some word of the
+    # option. It walks the options under the most selective query word
+    # (exact match first, then its completions in order), filters them by the
+    # other query words and stops as soon as ``limit`` options were found, so
+    # common prefixes stay cheap on large catalogs.
+    def __init__(
+        self,
+        options: Iterable[SelectOption] = (),
+        *,
+        fields: Tuple[str, ...] = ('label', 'value', 'description'),
+        fold_case: bool = True,
+        fold_diacritics: bool = True
+    ):
+        self.fields = fields
+        self.fold_case = fold_case
+        self.fold_diacritics = fold_diacritics
+        self._options: List[Optional[SelectOption]] = []
+        # Per option id, its words joined by spaces (words never contain one);
+        # a single string is far smaller than a tuple of them.
+        self._words: List[Optional[str]] = []
+        self._ids: Dict[str, int] = {}
+        self._postings: Dict[str, Union[int, array]] = {}
+        self._tokens: List[str] = []
+        self.extend(options)
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __contains__(self, value: str) -> bool:
+        return value in self._ids
+    
+    def __iter__(self) -> Iterator[SelectOption]:
+        return (option for option in self._options if option is not None)
+    
+    def get(self, value: str) -> Optional[SelectOption]:
+        option_id = self._ids.get(value)
+        return self._options[option_id] if option_id is not None else None
+    
+    def fold(self, text: str) -> str:
+        if self.fold_case:
+            text = text.casefold()
+        if self.fold_diacritics and not text.isascii():
+            text = _combining.sub('', unicodedata.normalize('NFKD', text))
+        return text
+    
+    def tokenize(self, text: str) -> List[str]:
+        return _word.findall(self.fold(text))
+    
+    def _option_tokens(self, option: SelectOption) -> set:
+        text = ' '.join([value for value in map(option.__getattribute__, self.fields) if value])
+        return set(self.tokenize(text))
+    
+    def add(self, option: SelectOption) -> None:
+        # Replaces an option with the same value.
+        new_tokens = self._index(option)
+        for token in new_tokens:
+            insort(self._tokens, token)
+    
+    def extend(self, options: Iterable[SelectOption]) -> None:
+        # Bulk add: new words are merged into the sorted word list with one
+        # sort instead of an insort per word. Replacing an option removes its
+        # words from that list (and may compact it), so the pending words are
+        # merged first.
+        new_tokens = []
+        for option in options:
+            if new_tokens and option.value in self._ids:
+                self._merge_tokens(new_tokens)
+                new_tokens = []
+            new_tokens.extend(self._index(option))
+        
+        if new_tokens:
+            self._merge_tokens(new_tokens)
+    
+    def _merge_tokens(self, tokens: List[str]) -> None:
+        self._tokens.extend(tokens)
+        self._tokens.sort()
+    
+    def _index(self, option: SelectOption) -> List[str]:
+        # Adds ``option`` to the token index and returns the words that are
+        # new to it. A word of a single option maps to that option's id
+        # directly; an array is only allocated once a second option shares
+        # it, which saves most of the memory on unique words like SKUs.
+        if option.value in self._ids:
+            self.remove(option.value)
+        
+        option_id = len(self._options)
+        words = self._option_tokens(option)
+        self._options.append(option)
+        self._words.append(' '.join(words))
+        self._ids[option.value] = option_id
+        
+        postings = self._postings
+        new_tokens = []
+        for token in words:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = option_id
+                new_tokens.append(token)
+            elif type(ids) is int:
+                postings[token] = array('I', (ids, option_id))
+            else:
+                # Ids only ever grow, so appending keeps the array sorted.
+                ids.append(option_id)
+        return new_tokens
+    
+    def remove(self, value: str) -> bool:
+        option_id = self._ids.pop(value, None)
+        if option_id is None:
+            return False
+        
+        words = self._words[option_id].split()
+        self._options[option_id] = None
+        self._words[option_id] = None
+        postings = self._postings
+        for token in words:
+            ids = postings[token]
+            if type(ids) is not int:
+                del ids[bisect_left(ids, option_id)]
+                if len(ids) == 1:
+                    postings[token] = ids[0]
+                continue
+            
+            del postings[token]
+            del self._tokens[bisect_left(self._tokens, token)]
+        
+        if len(self._options) > 1024 and len(self._ids) < len(self._options) // 2:
+            self._compact()
+        return True
+    
+    def _compact(self) -> None:
+        # Renumbers the live options once half the id space is holes.
+        options = [option for option in self._options if option is not None]
+        self._options = []
+        self._words = []
+        self._ids = {}
+        self._postings = {}
+        self._tokens = []
+        self.extend(options)
+    
+    def _prefix_range(self, prefix: str) -> range:
+        tokens = self._tokens
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return range(bisect_left(tokens, prefix), bisect_left(tokens, upper))
+    
+    def _matches(self, words: range) -> Iterator[int]:
+        # Option ids under every word in ``words``, word by word; an id can
+        # repeat across words.
+        postings = self._postings
+        tokens = self._tokens
+        for index in words:
+            ids = postings[tokens[index]]
+            if type(ids) is int:
+                yield ids
+            else:
+                yield from ids
+    
+    def _size(self, words: range) -> int:
+        postings = self._postings
+        tokens = self._tokens
+        return sum(1 if type(ids) is int else len(ids) for ids in map(postings.__getitem__, tokens[words.start:words.stop]))
+    
+    def search(self, query: str, limit: int = MAX_OPTIONS) -> List[SelectOption]:
+        words = list(dict.fromkeys(self.tokenize(query)))
+        if not words:
+            results = []
+            for option in self._options:
+                if option is not None:
+                    results.append(option)
+                    if len(results) >= limit:
+                        break
+            return results
+        
+        ranges = [self._prefix_range(word) for word in words]
+        if not all(ranges):
+            return []
+        
+        # The query word with the fewest matching options drives the walk. The
+        # other words filter its candidates: a word with only a few completions
+        # by bisecting their id arrays, a word with many by a set of its ids,
+        # unless it is so common that re-tokenizing the candidates is cheaper.
+        postings = self._postings
+        tokens = self._tokens
+        narrow = []
+        filters = []
+        checks = []
+        if len(ranges) > 1:
+            sized = sorted((self._size(words), word, words) for word, words in zip(words, ranges))
+            (driver_size, _, driver), rest = sized[0], sized[1:]
+            for size, word, words in rest:
+                if len(words) <= 8:
+                    narrow.append([postings[token] for token in tokens[words.start:words.stop]])
+                elif size <= driver_size * 50:
+                    filters.append(set(self._matches(words)))
+                else:
+                    checks.append(word)
+        else:
+            driver = ranges[0]
+        
+        options = self._options
+        results = []
+        seen = set()
+        for option_id in self._matches(driver):
+            if option_id in seen:
+                continue
+            seen.add(option_id)
+            
+            if narrow and not all(any(_has(ids, option_id) for ids in word_ids) for word_ids in narrow):
+                continue
+            if filters and not all(option_id in ids for ids in filters):
+                continue
+            if checks:
+                option_tokens = self._words[option_id].split()
+                if not all(any(token.startswith(word) for token in option_tokens) for word in checks):
+                    continue
+            
+            results.append(options[option_id])
+            if len(results) >= limit:
+                break
+        return results
+    
+    def select_menu(self, query: str, *, custom_id: str, **kwargs) -> SelectMenu:
+        # A SelectMenu holding the top matches for ``query``. The options are
+        # copies: a menu links itself to its options, and sharing the
+        # catalog's would keep every menu ever built alive through them.
+        return SelectMenu(custom_id=custom_id, options=[_copy_option(option) for option in self.search(query)], **kwargs)
@@ -0,0 +1,118 @@
+from typing import Optional, Dict, Callable, Any, Awaitable, Set
+import asyncio
+
+__all__ = (
+    'EditCoalescer',
+)
+
+class EditCoalescer:
+    # Merges calls to ``submit`` that arrive within ``window`` seconds of each
+    # other into a single call of ``edit`` with the merged keyword arguments.
+    # Every caller in a batch awaits the same result. A batch is flushed at
+    # most ``max_latency`` seconds after its first call or as soon as it holds
+    # ``max_batch`` calls. Batches are flushed one at a time, in order.
+    __slots__ = (
+        '_edit',
+        'window',
+        'max_latency',
+        'max_batch',
+        '_future',
+        '_kwargs',
+        '_count',
+        '_deadline',
+        '_handle',
+        '_lock',
+        '_tasks'
+    )
+    
+    def __init__(
+        self,
+        edit: Callable[..., Awaitable[Any]],
+        *,
+        window: float = 0.25,
+        max_latency: float = 1.0,
+        max_batch: int = 20
+    ):
+        if window < 0 or max_latency < 0:
+            raise ValueError('window and max_latency must not be negative')
+        if max_batch < 1:
+            raise ValueError('max_batch must be at least 1')
+        
+        self._edit = edit
+        self.window = window
+        self.max_latency = max_latency
+        self.max_batch = max_batch
+        self._future: Optional[asyncio.Future] = None
+        self._kwargs: Dict[str, Any] = {}
+        self._count = 0
+        self._deadline = 0.0
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    @property
+    def pending(self) -> int:
+        return self._count
+    
+    async def submit(self, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        
+        if self._future is None:
+            self._future = loop.create_future()
+            self._deadline = loop.time() + self.max_latency
+        
+        future = self._future
+        self._kwargs.update(kwargs)
+        self._count += 1
+        
+        if self._count >= self.max_batch:
+            self._schedule(loop, 0)
+        else:
+            self._schedule(loop, min(self.window, self._deadline - loop.time()))
+        
+        return await asyncio.shield(future)
+    
+    async def flush(self) -> Any:
+        future = self._future
+        if future is None:
+            return None
+        
+        self._start_flush()
+        return await asyncio.shield(future)
+    
+    def _schedule(self, loop: asyncio.AbstractEventLoop, delay: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = loop.call_later(max(delay, 0), self._start_flush)
+    
+    def _start_flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        
+        future, kwargs = self._future, self._kwargs
+        self._future = None
+        self._kwargs = {}
+        self._count = 0
+        
+        if future is not None:
+            task = asyncio.ensure_future(self._flush(future, kwargs))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _flush(self, future: asyncio.Future, kwargs: Dict[str, Any]) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            try:
+                result = await self._edit(**kwargs)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
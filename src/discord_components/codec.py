@@ -0,0 +1,186 @@
+import discord
+from typing import Optional, List, Dict, Any, Tuple, Type
+from collections import namedtuple
+import binascii
+import enum
+import hashlib
+import hmac
+
+__all__ = (
+    'CustomIdCodec',
+    'get_codec'
+)
+
+MAX_CUSTOM_ID = 100
+
+_INT = 0
+_UINT = 1
+_BOOL = 2
+_STR = 3
+_ENUM_VALUE = 4
+_ENUM_INDEX = 5
+
+_codecs: Dict[str, 'CustomIdCodec'] = {}
+
+# base64url <-> standard alphabet; binascii with a translate is several times
+# faster than base64.urlsafe_b64encode/decode.
+_TO_URLSAFE = bytes.maketrans(b'+/', b'-_')
+_FROM_URLSAFE = bytes.maketrans(b'-_', b'+/')
+_PADDING = (b'', b'===', b'==', b'=')
+
+def get_codec(custom_id: str) -> Optional['CustomIdCodec']:
+    # The codec whose route produced ``custom_id``, if any.
+    route, sep, _ = custom_id.rpartition(':')
+    return _codecs.get(route) if sep else None
+
+def _field_kind(name: str, field_type: Any) -> Tuple[int, Any]:
+    if field_type is discord.abc.Snowflake:
+        return _UINT, None
+    if field_type is bool:
+        return _BOOL, None
+    if field_type is int:
+        return _INT, None
+    if field_type is str:
+        return _STR, None
+    if isinstance(field_type, type) and issubclass(field_type, (enum.Enum, discord.Enum)):
+        members = list(field_type)
+        if all(isinstance(member.value, int) for member in members):
+            return _ENUM_VALUE, {member.value: member for member in members}
+        return _ENUM_INDEX, members
+    raise TypeError(f'Unsupported type for field {name!r}: {field_type!r}')
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+class CustomIdCodec:
+    # Packs typed fields into a custom_id of the form ``<route>:<payload>``
+    # so handlers can read per-component state without a storage lookup.
+    #
+    # ``fields`` maps names to types: int (zig-zag varint),
+    # discord.abc.Snowflake (unsigned varint; ints or objects with an ``id``),
+    # bool, str (length-prefixed UTF-8) or an Enum (its int value, or its
+    # position for non-int values). The payload is the varints in field order,
+    # base64url encoded without padding. With ``secret`` a truncated
+    # HMAC-SHA256 of route and payload is appended, and decoding rejects
+    # custom_ids that were not produced with the same secret.
+    __slots__ = ('route', 'prefix', 'fields', 'state_type', '_kinds', '_secret', '_mac_size')
+    
+    def __init__(self, route: str, fields: Dict[str, Any], *, secret: Optional[bytes] = None, mac_size: int = 6):
+        if ':' in route:
+            raise ValueError('route must not contain ":"')
+        if secret is not None and not 4 <= mac_size <= 32:
+            raise ValueError('mac_size must be between 4 and 32')
+        
+        self.route = route
+        self.prefix = route + ':'
+        self.fields = dict(fields)
+        self.state_type: Type[tuple] = namedtuple('State', list(self.fields))
+        self._kinds: List[Tuple[int, Any]] = [_field_kind(name, value) for name, value in self.fields.items()]
+        self._secret = secret
+        self._mac_size = mac_size
+        
+        current = _codecs.get(route)
+        if current is not None:
+            if current.fields != self.fields:
+                raise ValueError(f'A codec with different fields is already registered for route {route!r}')
+            if current._secret != secret or current._mac_size != mac_size:
+                raise ValueError(f'A codec with a different secret or mac_size is already registered for route {route!r}')
+        _codecs[route] = self
+    
+    def __repr__(self) -> str:
+        return f'<CustomIdCodec route={self.route!r} fields={list(self.fields)}>'
+    
+    def _mac(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, self.prefix.encode() + payload, hashlib.sha256).digest()[:self._mac_size]
+    
+    def encode(self, **values: Any) -> str:
+        if values.keys() != self.fields.keys():
+            missing = self.fields.keys() - values.keys()
+            extra = values.keys() - self.fields.keys()
+            raise TypeError(f'Expected fields {list(self.fields)}, missing {sorted(missing)}, unexpected {sorted(extra)}')
+        
+        out = bytearray()
+        for name, (kind, arg) in zip(self.fields, self._kinds):
+            value = values[name]
+            if kind == _UINT:
+                value = getattr(value, 'id', value)
+                if value < 0:
+                    raise ValueError(f'Field {name!r} must not be negative')
+                _write_varint(out, value)
+            elif kind == _INT or kind == _ENUM_VALUE:
+                value = int(value.value if kind == _ENUM_VALUE else value)
+                _write_varint(out, (value << 1) if value >= 0 else (~value << 1) | 1)
+            elif kind == _BOOL:
+                out.append(1 if value else 0)
+            elif kind == _STR:
+                data = value.encode()
+                _write_varint(out, len(data))
+                out += data
+            else:
+                _write_varint(out, arg.index(value))
+        
+        if self._secret is not None:
+            out += self._mac(bytes(out))
+        
+        custom_id = self.prefix + binascii.b2a_base64(out, newline=False).translate(_TO_URLSAFE).rstrip(b'=').decode('ascii')
+        if len(custom_id) > MAX_CUSTOM_ID:
+            raise ValueError(f'Encoded custom_id is {len(custom_id)} characters, the limit is {MAX_CUSTOM_ID}')
+        return custom_id
+    
+    def decode(self, custom_id: str) -> tuple:
+        if not custom_id.startswith(self.prefix):
+            raise ValueError(f'custom_id {custom_id!r} does not belong to route {self.route!r}')
+        
+        payload = custom_id[len(self.prefix):]
+        try:
+            data = binascii.a2b_base64(payload.encode('ascii').translate(_FROM_URLSAFE) + _PADDING[len(payload) % 4])
+        except (binascii.Error, UnicodeEncodeError):
+            raise ValueError(f'Malformed custom_id payload {payload!r}') from None
+        
+        if self._secret is not None:
+            data, mac = data[:-self._mac_size], data[-self._mac_size:]
+            if not hmac.compare_digest(mac, self._mac(data)):
+                raise ValueError('custom_id signature does not match')
+        
+        values = []
+        pos = 0
+        try:
+            for kind, arg in self._kinds:
+                if kind == _BOOL:
+                    values.append(data[pos] != 0)
+                    pos += 1
+                    continue
+                
+                value = data[pos]
+                pos += 1
+                if value & 0x80:
+                    value &= 0x7F
+                    shift = 7
+                    while True:
+                        byte = data[pos]
+                        pos += 1
+                        value |= (byte & 0x7F) << shift
+                        if not byte & 0x80:
+                            break
+                        shift += 7
+                
+                if kind == _UINT:
+                    values.append(value)
+                elif kind == _INT:
+                    values.append((value >> 1) ^ -(value & 1))
+                elif kind == _STR:
+                    values.append(data[pos:pos + value].decode())
+                    pos += value
+                elif kind == _ENUM_VALUE:
+                    values.append(arg[(value >> 1) ^ -(value & 1)])
+                else:
+                    values.append(arg[value])
+        except (IndexError, KeyError, UnicodeDecodeError):
+            raise ValueError(f'Malformed custom_id payload {payload!r}') from None
+        
+        if pos != len(data):
+            raise ValueError(f'Malformed custom_id payload {payload!r}')
+        return self.state_type._make(values)
@@ -0,0 +1,168 @@
+import discord
+from typing import Optional, Union, Callable, Any, Coroutine, TypeVar, TYPE_CHECKING
+import asyncio
+import time
+
+from .codec import get_codec
+from .metrics import FIRST_RESPONSE, REST_DURATION, _metrics, since
+from .models import Component, _component_types
+
+if TYPE_CHECKING:
+    from discord import Message
+
+T = TypeVar('T')
+
+__all__ = (
+    'ComponentContext',
+)
+
+class ComponentContext:
+    # Wraps the raw interaction payload. ``custom_id``, ``component_type`` and
+    # ``values`` are read straight from it; the Component object is only
+    # decoded the first time ``component`` is accessed.
+    def __init__(self, interaction: discord.Interaction, component: Optional[Component] = None):
+        data = interaction.data or {}
+        self.interaction = interaction
+        self._component = component
+        self.custom_id = data.get('custom_id', getattr(component, 'custom_id', None))
+        self.component_type = data.get('component_type')
+        self.values = data.get('values', [])
+        self.match = None
+        self.route = None
+        self._acknowledged = False
+        self._defer_handle: Optional[asyncio.TimerHandle] = None
+        self._defer_task: Optional[asyncio.Task] = None
+        self._state = None
+    
+    @property
+    def component(self) -> Optional[Component]:
+        if self._component is None:
+            component_type = _component_types.get(self.component_type)
+            if component_type is not None:
+                self._component = component_type.from_interaction(self.interaction.data)
+        return self._component
+    
+    @property
+    def state(self) -> Optional[tuple]:
+        # Fields packed into the custom_id by a CustomIdCodec, decoded on first
+        # access; None for custom_ids no codec produced. Raises ValueError for a
+        # malformed or tampered custom_id.
+        if self._state is None and self.custom_id:
+            codec = get_codec(self.custom_id)
+            if codec is not None:
+                self._state = codec.decode(self.custom_id)
+        return self._state
+    
+    @property
+    def bot(self):
+        return self.interaction.client
+    
+    @property
+    def guild(self) -> Optional[discord.Guild]:
+        return self.interaction.guild
+    
+    @property
+    def channel(self):
+        return self.interaction.channel
+    
+    @property
+    def user(self) -> Union[discord.User, discord.Member]:
+        return self.interaction.user
+    
+    @property
+    def message(self) -> Optional['Message']:
+        return self.interaction.message
+    
+    async def _respond(self, operation: str, func: Callable[..., Coroutine[Any, Any, T]], *args, **kwargs) -> T:
+        # Times the REST call and, for the first response, how long after the
+        # interaction was created it was acknowledged.
+        metrics = _metrics
+        if not metrics.enabled:
+            result = await func(*args, **kwargs)
+            self._acknowledged = True
+            return result
+        
+        acknowledging = not self._acknowledged and not self.interaction.response.is_done()
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs)
+        finally:
+            metrics.observe(REST_DURATION, time.perf_counter() - start, self.route, self.component_type, operation)
+        
+        if acknowledging:
+            metrics.observe(FIRST_RESPONSE, since(self.interaction.id), self.route, self.component_type)
+        self._acknowledged = True
+        return result
+    
+    def auto_defer(self, delay: float, *, ephemeral: bool = False) -> None:
+        # Defers the interaction if nothing has responded ``delay`` seconds from
+        # now: as a silent message update, or with an ephemeral "thinking"
+        # response when ``ephemeral`` is set. reply/edit/update called after
+        # that go to the followup webhook or the original response instead.
+        self.cancel_auto_defer()
+        loop = asyncio.get_running_loop()
+        self._defer_handle = loop.call_later(delay, self._start_auto_defer, ephemeral)
+    
+    def cancel_auto_defer(self) -> None:
+        if self._defer_handle is not None:
+            self._defer_handle.cancel()
+            self._defer_handle = None
+    
+    def _start_auto_defer(self, ephemeral: bool) -> None:
+        self._defer_handle = None
+        if not self._acknowledged and not self.interaction.response.is_done():
+            self._defer_task = asyncio.ensure_future(self._auto_defer(ephemeral))
+    
+    async def _auto_defer(self, ephemeral: bool) -> None:
+        try:
+            await self._respond('auto_defer', self.interaction.response.defer, ephemeral=ephemeral, thinking=ephemeral)
+        except (discord.InteractionResponded, discord.HTTPException):
+            # The handler responded first, or the token already expired; the
+            # handler's own response call reports that.
+            pass
+    
+    async def _settle(self) -> None:
+        # Called before every response: stops the auto-defer timer and waits
+        # for an auto-defer that is already in flight.
+        if self._defer_handle is not None:
+            self._defer_handle.cancel()
+            self._defer_handle = None
+        
+        task = self._defer_task
+        if task is not None:
+            self._defer_task = None
+            await task
+    
+    async def defer(self, *, ephemeral: bool = False) -> None:
+        await self._settle()
+        if self.interaction.response.is_done():
+            return
+        await self._respond('defer', self.interaction.response.defer, ephemeral=ephemeral)
+    
+    async def reply(self, content: Optional[str] = None, **kwargs) -> None:
+        await self._settle()
+        if self.interaction.response.is_done():
+            await self._respond('reply', self.interaction.followup.send, content, **kwargs)
+        else:
+            await self._respond('reply', self.interaction.response.send_message, content, **kwargs)
+    
+    async def edit(self, content: Optional[str] = None, **kwargs) -> None:
+        await self._settle()
+        if self.interaction.response.is_done():
+            await self._respond('edit', self.interaction.edit_original_response, content=content, **kwargs)
+        else:
+            await self._respond('edit', self.interaction.response.edit_message, content=content, **kwargs)
+    
+    async def update(self, **kwargs) -> None:
+        # Without any fields there is nothing to change: the interaction is
+        # only acknowledged, if it was not already.
+        if not kwargs:
+            await self.defer()
+            return
+        
+        await self._settle()
+        if self.interaction.response.is_done():
+            await self._respond('update', self.interaction.edit_original_response, **kwargs)
+        else:
+            await self._respond('update', self.interaction.response.edit_message, **kwargs)
+
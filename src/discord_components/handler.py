@@ -0,0 +1,46 @@
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .codec import CustomIdCodec
+    from .pool import HandlerPool
+
+__all__ = (
+    'component_handler',
+)
+
+def component_handler(
+    bot,
+    custom_id: Optional[str] = None,
+    *,
+    prefix: Optional[str] = None,
+    pattern: Optional[str] = None,
+    codec: Optional['CustomIdCodec'] = None,
+    auto_defer: Optional[float] = None,
+    ephemeral: bool = False,
+    pool: Optional['HandlerPool'] = None
+):
+    # Handlers are registered on the bot's shared InteractionRouter. Without a
+    # route they receive every component interaction, as before. ``codec``
+    # routes every custom_id the codec produces here, with ``ctx.state``
+    # holding the decoded fields. With ``auto_defer`` the interaction is
+    # deferred if the handler has not responded that many seconds after
+    # dispatch; see ComponentContext.auto_defer. ``pool`` runs the bot's
+    # handlers on a HandlerPool; see get_router.
+    from .router import get_router
+    
+    router = get_router(bot, pool=pool)
+    if codec is not None:
+        if custom_id is not None or prefix is not None or pattern is not None:
+            raise TypeError('codec cannot be combined with custom_id, prefix or pattern')
+        prefix = codec.prefix
+    
+    def decorator(func):
+        if custom_id is None and prefix is None and pattern is None:
+            router.add_handler(func)
+        else:
+            router.route(custom_id, prefix=prefix, pattern=pattern)(func)
+        
+        if auto_defer is not None:
+            router.set_auto_defer(func, auto_defer, ephemeral=ephemeral)
+        return func
+    return decorator
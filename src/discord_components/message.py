@@ -0,0 +1,573 @@
+from typing import Optional, Union, Iterable, List, Dict, Callable, Any, Coroutine, TypeVar, TYPE_CHECKING
+import functools
+import json
+import time
+
+from .metrics import REST_DURATION, _metrics
+from .models import ActionRow, Component, _CachedPayload, _TrackedList, _length_error, _row_width
+
+if TYPE_CHECKING:
+    import discord
+    from discord import Interaction, Message, ui
+    from .broadcast import BroadcastResult
+    from .outbound import Priority
+
+T = TypeVar('T')
+
+__all__ = (
+    'ComponentMessage',
+)
+
+# Building a message and its payload does not import discord or asyncio;
+# discord.ui, the REST scheduler, broadcasting and coalescing are imported
+# by the methods that use them.
+
+def _payload_hash(payload: Any) -> int:
+    return hash(json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str))
+
+class _SentState:
+    # Hashes of what the last send or edit put on the message. A field of
+    # None is unknown (the caller passed it explicitly) and is always resent.
+    # ``rows`` keeps the cached row payloads that ``components`` was hashed
+    # from, so an unchanged layout is recognised without hashing it again.
+    __slots__ = ('content', 'embeds', 'rows', 'components', 'view')
+    
+    def __init__(self, content: Optional[int], embeds: Optional[int], rows: tuple, components: Optional[int], view: Any):
+        self.content = content
+        self.embeds = embeds
+        self.rows = rows
+        self.components = components
+        self.view = view
+
+class ComponentMessage(_CachedPayload):
+    __slots__ = (
+        'content',
+        'embeds',
+        '_components',
+        '_view',
+        '_message',
+        '_interaction',
+        '_timeout',
+        '_listeners',
+        '_view_items',
+        '_coalescer',
+        '_scheduler',
+        '_sessions',
+        '_timers',
+        '_sent',
+        '__weakref__'
+    )
+    
+    _tracked_fields = frozenset({'embeds'})
+    # Process-wide: edits requested, edits dropped because nothing changed,
+    # and fields left out of the edits that were made.
+    edit_stats = {'edits': 0, 'suppressed': 0, 'fields_skipped': 0}
+    
+    def __init__(
+        self,
+        *,
+        content: Optional[str] = None,
+        embeds: Optional[List['discord.Embed']] = None,
+        components: Optional[List[Union[ActionRow, List[Component]]]] = None,
+        **kwargs
+    ):
+        self.content = content
+        self.embeds = embeds or []
+        self._components = _TrackedList(self)
+        self._view = None
+        self._message = None
+        self._interaction = None
+        self._timeout = kwargs.get('timeout', 180.0)
+        self._listeners = {}
+        self._view_items = []
+        self._coalescer = None
+        self._scheduler = kwargs.get('scheduler')
+        self._sessions = kwargs.get('sessions')
+        self._timers = kwargs.get('timers')
+        self._sent = None
+        
+        if components:
+            for component in components:
+                if isinstance(component, ActionRow):
+                    self._components.append(component)
+                elif isinstance(component, list):
+                    self._components.append(ActionRow(*component))
+                else:
+                    raise TypeError(f'Expected ActionRow or list of Components, got {type(component)}')
+    
+    @property
+    def components(self) -> List[ActionRow]:
+        return self._components
+    
+    @property
+    def view(self) -> Optional['ui.View']:
+        return self._view
+    
+    @property
+    def message(self) -> Optional['Message']:
+        return self._message
+    
+    @property
+    def interaction(self) -> Optional['Interaction']:
+        return self._interaction
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {}
+        
+        if self.content is not None:
+            data['content'] = self.content
+        if self._components:
+            data['components'] = [row._payload() for row in self._components]
+        
+        return data
+    
+    def _payload(self) -> Dict[str, Any]:
+        # Embeds are not tracked (they can be edited in place), so they are
+        # serialized on every call instead of being cached.
+        data = super()._payload()
+        if self.embeds:
+            data = dict(data)
+            data['embeds'] = [embed.to_dict() for embed in self.embeds]
+        return data
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        if len(self._components) > 5:
+            errors.append(f'{path} cannot have more than 5 action rows')
+        if len(self.embeds) > 10:
+            errors.append(f'{path} cannot have more than 10 embeds')
+        if self.content is not None and len(self.content) > 2000:
+            errors.append(_length_error(path, 'content', 0, 2000))
+        
+        seen = set()
+        for row in self._components:
+            for component in row.components:
+                custom_id = getattr(component, 'custom_id', None)
+                if custom_id is None:
+                    continue
+                if custom_id in seen:
+                    errors.append(f'{path} has more than one component with custom_id {custom_id!r}')
+                seen.add(custom_id)
+    
+    def _children(self, location: str) -> Iterable[tuple]:
+        return ((f'components[{i}]', row) for i, row in enumerate(self._components))
+    
+    def release(self) -> None:
+        # Stops the view and drops the references to the sent message, the
+        # interaction and the listeners. Called by SessionStore on eviction
+        # and by TimerWheel on expiry.
+        if self._timers is not None:
+            self._timers.cancel(self)
+        if self._view is not None:
+            self._view.stop()
+        self._view = None
+        self._view_items = []
+        self._message = None
+        self._interaction = None
+        self._listeners = {}
+        self._sent = None
+    
+    def snapshot(self, *, handlers: Optional[Dict[str, str]] = None) -> bytes:
+        # A compact binary record of the layout, component state, sent message
+        # ids and listener names; see snapshot.encode_snapshot.
+        from .snapshot import encode_snapshot
+        return encode_snapshot(self, handlers=handlers)
+    
+    @classmethod
+    def from_snapshot(cls, data: bytes, *, handlers: Optional[Dict[str, Callable]] = None) -> 'ComponentMessage':
+        # Rebuilds a message from ``snapshot()``, attaching the listeners found
+        # by name in ``handlers``. Use snapshot.decode_snapshot for the ids.
+        from .snapshot import decode_snapshot
+        return decode_snapshot(data, handlers=handlers).message
+    
+    def invalidate(self) -> None:
+        # Drops the cached payload. Embeds are serialized on every call, so
+        # editing one in place needs no invalidation.
+        self._invalidate()
+    
+    def add_component(self, component: Union[Component, ActionRow], row: Optional[int] = None):
+        if isinstance(component, ActionRow):
+            if len(self._components) >= 5:
+                raise ValueError('Cannot have more than 5 action rows')
+            self._components.append(component)
+            return
+        
+        width = component._width
+        if row is not None:
+            if row < 0 or row >= 5:
+                raise ValueError('Row must be between 0 and 4')
+            
+            while len(self._components) <= row:
+                self._components.append(ActionRow())
+            
+            if len(self._components[row].components) >= 5:
+                raise ValueError('Cannot have more than 5 components in a row')
+            if _row_width(self._components[row]) + width > 5:
+                raise ValueError('Selects and text inputs need a row of their own')
+            
+            self._components[row].components.append(component)
+        else:
+            if not self._components or _row_width(self._components[-1]) + width > 5:
+                if len(self._components) >= 5:
+                    raise ValueError('Cannot have more than 5 action rows')
+                self._components.append(ActionRow(component))
+            else:
+                self._components[-1].components.append(component)
+    
+    def remove_component(self, custom_id: str) -> bool:
+        for row in self._components:
+            for i, component in enumerate(row.components):
+                if getattr(component, 'custom_id', None) == custom_id:
+                    row.components.pop(i)
+                    if not row.components:
+                        self._components.remove(row)
+                    return True
+        return False
+    
+    def clear_components(self):
+        self._components.clear()
+    
+    def to_view(self) -> 'ui.View':
+        # The view is kept between calls. Items are created for new components,
+        # patched in place when their component's payload changed, and reused
+        # untouched (callbacks included) otherwise. Items are only re-added when
+        # the layout itself changed. A view that has stopped is replaced.
+        from discord import ui
+        from .view import _TimedView, _view_item_kwargs, _view_item_type
+        
+        view = self._view
+        if view is None or view.is_finished():
+            view = _TimedView(self) if self._timers is not None else ui.View(timeout=self._timeout)
+            previous = {}
+        else:
+            previous = {id(record[0]): record for record in self._view_items}
+        
+        records = []
+        structure_changed = len(previous) != len(self._view_items) or not previous
+        
+        for row_idx, row in enumerate(self._components):
+            for component in row.components:
+                item_type = _view_item_type(type(component))
+                if item_type is None:
+                    continue
+                
+                item_cls, fields = item_type
+                payload = component._payload()
+                listener = self._listeners.get(component.custom_id)
+                record = previous.pop(id(component), None)
+                
+                if record is None or record[0] is not component:
+                    item = item_cls(row=row_idx, **_view_item_kwargs(component, fields))
+                    structure_changed = True
+                else:
+                    item = record[1]
+                    if record[2] is not payload:
+                        for name, value in _view_item_kwargs(component, fields).items():
+                            setattr(item, name, value)
+                    if record[3] != row_idx:
+                        item.row = row_idx
+                        structure_changed = True
+                
+                if listener is not None:
+                    if record is None or record[4] is not listener:
+                        item.callback = listener
+                elif record is not None and record[4] is not None:
+                    # The custom_id lost its listener; back to the item's
+                    # own callback.
+                    del item.callback
+                
+                records.append((component, item, payload, row_idx, listener))
+        
+        if previous:
+            structure_changed = True
+        if not structure_changed:
+            structure_changed = any(
+                old[1] is not new[1] for old, new in zip(self._view_items, records)
+            )
+        
+        if structure_changed:
+            view.clear_items()
+            for record in records:
+                view.add_item(record[1])
+        
+        self._view_items = records
+        self._view = view
+        return view
+    
+    def _new_view(self) -> 'ui.View':
+        # A view of the current components that is not kept on the message,
+        # for sends that each need their own (every broadcast copy is stored
+        # in discord.py's view store separately).
+        from discord import ui
+        from .view import _view_item_kwargs, _view_item_type
+        
+        view = ui.View(timeout=self._timeout)
+        for row_idx, row in enumerate(self._components):
+            for component in row.components:
+                item_type = _view_item_type(type(component))
+                if item_type is None:
+                    continue
+                
+                item_cls, fields = item_type
+                item = item_cls(row=row_idx, **_view_item_kwargs(component, fields))
+                listener = self._listeners.get(component.custom_id)
+                if listener is not None:
+                    item.callback = listener
+                view.add_item(item)
+        return view
+    
+    def _broadcast_view(self, kwargs: Dict[str, Any]) -> bool:
+        # Sets ``kwargs['view']`` up for a broadcast and returns whether every
+        # copy needs a view of its own. discord.py's view store keeps one
+        # message per view, so listeners need a view per copy. Without
+        # listeners nothing is dispatched, and a single stopped view (which
+        # discord.py does not store) carries the components for every copy.
+        if 'view' in kwargs:
+            return False
+        if self._listeners:
+            return True
+        view = kwargs['view'] = self._new_view()
+        view.stop()
+        return False
+    
+    def on_interaction(self, custom_id: str) -> Callable[[T], T]:
+        import inspect
+        
+        def decorator(coro: T) -> T:
+            if not inspect.iscoroutinefunction(coro):
+                raise TypeError('Callback must be a coroutine function')
+            
+            self._listeners[custom_id] = coro
+            return coro
+        return decorator
+    
+    async def _request(self, func: Callable[..., Coroutine[Any, Any, T]], bucket: Any, priority: 'Priority', **kwargs) -> T:
+        # Routes a REST call through the message's OutboundScheduler, if any.
+        # The recorded duration includes time spent queued in the scheduler.
+        metrics = _metrics
+        start = time.perf_counter() if metrics.enabled else None
+        try:
+            if self._scheduler is None:
+                return await func(**kwargs)
+            return await self._scheduler.run(functools.partial(func, **kwargs), bucket=bucket, priority=priority)
+        finally:
+            if start is not None:
+                operation = 'message.' + getattr(func, '__name__', 'request')
+                metrics.observe(REST_DURATION, time.perf_counter() - start, operation=operation)
+    
+    async def send(self, ctx: Union['discord.Interaction', 'discord.ext.commands.Context'], **kwargs) -> 'Message':
+        import discord
+        from .outbound import Priority
+        
+        if isinstance(ctx, discord.Interaction):
+            if ctx.response.is_done():
+                send_func = ctx.followup.send
+            else:
+                send_func = ctx.response.send_message
+            bucket = ('webhook', ctx.application_id, ctx.token)
+            priority = Priority.INTERACTION
+        else:
+            send_func = ctx.send
+            bucket = ('channel', ctx.channel.id)
+            priority = Priority.SEND
+        
+        view_given = 'view' in kwargs
+        if not view_given:
+            kwargs['view'] = self.to_view()
+        
+        message = await self._request(
+            send_func,
+            bucket,
+            priority,
+            content=self.content,
+            embeds=self.embeds,
+            **kwargs
+        )
+        
+        self._message = message
+        if isinstance(ctx, discord.Interaction):
+            self._interaction = ctx
+        self._sent = self._sent_state(None if view_given else kwargs['view'])
+        
+        if self._sessions is not None:
+            key = getattr(message, 'id', None)
+            if key is None and isinstance(ctx, discord.Interaction):
+                key = ctx.id
+            if key is not None:
+                self._sessions.put(key, self)
+        if self._timers is not None and self._timeout:
+            self._timers.schedule(self, self, self._timeout)
+        
+        return message
+    
+    async def broadcast(
+        self,
+        targets: Iterable['discord.abc.Messageable'],
+        *,
+        concurrency: int = 10,
+        **kwargs
+    ) -> 'BroadcastResult':
+        # Sends this message to every target. With listeners each copy gets
+        # its own view, otherwise one view serves them all (see
+        # _broadcast_view); a ``view`` passed in is used as is. The message's
+        # ``message``/``interaction`` are left untouched; the delivered ids
+        # are returned for edit_broadcast. Users and members are sent to
+        # through their DM channel, which is also their rate limit bucket.
+        import discord
+        from .broadcast import fan_out
+        from .outbound import Priority
+        
+        new_view = self._broadcast_view(kwargs)
+        kwargs['content'] = self.content
+        kwargs['embeds'] = list(self.embeds)
+        
+        async def send(target):
+            if isinstance(target, (discord.User, discord.Member)):
+                target = target.dm_channel or await target.create_dm()
+            options = dict(kwargs, view=self._new_view()) if new_view else kwargs
+            return await self._request(target.send, ('channel', getattr(target, 'id', None)), Priority.SEND, **options)
+        
+        return await fan_out(targets, send, concurrency=concurrency)
+    
+    async def edit_broadcast(
+        self,
+        client: 'discord.Client',
+        result: 'BroadcastResult',
+        *,
+        concurrency: int = 10,
+        **kwargs
+    ) -> 'BroadcastResult':
+        # Views are set up like broadcast's.
+        from .broadcast import fan_out
+        from .outbound import Priority
+        
+        new_view = self._broadcast_view(kwargs)
+        kwargs['content'] = self.content
+        kwargs['embeds'] = list(self.embeds)
+        
+        async def edit(message):
+            options = dict(kwargs, view=self._new_view()) if new_view else kwargs
+            return await self._request(message.edit, ('channel', message.channel.id), Priority.EDIT, **options)
+        
+        return await fan_out(result.partial_messages(client), edit, concurrency=concurrency)
+    
+    def enable_coalescing(self, window: float = 0.25, *, max_latency: float = 1.0, max_batch: int = 20):
+        # Edits made within ``window`` seconds of each other are merged into one
+        # API call carrying the latest state; see EditCoalescer.
+        from .coalesce import EditCoalescer
+        
+        self._coalescer = EditCoalescer(self._edit, window=window, max_latency=max_latency, max_batch=max_batch)
+    
+    def disable_coalescing(self):
+        self._coalescer = None
+    
+    async def flush_edits(self) -> Optional['Message']:
+        if self._coalescer is None:
+            return None
+        return await self._coalescer.flush()
+    
+    async def edit(self, **kwargs) -> Optional['Message']:
+        if not self._message and not self._interaction:
+            raise ValueError('No message or interaction to edit')
+        
+        if self._coalescer is not None:
+            return await self._coalescer.submit(**kwargs)
+        return await self._edit(**kwargs)
+    
+    def _sent_state(self, view: Optional['ui.View']) -> _SentState:
+        # ``view`` is the view built by to_view, or None when the caller
+        # supplied one, which leaves the components unknown.
+        rows = tuple([row._payload() for row in self._components])
+        sent = self._sent
+        if view is None:
+            components = None
+        elif (
+            sent is not None
+            and sent.components is not None
+            and len(rows) == len(sent.rows)
+            and all([a is b for a, b in zip(rows, sent.rows)])
+        ):
+            components = sent.components
+        else:
+            components = _payload_hash(rows)
+        embeds = _payload_hash([embed.to_dict() for embed in self.embeds]) if self.embeds else 0
+        return _SentState(hash(self.content), embeds, rows, components, view)
+    
+    async def _edit(self, **kwargs) -> Optional['Message']:
+        # Only fields that differ from the last send or edit are included, and
+        # an edit that would change nothing makes no request at all. Fields
+        # passed explicitly are always sent.
+        from .outbound import Priority
+        
+        if self._sessions is not None and self._message is not None:
+            self._sessions.touch(self._message.id)
+        
+        stats = self.edit_stats
+        stats['edits'] += 1
+        view = None if 'view' in kwargs else self.to_view()
+        state = self._sent_state(view)
+        sent = self._sent
+        
+        skipped = 0
+        if 'content' in kwargs:
+            state.content = None
+        elif sent is None or sent.content != state.content:
+            kwargs['content'] = self.content
+        else:
+            skipped += 1
+        
+        if 'embeds' in kwargs:
+            state.embeds = None
+        elif sent is None or sent.embeds != state.embeds:
+            kwargs['embeds'] = self.embeds
+        else:
+            skipped += 1
+        
+        if view is not None:
+            # A replaced view has to be sent even for the same layout, or its
+            # items would never be registered for dispatch.
+            if sent is None or sent.components != state.components or sent.view is not view:
+                kwargs['view'] = view
+            else:
+                skipped += 1
+        
+        if not kwargs:
+            if self._message or self._interaction.response.is_done():
+                stats['suppressed'] += 1
+                return self._message
+            # The interaction still needs an acknowledgement.
+            await self._request(
+                self._interaction.response.defer,
+                ('webhook', self._interaction.application_id, self._interaction.token),
+                Priority.INTERACTION
+            )
+            return self._message
+        stats['fields_skipped'] += skipped
+        
+        if self._message:
+            await self._request(
+                self._message.edit,
+                ('channel', self._message.channel.id),
+                Priority.EDIT,
+                **kwargs
+            )
+            self._sent = state
+            return self._message
+        elif self._interaction:
+            bucket = ('webhook', self._interaction.application_id, self._interaction.token)
+            if self._interaction.response.is_done():
+                await self._request(
+                    self._interaction.edit_original_response,
+                    bucket,
+                    Priority.EDIT,
+                    **kwargs
+                )
+            else:
+                await self._request(
+                    self._interaction.response.edit_message,
+                    bucket,
+                    Priority.INTERACTION,
+                    **kwargs
+                )
+            self._sent = state
+            return await self._interaction.original_response()
+
@@ -0,0 +1,201 @@
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from bisect import bisect_left
+import math
+import time
+
+__all__ = (
+    'Histogram',
+    'Metrics',
+    'get_metrics'
+)
+
+DISPATCH_LATENCY = 'dispatch_latency'
+HANDLER_DURATION = 'handler_duration'
+FIRST_RESPONSE = 'first_response'
+REST_DURATION = 'rest_duration'
+
+_DESCRIPTIONS = {
+    DISPATCH_LATENCY: 'Time from interaction creation to dispatch.',
+    HANDLER_DURATION: 'Time spent running a component handler.',
+    FIRST_RESPONSE: 'Time from interaction creation to its first acknowledgement.',
+    REST_DURATION: 'Duration of REST calls made for responses, sends and edits.'
+}
+
+# Seconds. 3.0 is Discord's acknowledgement deadline.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.0, 2.5, 3.0, 5.0, 10.0
+)
+
+_DISCORD_EPOCH = 1420070400000
+
+def created_at(snowflake: int) -> float:
+    # Unix time of a snowflake; the same as ``snowflake_time`` without
+    # building a datetime.
+    return ((snowflake >> 22) + _DISCORD_EPOCH) / 1000
+
+def since(snowflake: int) -> float:
+    return time.time() - created_at(snowflake)
+
+class Histogram:
+    # Fixed-bucket histogram. ``counts[i]`` holds the observations that fall
+    # in ``(bounds[i - 1], bounds[i]]``; the last slot is the +Inf bucket.
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+    
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def __repr__(self) -> str:
+        return f'<Histogram count={self.count} mean={self.mean:.6f}>'
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+    
+    def cumulative(self) -> List[Tuple[float, int]]:
+        total = 0
+        buckets = []
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+    
+    def quantile(self, q: float) -> float:
+        # Linear interpolation inside the bucket holding the q-th observation,
+        # as Prometheus' histogram_quantile does.
+        if not 0 <= q <= 1:
+            raise ValueError('q must be between 0 and 1')
+        if not self.count:
+            return math.nan
+        
+        rank = q * self.count
+        lower = 0.0
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.bounds[-1]
+    
+    def merge(self, other: 'Histogram') -> None:
+        if other.bounds != self.bounds:
+            raise ValueError('Cannot merge histograms with different buckets')
+        
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.sum += other.sum
+
+_Key = Tuple[str, Optional[str], Optional[int], Optional[str]]
+
+class Metrics:
+    # Histograms keyed by metric name, route, component type and operation.
+    # The router, ComponentContext and ComponentMessage record into the
+    # shared instance returned by get_metrics(); set ``enabled`` to False to
+    # turn recording off.
+    #
+    # Routes are the registered custom_id, prefix or pattern rather than the
+    # raw custom_id, and catch-all handlers are recorded under ``*``, so the
+    # number of series stays bounded by the number of routes.
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        namespace: str = 'discord_components',
+        enabled: bool = True
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self.enabled = enabled
+        self._histograms: Dict[_Key, Histogram] = {}
+    
+    def observe(
+        self,
+        name: str,
+        value: float,
+        route: Optional[str] = None,
+        component_type: Optional[int] = None,
+        operation: Optional[str] = None
+    ) -> None:
+        # Histogram.observe, inlined; this runs several times per interaction.
+        key = (name, route, component_type, operation)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(self.buckets)
+        histogram.counts[bisect_left(histogram.bounds, value)] += 1
+        histogram.count += 1
+        histogram.sum += value
+    
+    def get(
+        self,
+        name: str,
+        *,
+        route: Optional[str] = None,
+        component_type: Optional[int] = None,
+        operation: Optional[str] = None
+    ) -> Optional[Histogram]:
+        return self._histograms.get((name, route, component_type, operation))
+    
+    def total(self, name: str, **labels: Any) -> Histogram:
+        # All series of ``name`` whose labels match ``labels``, merged.
+        merged = Histogram(self.buckets)
+        for series_name, series_labels, histogram in self.collect(name):
+            if all(series_labels.get(key) == value for key, value in labels.items()):
+                merged.merge(histogram)
+        return merged
+    
+    def collect(self, name: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any], Histogram]]:
+        for (series_name, route, component_type, operation), histogram in list(self._histograms.items()):
+            if name is not None and series_name != name:
+                continue
+            labels = {}
+            if route is not None:
+                labels['route'] = route
+            if component_type is not None:
+                labels['component_type'] = component_type
+            if operation is not None:
+                labels['operation'] = operation
+            yield series_name, labels, histogram
+    
+    def reset(self) -> None:
+        self._histograms.clear()
+    
+    def to_prometheus(self) -> str:
+        # Prometheus text exposition format (version 0.0.4).
+        families: Dict[str, List[Tuple[Dict[str, Any], Histogram]]] = {}
+        for name, labels, histogram in self.collect():
+            families.setdefault(name, []).append((labels, histogram))
+        
+        lines = []
+        for name in sorted(families):
+            metric = f'{self.namespace}_{name}_seconds'
+            lines.append(f'# HELP {metric} {_DESCRIPTIONS.get(name, name)}')
+            lines.append(f'# TYPE {metric} histogram')
+            for labels, histogram in sorted(families[name], key=lambda item: sorted(map(str, item[0].items()))):
+                for bound, count in histogram.cumulative():
+                    le = '+Inf' if bound == math.inf else repr(float(bound))
+                    lines.append(f'{metric}_bucket{_format_labels(labels, le=le)} {count}')
+                lines.append(f'{metric}_sum{_format_labels(labels)} {histogram.sum!r}')
+                lines.append(f'{metric}_count{_format_labels(labels)} {histogram.count}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(labels: Dict[str, Any], **extra: str) -> str:
+    pairs = [f'{key}="{_escape(value)}"' for key, value in {**labels, **extra}.items()]
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+_metrics = Metrics()
+
+def get_metrics() -> Metrics:
+    return _metrics
@@ -0,0 +1,1052 @@
+from typing import Optional, Union, Iterable, List, Dict, Any, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import discord
+
+__all__ = (
+    'ActionRow',
+    'Button',
+    'SelectMenu',
+    'SelectOption',
+    'TextInput',
+    'ChannelSelect',
+    'RoleSelect',
+    'UserSelect',
+    'MentionableSelect',
+    'Component',
+    'UnknownComponent',
+    'register_component_type',
+    'get_component_type',
+    'component_from_dict',
+    'LayoutError'
+)
+
+# Nothing here imports discord at module level: importing discord loads the
+# whole client, discord.ui included. Styles and channel types are stored as
+# given (enum or int) and turned into discord.py enums on first read, and
+# custom emojis become PartialEmojis when decoded, so building and
+# serializing payloads never needs discord.
+
+def _enum(name: str, value: Any) -> Any:
+    import discord
+    return getattr(discord, name)(value)
+
+def _value(value: Any) -> int:
+    return value if type(value) is int else value.value
+
+def _emoji_from_dict(emoji: Dict[str, Any]) -> Union[str, 'discord.PartialEmoji']:
+    if 'id' not in emoji:
+        return emoji['name']
+    import discord
+    return discord.PartialEmoji(
+        name=emoji['name'],
+        id=emoji['id'],
+        animated=emoji.get('animated', False)
+    )
+
+def _copy_payload(node: Any) -> Any:
+    # A deep copy of JSON-like data; much faster than copy.deepcopy.
+    if type(node) is dict:
+        return {key: _copy_payload(value) for key, value in node.items()}
+    if type(node) is list:
+        return [_copy_payload(value) for value in node]
+    return node
+
+# ``_parents`` is None, a single parent, or a list when an item is shared;
+# most items have exactly one parent, so no container is allocated for them.
+def _link(item: Any, parent: Optional['_CachedPayload']) -> None:
+    if parent is not None and isinstance(item, _CachedPayload):
+        parents = item._parents
+        if parents is None:
+            item._parents = parent
+        elif type(parents) is list:
+            parents.append(parent)
+        else:
+            item._parents = [parents, parent]
+
+def _unlink(item: Any, parent: Optional['_CachedPayload']) -> None:
+    if parent is not None and isinstance(item, _CachedPayload):
+        parents = item._parents
+        if parents is parent:
+            item._parents = None
+        elif type(parents) is list:
+            for i, other in enumerate(parents):
+                if other is parent:
+                    del parents[i]
+                    break
+            if len(parents) == 1:
+                item._parents = parents[0]
+
+class _TrackedList(list):
+    # A list that links its items to ``owner`` and drops the owner's cached
+    # payload whenever it is mutated.
+    __slots__ = ('_owner',)
+    
+    def __init__(self, owner: Optional['_CachedPayload'] = None, iterable=()):
+        super().__init__(iterable)
+        self._owner = owner
+        for item in self:
+            _link(item, owner)
+    
+    def _changed(self) -> None:
+        if self._owner is not None:
+            self._owner._invalidate()
+    
+    def _release(self) -> None:
+        for item in self:
+            _unlink(item, self._owner)
+        self._owner = None
+    
+    def append(self, item):
+        super().append(item)
+        _link(item, self._owner)
+        self._changed()
+    
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        for item in items:
+            _link(item, self._owner)
+        self._changed()
+    
+    def insert(self, index, item):
+        super().insert(index, item)
+        _link(item, self._owner)
+        self._changed()
+    
+    def pop(self, index=-1):
+        item = super().pop(index)
+        _unlink(item, self._owner)
+        self._changed()
+        return item
+    
+    def remove(self, item):
+        super().remove(item)
+        _unlink(item, self._owner)
+        self._changed()
+    
+    def clear(self):
+        for item in self:
+            _unlink(item, self._owner)
+        super().clear()
+        self._changed()
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            old = self[index]
+        else:
+            old = [self[index]]
+        super().__setitem__(index, value)
+        for item in old:
+            _unlink(item, self._owner)
+        for item in (value if isinstance(index, slice) else [value]):
+            _link(item, self._owner)
+        self._changed()
+    
+    def __delitem__(self, index):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for item in old:
+            _unlink(item, self._owner)
+        self._changed()
+    
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+    
+    def __imul__(self, n):
+        items = list(self)
+        super().__imul__(n)
+        for _ in range(max(n - 1, 0)):
+            for item in items:
+                _link(item, self._owner)
+        if n <= 0:
+            for item in items:
+                _unlink(item, self._owner)
+        self._changed()
+        return self
+    
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+    
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+class LayoutError(ValueError):
+    # Raised for payloads that break Discord's limits; ``errors`` holds every
+    # violation found (only the first one outside of strict validation).
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        if len(errors) == 1:
+            super().__init__(errors[0])
+        else:
+            super().__init__(f'{len(errors)} layout errors:\n' + '\n'.join(f'  {error}' for error in errors))
+
+# The checks below run on every validation of an unverified node, so the
+# conditions are inlined and only the error messages go through a helper.
+def _length_error(path: str, name: str, minimum: int, maximum: int) -> str:
+    if minimum:
+        return f'{path} {name} must be between {minimum} and {maximum} characters'
+    return f'{path} {name} must be at most {maximum} characters'
+
+def _check_select(errors: List[str], path: str, select: 'Component') -> None:
+    custom_id = select.custom_id
+    if custom_id is None or not 0 < len(custom_id) <= 100:
+        errors.append(_length_error(path, 'custom_id', 1, 100))
+    if select.placeholder is not None and len(select.placeholder) > 150:
+        errors.append(_length_error(path, 'placeholder', 0, 150))
+    # Anything but an int is a placeholder (a template Slot) and is checked
+    # once it is filled in.
+    min_values = select.min_values
+    max_values = select.max_values
+    min_set = type(min_values) is int
+    max_set = type(max_values) is int
+    if min_set and not 0 <= min_values <= 25:
+        errors.append(f'{path} min_values must be between 0 and 25')
+    if max_set and not 1 <= max_values <= 25:
+        errors.append(f'{path} max_values must be between 1 and 25')
+    if min_set and max_set and min_values > max_values:
+        errors.append(f'{path} min_values cannot exceed max_values')
+
+class _CachedPayload:
+    # Caches the result of ``to_dict`` until a public attribute changes.
+    # Children (options, components, rows) hold references to their parents so
+    # a change anywhere in the tree drops every cached payload above it.
+    # Cached payloads are shared between calls and must not be mutated, so
+    # internal callers read them through ``_payload`` and ``to_dict`` returns
+    # a copy the caller owns.
+    #
+    # ``_check`` holds the checks every payload build makes (the ones
+    # serialization always made) and ``_check_limits`` the rest of Discord's
+    # limits, which only ``validate`` runs. ``validate`` checks a whole tree
+    # once and marks it verified; verified nodes skip both until they (or
+    # anything below them) change.
+    __slots__ = ('_cache', '_parents', '_verified')
+    
+    _tracked_fields: frozenset = frozenset()
+    
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        object.__setattr__(self, '_cache', None)
+        object.__setattr__(self, '_parents', None)
+        object.__setattr__(self, '_verified', False)
+        return self
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name[0] == '_':
+            object.__setattr__(self, name, value)
+            return
+        
+        if name in self._tracked_fields:
+            old = getattr(self, name, None)
+            if isinstance(old, _TrackedList):
+                old._release()
+            value = _TrackedList(self, value)
+        
+        object.__setattr__(self, name, value)
+        self._invalidate()
+    
+    def _invalidate(self) -> None:
+        # Parents are only cached or verified if their children are, so the
+        # walk up can stop at the first node that is neither.
+        if self._cache is None and not self._verified:
+            return
+        
+        object.__setattr__(self, '_cache', None)
+        object.__setattr__(self, '_verified', False)
+        parents = self._parents
+        if parents is None:
+            return
+        if type(parents) is list:
+            for parent in parents:
+                parent._invalidate()
+        else:
+            parents._invalidate()
+    
+    @property
+    def verified(self) -> bool:
+        return self._verified
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return _copy_payload(self._payload())
+    
+    def _payload(self) -> Dict[str, Any]:
+        data = self._cache
+        if data is None:
+            if not self._verified:
+                errors = []
+                self._check(errors, type(self).__name__)
+                if errors:
+                    raise LayoutError(errors)
+            data = self._to_dict()
+            object.__setattr__(self, '_cache', data)
+        return data
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        raise NotImplementedError
+    
+    def _check(self, errors: List[str], path: str) -> None:
+        # Appends this node's own violations to ``errors``.
+        pass
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        # Like _check, for the limits only ``validate`` checks.
+        pass
+    
+    def _children(self, location: str) -> Iterable[tuple]:
+        # (location, child) pairs of the nodes below this one.
+        return ()
+    
+    def validate(self, *, strict: bool = False) -> None:
+        # Checks this node and everything below it, raising a LayoutError on
+        # the first violation, or on all of them with ``strict``.
+        errors = []
+        self._validate(errors, '', strict)
+        if errors:
+            raise LayoutError(errors)
+    
+    def freeze(self, *, strict: bool = False):
+        # Validates the tree and builds its payload, so serializing it again
+        # is a cache hit until something changes.
+        self.validate(strict=strict)
+        self._payload()
+        return self
+    
+    def _validate(self, errors: List[str], location: str, strict: bool) -> None:
+        if self._verified:
+            return
+        
+        count = len(errors)
+        name = type(self).__name__
+        path = f'{name} at {location}' if location else name
+        self._check(errors, path)
+        self._check_limits(errors, path)
+        for child_location, child in self._children(location):
+            if errors and not strict:
+                return
+            child._validate(errors, child_location, strict)
+        
+        if len(errors) == count:
+            object.__setattr__(self, '_verified', True)
+
+_component_types: Dict[int, Type['Component']] = {}
+
+def register_component_type(type_code: int, cls: Optional[Type['Component']] = None):
+    def decorator(cls: Type['Component']) -> Type['Component']:
+        if not (isinstance(cls, type) and issubclass(cls, Component)):
+            raise TypeError(f'Expected a Component subclass, got {cls!r}')
+        
+        _component_types[type_code] = cls
+        return cls
+    
+    if cls is not None:
+        return decorator(cls)
+    return decorator
+
+def get_component_type(type_code: int) -> Type['Component']:
+    return _component_types.get(type_code, UnknownComponent)
+
+def component_from_dict(data: Dict[str, Any]) -> 'Component':
+    return _component_types.get(data['type'], UnknownComponent).from_dict(data)
+
+class Component(_CachedPayload):
+    __slots__ = ('custom_id', 'disabled')
+    
+    # Slots taken in an action row; selects and text inputs fill a whole row.
+    _width: int = 1
+    
+    def __init__(self, *, custom_id: Optional[str] = None, disabled: bool = False):
+        self.custom_id = custom_id
+        self.disabled = disabled
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Component':
+        raise NotImplementedError
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'Component':
+        return cls.from_dict(data)
+
+class UnknownComponent(Component):
+    __slots__ = ('data',)
+    
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(custom_id=data.get('custom_id'), disabled=data.get('disabled', False))
+        self.data = data
+    
+    @property
+    def type(self) -> Optional[int]:
+        return self.data.get('type', self.data.get('component_type'))
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        return dict(self.data)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UnknownComponent':
+        return cls(data)
+
+@register_component_type(2)
+class Button(Component):
+    __slots__ = ('_style', 'label', 'emoji', 'url', 'row')
+    
+    def __init__(
+        self,
+        *,
+        style: Union['discord.ButtonStyle', int] = 2,
+        label: Optional[str] = None,
+        emoji: Optional[Union[str, 'discord.Emoji', 'discord.PartialEmoji']] = None,
+        url: Optional[str] = None,
+        custom_id: Optional[str] = None,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.style = style
+        self.label = label
+        self.emoji = emoji
+        self.url = url
+        self.row = row
+    
+    @property
+    def style(self) -> 'discord.ButtonStyle':
+        style = self._style
+        if type(style) is int:
+            style = _enum('ButtonStyle', style)
+            object.__setattr__(self, '_style', style)
+        return style
+    
+    @style.setter
+    def style(self, value: Union['discord.ButtonStyle', int]) -> None:
+        object.__setattr__(self, '_style', value)
+    
+    def _check(self, errors: List[str], path: str) -> None:
+        # ButtonStyle.url is an alias of ButtonStyle.link.
+        if self.url is not None:
+            if self.custom_id is not None:
+                errors.append(f'{path} with URL cannot have a custom_id')
+            if _value(self._style) != 5:
+                errors.append(f'{path} with URL must have style set to ButtonStyle.link')
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        url = self.url
+        custom_id = self.custom_id
+        if url is not None:
+            if len(url) > 512:
+                errors.append(_length_error(path, 'url', 0, 512))
+        elif _value(self._style) == 5:
+            errors.append(f'{path} with style ButtonStyle.link must have a URL')
+        elif custom_id is None:
+            errors.append(f'{path} must have a custom_id or a URL')
+        
+        label = self.label
+        if label is None:
+            if self.emoji is None:
+                errors.append(f'{path} must have a label or an emoji')
+        elif len(label) > 80:
+            errors.append(_length_error(path, 'label', 0, 80))
+        if custom_id is not None and not 0 < len(custom_id) <= 100:
+            errors.append(_length_error(path, 'custom_id', 1, 100))
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 2,
+            'style': _value(self._style),
+            'disabled': self.disabled
+        }
+        
+        if self.label is not None:
+            data['label'] = self.label
+        if self.emoji is not None:
+            if isinstance(self.emoji, str):
+                data['emoji'] = {'name': self.emoji}
+            else:
+                data['emoji'] = {'name': self.emoji.name, 'id': self.emoji.id, 'animated': getattr(self.emoji, 'animated', False)}
+        if self.url is not None:
+            data['url'] = self.url
+        if self.custom_id is not None:
+            data['custom_id'] = self.custom_id
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Button':
+        style = data['style']
+        label = data.get('label')
+        emoji = data.get('emoji')
+        url = data.get('url')
+        custom_id = data.get('custom_id')
+        disabled = data.get('disabled', False)
+        
+        if emoji:
+            emoji = _emoji_from_dict(emoji)
+        
+        return cls(
+            style=style,
+            label=label,
+            emoji=emoji,
+            url=url,
+            custom_id=custom_id,
+            disabled=disabled
+        )
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'Button':
+        emoji = data.get('emoji')
+        if emoji:
+            emoji = _emoji_from_dict(emoji)
+        
+        return cls(
+            style=data.get('style', 2),
+            label=data.get('label'),
+            emoji=emoji,
+            custom_id=data['custom_id']
+        )
+
+class SelectOption(_CachedPayload):
+    __slots__ = ('label', 'value', 'description', 'emoji', 'default')
+    
+    def __init__(
+        self,
+        *,
+        label: str,
+        value: str,
+        description: Optional[str] = None,
+        emoji: Optional[Union[str, 'discord.Emoji', 'discord.PartialEmoji']] = None,
+        default: bool = False
+    ):
+        self.label = label
+        self.value = value
+        self.description = description
+        self.emoji = emoji
+        self.default = default
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        if not 0 < len(self.label) <= 100:
+            errors.append(_length_error(path, 'label', 1, 100))
+        if not 0 < len(self.value) <= 100:
+            errors.append(_length_error(path, 'value', 1, 100))
+        if self.description is not None and len(self.description) > 100:
+            errors.append(_length_error(path, 'description', 0, 100))
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'label': self.label,
+            'value': self.value,
+            'default': self.default
+        }
+        
+        if self.description is not None:
+            data['description'] = self.description
+        if self.emoji is not None:
+            if isinstance(self.emoji, str):
+                data['emoji'] = {'name': self.emoji}
+            else:
+                data['emoji'] = {'name': self.emoji.name, 'id': self.emoji.id, 'animated': getattr(self.emoji, 'animated', False)}
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SelectOption':
+        label = data['label']
+        value = data['value']
+        description = data.get('description')
+        emoji = data.get('emoji')
+        default = data.get('default', False)
+        
+        if emoji:
+            emoji = _emoji_from_dict(emoji)
+        
+        return cls(
+            label=label,
+            value=value,
+            description=description,
+            emoji=emoji,
+            default=default
+        )
+
+@register_component_type(3)
+class SelectMenu(Component):
+    __slots__ = ('options', 'placeholder', 'min_values', 'max_values', 'row')
+    
+    _tracked_fields = frozenset({'options'})
+    
+    _width = 5
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        options: List[SelectOption],
+        placeholder: Optional[str] = None,
+        min_values: int = 1,
+        max_values: int = 1,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.options = options
+        self.placeholder = placeholder
+        self.min_values = min_values
+        self.max_values = max_values
+        self.row = row
+    
+    def _check(self, errors: List[str], path: str) -> None:
+        if len(self.options) > 25:
+            errors.append(f'{path} can only have up to 25 options')
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        _check_select(errors, path, self)
+        if not self.options:
+            errors.append(f'{path} must have at least one option')
+        elif len(self.options) <= 25 and type(self.max_values) is int and self.max_values > len(self.options):
+            errors.append(f'{path} max_values cannot exceed its {len(self.options)} options')
+        if len({option.value for option in self.options}) != len(self.options):
+            errors.append(f'{path} has options with duplicate values')
+    
+    def _children(self, location: str) -> Iterable[tuple]:
+        return ((f'{location}.options[{i}]' if location else f'options[{i}]', option) for i, option in enumerate(self.options))
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 3,
+            'custom_id': self.custom_id,
+            'options': [option._payload() for option in self.options],
+            'min_values': self.min_values,
+            'max_values': self.max_values,
+            'disabled': self.disabled
+        }
+        
+        if self.placeholder is not None:
+            data['placeholder'] = self.placeholder
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SelectMenu':
+        custom_id = data['custom_id']
+        options = [SelectOption.from_dict(option) for option in data['options']]
+        placeholder = data.get('placeholder')
+        min_values = data.get('min_values', 1)
+        max_values = data.get('max_values', 1)
+        disabled = data.get('disabled', False)
+        
+        return cls(
+            custom_id=custom_id,
+            options=options,
+            placeholder=placeholder,
+            min_values=min_values,
+            max_values=max_values,
+            disabled=disabled
+        )
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'SelectMenu':
+        return cls(
+            custom_id=data['custom_id'],
+            options=[],
+            min_values=data.get('min_values', 1),
+            max_values=data.get('max_values', 1)
+        )
+
+@register_component_type(8)
+class ChannelSelect(Component):
+    __slots__ = ('channel_types', 'placeholder', 'min_values', 'max_values', 'row')
+    
+    _tracked_fields = frozenset({'channel_types'})
+    
+    _width = 5
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        channel_types: Optional[List[Union['discord.ChannelType', int]]] = None,
+        placeholder: Optional[str] = None,
+        min_values: int = 1,
+        max_values: int = 1,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.channel_types = channel_types or []
+        self.placeholder = placeholder
+        self.min_values = min_values
+        self.max_values = max_values
+        self.row = row
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        _check_select(errors, path, self)
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 8,
+            'custom_id': self.custom_id,
+            'channel_types': [_value(ct) for ct in self.channel_types],
+            'min_values': self.min_values,
+            'max_values': self.max_values,
+            'disabled': self.disabled
+        }
+        
+        if self.placeholder is not None:
+            data['placeholder'] = self.placeholder
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChannelSelect':
+        custom_id = data['custom_id']
+        channel_types = [_enum('ChannelType', ct) for ct in data.get('channel_types', [])]
+        placeholder = data.get('placeholder')
+        min_values = data.get('min_values', 1)
+        max_values = data.get('max_values', 1)
+        disabled = data.get('disabled', False)
+        
+        return cls(
+            custom_id=custom_id,
+            channel_types=channel_types,
+            placeholder=placeholder,
+            min_values=min_values,
+            max_values=max_values,
+            disabled=disabled
+        )
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'ChannelSelect':
+        return cls(
+            custom_id=data['custom_id'],
+            min_values=data.get('min_values', 1),
+            max_values=data.get('max_values', 1)
+        )
+
+@register_component_type(6)
+class RoleSelect(Component):
+    __slots__ = ('placeholder', 'min_values', 'max_values', 'row')
+    
+    _width = 5
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        placeholder: Optional[str] = None,
+        min_values: int = 1,
+        max_values: int = 1,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.placeholder = placeholder
+        self.min_values = min_values
+        self.max_values = max_values
+        self.row = row
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        _check_select(errors, path, self)
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 6,
+            'custom_id': self.custom_id,
+            'min_values': self.min_values,
+            'max_values': self.max_values,
+            'disabled': self.disabled
+        }
+        
+        if self.placeholder is not None:
+            data['placeholder'] = self.placeholder
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RoleSelect':
+        custom_id = data['custom_id']
+        placeholder = data.get('placeholder')
+        min_values = data.get('min_values', 1)
+        max_values = data.get('max_values', 1)
+        disabled = data.get('disabled', False)
+        
+        return cls(
+            custom_id=custom_id,
+            placeholder=placeholder,
+            min_values=min_values,
+            max_values=max_values,
+            disabled=disabled
+        )
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'RoleSelect':
+        return cls(
+            custom_id=data['custom_id'],
+            min_values=data.get('min_values', 1),
+            max_values=data.get('max_values', 1)
+        )
+
+@register_component_type(5)
+class UserSelect(Component):
+    __slots__ = ('placeholder', 'min_values', 'max_values', 'row')
+    
+    _width = 5
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        placeholder: Optional[str] = None,
+        min_values: int = 1,
+        max_values: int = 1,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.placeholder = placeholder
+        self.min_values = min_values
+        self.max_values = max_values
+        self.row = row
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        _check_select(errors, path, self)
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 5,
+            'custom_id': self.custom_id,
+            'min_values': self.min_values,
+            'max_values': self.max_values,
+            'disabled': self.disabled
+        }
+        
+        if self.placeholder is not None:
+            data['placeholder'] = self.placeholder
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UserSelect':
+        custom_id = data['custom_id']
+        placeholder = data.get('placeholder')
+        min_values = data.get('min_values', 1)
+        max_values = data.get('max_values', 1)
+        disabled = data.get('disabled', False)
+        
+        return cls(
+            custom_id=custom_id,
+            placeholder=placeholder,
+            min_values=min_values,
+            max_values=max_values,
+            disabled=disabled
+        )
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'UserSelect':
+        return cls(
+            custom_id=data['custom_id'],
+            min_values=data.get('min_values', 1),
+            max_values=data.get('max_values', 1)
+        )
+
+@register_component_type(7)
+class MentionableSelect(Component):
+    __slots__ = ('placeholder', 'min_values', 'max_values', 'row')
+    
+    _width = 5
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        placeholder: Optional[str] = None,
+        min_values: int = 1,
+        max_values: int = 1,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.placeholder = placeholder
+        self.min_values = min_values
+        self.max_values = max_values
+        self.row = row
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        _check_select(errors, path, self)
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 7,
+            'custom_id': self.custom_id,
+            'min_values': self.min_values,
+            'max_values': self.max_values,
+            'disabled': self.disabled
+        }
+        
+        if self.placeholder is not None:
+            data['placeholder'] = self.placeholder
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MentionableSelect':
+        custom_id = data['custom_id']
+        placeholder = data.get('placeholder')
+        min_values = data.get('min_values', 1)
+        max_values = data.get('max_values', 1)
+        disabled = data.get('disabled', False)
+        
+        return cls(
+            custom_id=custom_id,
+            placeholder=placeholder,
+            min_values=min_values,
+            max_values=max_values,
+            disabled=disabled
+        )
+    
+    @classmethod
+    def from_interaction(cls, data: Dict[str, Any]) -> 'MentionableSelect':
+        return cls(
+            custom_id=data['custom_id'],
+            min_values=data.get('min_values', 1),
+            max_values=data.get('max_values', 1)
+        )
+
+@register_component_type(4)
+class TextInput(Component):
+    __slots__ = ('label', '_style', 'placeholder', 'min_length', 'max_length', 'required', 'default')
+    
+    _width = 5
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        label: str,
+        style: Union['discord.TextStyle', int] = 1,
+        placeholder: Optional[str] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None,
+        required: bool = True,
+        default: Optional[str] = None,
+        disabled: bool = False
+    ):
+        super().__init__(custom_id=custom_id, disabled=disabled)
+        self.label = label
+        self.style = style
+        self.placeholder = placeholder
+        self.min_length = min_length
+        self.max_length = max_length
+        self.required = required
+        self.default = default
+    
+    @property
+    def style(self) -> 'discord.TextStyle':
+        style = self._style
+        if type(style) is int:
+            style = _enum('TextStyle', style)
+            object.__setattr__(self, '_style', style)
+        return style
+    
+    @style.setter
+    def style(self, value: Union['discord.TextStyle', int]) -> None:
+        object.__setattr__(self, '_style', value)
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        if not 0 < len(self.custom_id) <= 100:
+            errors.append(_length_error(path, 'custom_id', 1, 100))
+        if not 0 < len(self.label) <= 45:
+            errors.append(_length_error(path, 'label', 1, 45))
+        if self.placeholder is not None and len(self.placeholder) > 100:
+            errors.append(_length_error(path, 'placeholder', 0, 100))
+        if self.default is not None and len(self.default) > 4000:
+            errors.append(_length_error(path, 'default', 0, 4000))
+        
+        # None or a template Slot for anything but an int.
+        min_length = self.min_length
+        max_length = self.max_length
+        min_set = type(min_length) is int
+        max_set = type(max_length) is int
+        if min_set and not 0 <= min_length <= 4000:
+            errors.append(f'{path} min_length must be between 0 and 4000')
+        if max_set and not 1 <= max_length <= 4000:
+            errors.append(f'{path} max_length must be between 1 and 4000')
+        if min_set and max_set and min_length > max_length:
+            errors.append(f'{path} min_length cannot exceed max_length')
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        data = {
+            'type': 4,
+            'custom_id': self.custom_id,
+            'label': self.label,
+            'style': _value(self._style),
+            'required': self.required,
+            'disabled': self.disabled
+        }
+        
+        if self.placeholder is not None:
+            data['placeholder'] = self.placeholder
+        if self.min_length is not None:
+            data['min_length'] = self.min_length
+        if self.max_length is not None:
+            data['max_length'] = self.max_length
+        if self.default is not None:
+            data['value'] = self.default
+        
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TextInput':
+        custom_id = data['custom_id']
+        label = data['label']
+        style = data['style']
+        placeholder = data.get('placeholder')
+        min_length = data.get('min_length')
+        max_length = data.get('max_length')
+        required = data.get('required', True)
+        default = data.get('value')
+        disabled = data.get('disabled', False)
+        
+        return cls(
+            custom_id=custom_id,
+            label=label,
+            style=style,
+            placeholder=placeholder,
+            min_length=min_length,
+            max_length=max_length,
+            required=required,
+            default=default,
+            disabled=disabled
+        )
+
+class ActionRow(_CachedPayload):
+    __slots__ = ('components',)
+    
+    _tracked_fields = frozenset({'components'})
+    
+    def __init__(self, *components: Component):
+        self.components = list(components)
+    
+    def _check(self, errors: List[str], path: str) -> None:
+        if len(self.components) > 5:
+            errors.append(f'{path} can only contain up to 5 components')
+    
+    def _check_limits(self, errors: List[str], path: str) -> None:
+        if not self.components:
+            errors.append(f'{path} must contain at least one component')
+        elif 1 < len(self.components) <= 5 and _row_width(self) > 5:
+            errors.append(f'{path} has a select or text input sharing its row')
+    
+    def _children(self, location: str) -> Iterable[tuple]:
+        return ((f'{location}[{i}]' if location else f'components[{i}]', component) for i, component in enumerate(self.components))
+    
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': 1,
+            'components': [component._payload() for component in self.components]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ActionRow':
+        return cls(*[component_from_dict(component_data) for component_data in data['components']])
+
+def _row_width(row: ActionRow) -> int:
+    return sum([component._width for component in row.components])
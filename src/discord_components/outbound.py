@@ -0,0 +1,284 @@
+import discord
+from typing import Optional, List, Dict, Callable, Any, Awaitable, Hashable, Set, Tuple, TypeVar
+from collections import OrderedDict, deque
+import asyncio
+import enum
+import time
+
+T = TypeVar('T')
+
+__all__ = (
+    'Priority',
+    'QueueFull',
+    'OutboundScheduler'
+)
+
+class Priority(enum.IntEnum):
+    INTERACTION = 0
+    SEND = 1
+    EDIT = 2
+
+class QueueFull(Exception):
+    pass
+
+def _retry_after(error: Exception) -> Optional[float]:
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    
+    if isinstance(error, discord.HTTPException) and error.status == 429:
+        headers = getattr(error.response, 'headers', None) or {}
+        value = headers.get('X-RateLimit-Reset-After') or headers.get('Retry-After')
+        return float(value) if value is not None else 1.0
+    
+    return None
+
+class _Bucket:
+    # ``remaining`` is None until a 429 or X-RateLimit-* headers say
+    # otherwise; an unknown limit does not cap the calls in flight.
+    __slots__ = ('remaining', 'reset_at', 'inflight')
+    
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.inflight = 0
+    
+    def is_ready(self, now: float) -> bool:
+        if self.remaining is None:
+            return True
+        if now >= self.reset_at:
+            return self.inflight == 0 or self.remaining > self.inflight
+        return self.remaining > self.inflight
+
+class _Job:
+    __slots__ = ('call', 'bucket', 'priority', 'seq', 'future', 'attempts')
+    
+    def __init__(self, call: Callable[[], Awaitable[Any]], bucket: Hashable, priority: int, seq: int, future: asyncio.Future):
+        self.call = call
+        self.bucket = bucket
+        self.priority = priority
+        self.seq = seq
+        self.future = future
+        self.attempts = 0
+
+class OutboundScheduler:
+    # Schedules outbound REST calls across per-channel / per-webhook buckets.
+    # Lower priorities are always served first. Within a priority, ``fair``
+    # ordering round-robins between buckets and ``fifo`` serves the oldest
+    # ready call. A 429 (or discord.RateLimited) pauses the bucket until its
+    # reset and the call is retried. Results that carry ``X-RateLimit-*``
+    # headers (raw HTTP responses, like FakeTransport's) update the bucket as
+    # well; discord.py models do not, so their buckets are only limited after
+    # a 429. Buckets are dropped once idle. When ``max_queue`` calls are
+    # waiting, a newer call of lower priority is shed to make room, otherwise
+    # the new call is rejected with QueueFull.
+    def __init__(
+        self,
+        *,
+        concurrency: int = 4,
+        max_queue: int = 1000,
+        ordering: str = 'fair',
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if ordering not in ('fair', 'fifo'):
+            raise ValueError("ordering must be 'fair' or 'fifo'")
+        
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.ordering = ordering
+        self.max_retries = max_retries
+        self._clock = clock
+        self._queues: List['OrderedDict[Hashable, deque]'] = [OrderedDict() for _ in Priority]
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._depth = 0
+        self._seq = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._workers: Set[asyncio.Task] = set()
+        self.stats = {'sent': 0, 'failed': 0, 'retried': 0, 'rate_limited': 0, 'shed': 0, 'rejected': 0}
+    
+    @property
+    def depth(self) -> int:
+        return self._depth
+    
+    def submit(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        bucket: Hashable,
+        priority: int = Priority.EDIT
+    ) -> 'asyncio.Future[T]':
+        loop = asyncio.get_running_loop()
+        self._start(loop)
+        
+        if self._depth >= self.max_queue and not self._shed(priority):
+            self.stats['rejected'] += 1
+            raise QueueFull(f'Outbound queue is full ({self._depth} pending)')
+        
+        self._seq += 1
+        job = _Job(call, bucket, priority, self._seq, loop.create_future())
+        self._enqueue(job)
+        return job.future
+    
+    async def run(self, call: Callable[[], Awaitable[T]], *, bucket: Hashable, priority: int = Priority.EDIT) -> T:
+        return await self.submit(call, bucket=bucket, priority=priority)
+    
+    async def close(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        
+        for queue in self._queues:
+            for jobs in queue.values():
+                for job in jobs:
+                    job.future.cancel()
+            queue.clear()
+        self._depth = 0
+    
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        while len(self._workers) < self.concurrency:
+            task = loop.create_task(self._worker())
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+    
+    def _enqueue(self, job: _Job, *, front: bool = False) -> None:
+        queue = self._queues[job.priority]
+        jobs = queue.get(job.bucket)
+        if jobs is None:
+            jobs = queue[job.bucket] = deque()
+        if job.bucket not in self._buckets:
+            self._buckets[job.bucket] = _Bucket()
+        
+        if front:
+            jobs.appendleft(job)
+        else:
+            jobs.append(job)
+        self._depth += 1
+        self._wakeup.set()
+    
+    def _shed(self, priority: int) -> bool:
+        for queue in reversed(self._queues[priority + 1:]):
+            if not queue:
+                continue
+            
+            key = next(reversed(queue))
+            jobs = queue[key]
+            job = jobs.pop()
+            if not jobs:
+                del queue[key]
+                self._prune(key, self._clock())
+            self._depth -= 1
+            self.stats['shed'] += 1
+            job.future.set_exception(QueueFull('Dropped to make room for a higher priority call'))
+            return True
+        return False
+    
+    def _pop_ready(self, now: float) -> Tuple[Optional[_Job], Optional[float]]:
+        wait = None
+        
+        for queue in self._queues:
+            chosen = None
+            for key, jobs in queue.items():
+                bucket = self._buckets[key]
+                if not bucket.is_ready(now):
+                    if bucket.reset_at > now:
+                        delay = bucket.reset_at - now
+                        wait = delay if wait is None else min(wait, delay)
+                    continue
+                
+                if self.ordering == 'fair':
+                    chosen = key
+                    break
+                if chosen is None or jobs[0].seq < queue[chosen][0].seq:
+                    chosen = key
+            
+            if chosen is not None:
+                jobs = queue[chosen]
+                job = jobs.popleft()
+                if jobs:
+                    queue.move_to_end(chosen)
+                else:
+                    del queue[chosen]
+                self._depth -= 1
+                return job, None
+        
+        return None, wait
+    
+    def _prune(self, key: Hashable, now: float) -> None:
+        # Drops the bucket once nothing is queued or in flight for it and any
+        # rate limit has reset, so one-off keys (interaction webhooks) don't
+        # pile up.
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.inflight or now < bucket.reset_at:
+            return
+        if any(key in queue for queue in self._queues):
+            return
+        del self._buckets[key]
+    
+    async def _worker(self) -> None:
+        while True:
+            now = self._clock()
+            job, wait = self._pop_ready(now)
+            if job is None:
+                if wait is None and len(self._buckets) > len(self._workers):
+                    # Buckets still paused when they went idle.
+                    for key in list(self._buckets):
+                        self._prune(key, now)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            if job.future.done():
+                self._prune(job.bucket, now)
+                continue
+            await self._execute(job)
+            self._wakeup.set()
+    
+    async def _execute(self, job: _Job) -> None:
+        bucket = self._buckets[job.bucket]
+        bucket.inflight += 1
+        try:
+            result = await job.call()
+        except asyncio.CancelledError:
+            job.future.cancel()
+            raise
+        except Exception as error:
+            retry_after = _retry_after(error)
+            if retry_after is None or job.attempts >= self.max_retries:
+                self.stats['failed'] += 1
+                if not job.future.done():
+                    job.future.set_exception(error)
+                return
+            
+            self.stats['rate_limited'] += 1
+            self.stats['retried'] += 1
+            bucket.remaining = 0
+            bucket.reset_at = self._clock() + retry_after
+            job.attempts += 1
+            self._enqueue(job, front=True)
+        else:
+            self.stats['sent'] += 1
+            headers = getattr(result, 'headers', None)
+            if headers:
+                self._update_bucket(bucket, headers)
+            elif bucket.remaining is not None and self._clock() >= bucket.reset_at:
+                # Got through after a 429 reset without learning the limit.
+                bucket.remaining = None
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            bucket.inflight -= 1
+            self._prune(job.bucket, self._clock())
+    
+    def _update_bucket(self, bucket: _Bucket, headers: Any) -> None:
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_after = headers.get('X-RateLimit-Reset-After')
+        if remaining is not None:
+            bucket.remaining = int(remaining)
+        if reset_after is not None:
+            bucket.reset_at = self._clock() + float(reset_after)
@@ -0,0 +1,274 @@
+import discord
+from typing import Optional, Union, List, Callable, Any, AsyncIterable, Iterable, Sequence
+from collections import OrderedDict
+from collections.abc import Sequence as SequenceABC
+
+from .message import ComponentMessage
+from .models import ActionRow, Button, SelectMenu, SelectOption
+
+__all__ = (
+    'PaginatedSelect',
+)
+
+MAX_OPTIONS = 25
+
+_SEQUENCE = 0
+_ITERATOR = 1
+_ASYNC_ITERATOR = 2
+
+def _default_formatter(item: Any) -> SelectOption:
+    if isinstance(item, SelectOption):
+        return item
+    if isinstance(item, tuple):
+        return SelectOption(label=str(item[0]), value=str(item[1]))
+    if isinstance(item, (discord.Role, discord.abc.GuildChannel, discord.Member, discord.User)):
+        return SelectOption(label=item.name[:100], value=str(item.id))
+    return SelectOption(label=str(item)[:100], value=str(item)[:100])
+
+class PaginatedSelect(SelectMenu):
+    # A SelectMenu over a large option source, showing one page of at most 25
+    # options at a time. ``source`` may be a sequence (pages are sliced out
+    # on demand), an iterable or an async iterable (consumed one page at a
+    # time as the user moves forward). Items go through ``formatter`` to
+    # become SelectOptions; by default SelectOptions are used as they are,
+    # ``(label, value)`` tuples and roles/channels/members are converted and
+    # anything else becomes a label/value pair of its ``str``.
+    #
+    # Rendered pages of a sequence are kept in an LRU cache of
+    # ``cache_pages`` pages, so only the pages around the current one are in
+    # memory however long the sequence is. Iterators cannot be rewound, so
+    # their pages are kept once consumed; only pages the user actually
+    # reached are held.
+    #
+    # ``attach`` adds the previous/next controls to a ComponentMessage and
+    # wires up their callbacks. With an async source, ``await
+    # select.set_page(0)`` before the message is first sent.
+    __slots__ = (
+        'source',
+        'formatter',
+        'per_page',
+        'cache_pages',
+        '_kind',
+        '_iterator',
+        '_page',
+        '_pages',
+        '_exhausted',
+        '_controls',
+        '_min_values',
+        '_max_values'
+    )
+    
+    def __init__(
+        self,
+        *,
+        custom_id: str,
+        source: Union[Sequence[Any], Iterable[Any], AsyncIterable[Any]],
+        formatter: Callable[[Any], SelectOption] = _default_formatter,
+        per_page: int = MAX_OPTIONS,
+        cache_pages: int = 8,
+        placeholder: Optional[str] = None,
+        min_values: int = 1,
+        max_values: int = 1,
+        disabled: bool = False,
+        row: Optional[int] = None
+    ):
+        if not 1 <= per_page <= MAX_OPTIONS:
+            raise ValueError(f'per_page must be between 1 and {MAX_OPTIONS}')
+        if cache_pages < 1:
+            raise ValueError('cache_pages must be at least 1')
+        
+        super().__init__(
+            custom_id=custom_id,
+            options=[],
+            placeholder=placeholder,
+            min_values=min_values,
+            max_values=max_values,
+            disabled=disabled,
+            row=row
+        )
+        self.source = source
+        self.formatter = formatter
+        self.per_page = per_page
+        self.cache_pages = cache_pages
+        self._page = -1
+        self._pages: 'OrderedDict[int, List[SelectOption]]' = OrderedDict()
+        self._exhausted = False
+        self._controls: Optional[ActionRow] = None
+        self._min_values = min_values
+        self._max_values = max_values
+        
+        if isinstance(source, SequenceABC):
+            self._kind = _SEQUENCE
+            self._iterator = None
+        elif hasattr(source, '__aiter__'):
+            self._kind = _ASYNC_ITERATOR
+            self._iterator = source.__aiter__()
+        else:
+            self._kind = _ITERATOR
+            self._iterator = iter(source)
+    
+    @property
+    def page(self) -> int:
+        return max(self._page, 0)
+    
+    @property
+    def page_count(self) -> Optional[int]:
+        # None while an iterator source has not been read to the end.
+        if self._kind == _SEQUENCE:
+            return max(-(-len(self.source) // self.per_page), 1)
+        if self._exhausted:
+            return max(len(self._pages), 1)
+        return None
+    
+    def has_next(self) -> bool:
+        count = self.page_count
+        return count is None or self.page + 1 < count
+    
+    def has_previous(self) -> bool:
+        return self.page > 0
+    
+    def _check(self, errors: List[str], path: str) -> None:
+        # Checked before the payload is built, so the first page is loaded here.
+        if self._page < 0:
+            if self._kind == _ASYNC_ITERATOR:
+                errors.append(f'{path} needs a page of its async source loaded with set_page before sending')
+                return
+            self._show(0, self._load(0))
+        super()._check(errors, path)
+    
+    def _render(self, items: Iterable[Any]) -> List[SelectOption]:
+        formatter = self.formatter
+        return [formatter(item) for item in items]
+    
+    def _cached(self, page: int) -> Optional[List[SelectOption]]:
+        options = self._pages.get(page)
+        if options is not None and self._kind == _SEQUENCE:
+            self._pages.move_to_end(page)
+        return options
+    
+    def _store(self, page: int, options: List[SelectOption]) -> None:
+        self._pages[page] = options
+        if self._kind == _SEQUENCE:
+            while len(self._pages) > self.cache_pages:
+                self._pages.popitem(last=False)
+    
+    def _load(self, page: int) -> List[SelectOption]:
+        options = self._cached(page)
+        if options is not None:
+            return options
+        
+        if self._kind == _SEQUENCE:
+            start = page * self.per_page
+            options = self._render(self.source[start:start + self.per_page])
+            self._store(page, options)
+            return options
+        
+        while not self._exhausted and len(self._pages) <= page:
+            items = []
+            for item in self._iterator:
+                items.append(item)
+                if len(items) == self.per_page:
+                    break
+            self._append_page(items)
+        return self._pages.get(page, [])
+    
+    async def _aload(self, page: int) -> List[SelectOption]:
+        if self._kind != _ASYNC_ITERATOR:
+            return self._load(page)
+        
+        options = self._cached(page)
+        if options is not None:
+            return options
+        
+        while not self._exhausted and len(self._pages) <= page:
+            items = []
+            async for item in self._iterator:
+                items.append(item)
+                if len(items) == self.per_page:
+                    break
+            self._append_page(items)
+        return self._pages.get(page, [])
+    
+    def _append_page(self, items: List[Any]) -> None:
+        if len(items) < self.per_page:
+            self._exhausted = True
+        if items or not self._pages:
+            self._store(len(self._pages), self._render(items))
+    
+    def _show(self, page: int, options: List[SelectOption]) -> None:
+        # ``min_values``/``max_values`` are the ones given to the constructor,
+        # clamped to the options on this page (a short last page).
+        self._page = page
+        self.options = options
+        max_values = max(min(self._max_values, len(options)), 1)
+        if self.max_values != max_values:
+            self.max_values = max_values
+        min_values = min(self._min_values, max_values)
+        if self.min_values != min_values:
+            self.min_values = min_values
+        if self._controls is not None:
+            self._update_controls()
+    
+    async def set_page(self, page: int) -> None:
+        count = self.page_count
+        if page < 0 or (count is not None and page >= count):
+            raise ValueError(f'Page {page} is out of range')
+        
+        options = await self._aload(page)
+        if not options and page > 0:
+            # An iterator ran out exactly on a page boundary.
+            page = self.page_count - 1
+            options = await self._aload(page)
+        self._show(page, options)
+    
+    async def next_page(self) -> None:
+        if self.has_next():
+            await self.set_page(self.page + 1)
+    
+    async def previous_page(self) -> None:
+        if self.has_previous():
+            await self.set_page(self.page - 1)
+    
+    def controls(self) -> ActionRow:
+        # The previous / page / next buttons, created once and kept in sync
+        # with the current page.
+        if self._controls is None:
+            self._controls = ActionRow(
+                Button(label='\N{BLACK LEFT-POINTING TRIANGLE}', custom_id=f'{self.custom_id}:prev'),
+                Button(label='1', custom_id=f'{self.custom_id}:page', disabled=True),
+                Button(label='\N{BLACK RIGHT-POINTING TRIANGLE}', custom_id=f'{self.custom_id}:next')
+            )
+            self._update_controls()
+        return self._controls
+    
+    def _update_controls(self) -> None:
+        previous, indicator, following = self._controls.components
+        count = self.page_count
+        previous.disabled = not self.has_previous()
+        following.disabled = not self.has_next()
+        indicator.label = f'{self.page + 1}/{count if count is not None else "?"}'
+    
+    def attach(self, message: ComponentMessage) -> None:
+        # Adds the select (if it is not already there) and its controls to
+        # ``message`` and registers the previous/next callbacks, which move
+        # the page and update the message in place.
+        if not any(component is self for row in message.components for component in row.components):
+            message.components.append(ActionRow(self))
+        controls = self.controls()
+        if controls not in message.components:
+            message.components.append(controls)
+        
+        async def turn(interaction: discord.Interaction, forward: bool) -> None:
+            if forward:
+                await self.next_page()
+            else:
+                await self.previous_page()
+            await interaction.response.edit_message(view=message.to_view())
+        
+        @message.on_interaction(f'{self.custom_id}:prev')
+        async def previous_page(interaction: discord.Interaction) -> None:
+            await turn(interaction, False)
+        
+        @message.on_interaction(f'{self.custom_id}:next')
+        async def next_page(interaction: discord.Interaction) -> None:
+            await turn(interaction, True)
@@ -0,0 +1,234 @@
+from typing import Optional, Iterable, Iterator, List, Dict, Callable, Any, NamedTuple, Tuple, TypeVar
+import json
+import logging
+import sqlite3
+
+from .message import ComponentMessage
+from .models import ActionRow
+from .router import Handler, InteractionRouter, get_router
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+__all__ = (
+    'PersistentRecord',
+    'PersistentStore',
+    'MemoryStore',
+    'SQLiteStore',
+    'PersistentRegistry'
+)
+
+class PersistentRecord(NamedTuple):
+    key: str
+    components: List[Dict[str, Any]]
+    handlers: Dict[str, str]
+    message_id: Optional[int] = None
+
+class PersistentStore:
+    def save(self, record: PersistentRecord) -> None:
+        raise NotImplementedError
+    
+    def save_many(self, records: Iterable[PersistentRecord]) -> None:
+        for record in records:
+            self.save(record)
+    
+    def get(self, key: str) -> Optional[PersistentRecord]:
+        raise NotImplementedError
+    
+    def delete(self, key: str) -> bool:
+        raise NotImplementedError
+    
+    def iter_records(self) -> Iterator[PersistentRecord]:
+        raise NotImplementedError
+    
+    def iter_routes(self) -> Iterator[Tuple[str, str]]:
+        for record in self.iter_records():
+            yield from record.handlers.items()
+    
+    def close(self) -> None:
+        pass
+
+class MemoryStore(PersistentStore):
+    def __init__(self):
+        self._records: Dict[str, PersistentRecord] = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def save(self, record: PersistentRecord) -> None:
+        self._records[record.key] = record
+    
+    def get(self, key: str) -> Optional[PersistentRecord]:
+        return self._records.get(key)
+    
+    def delete(self, key: str) -> bool:
+        return self._records.pop(key, None) is not None
+    
+    def iter_records(self) -> Iterator[PersistentRecord]:
+        return iter(list(self._records.values()))
+
+class SQLiteStore(PersistentStore):
+    # Layouts and routes live in separate tables so startup only reads the
+    # (custom_id, handler) pairs and never parses a layout.
+    def __init__(self, path: str = ':memory:'):
+        self._db = sqlite3.connect(path)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS persistent_layouts (
+                key TEXT PRIMARY KEY,
+                message_id INTEGER,
+                components TEXT NOT NULL,
+                handlers TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS persistent_routes (
+                custom_id TEXT PRIMARY KEY,
+                key TEXT NOT NULL,
+                handler TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS persistent_routes_key ON persistent_routes (key);
+        ''')
+    
+    def __len__(self) -> int:
+        return self._db.execute('SELECT COUNT(*) FROM persistent_layouts').fetchone()[0]
+    
+    def save(self, record: PersistentRecord) -> None:
+        self.save_many((record,))
+    
+    def save_many(self, records: Iterable[PersistentRecord]) -> None:
+        with self._db:
+            for record in records:
+                self._db.execute('DELETE FROM persistent_routes WHERE key = ?', (record.key,))
+                self._db.execute(
+                    'INSERT OR REPLACE INTO persistent_layouts VALUES (?, ?, ?, ?)',
+                    (
+                        record.key,
+                        record.message_id,
+                        json.dumps(record.components, separators=(',', ':')),
+                        json.dumps(record.handlers, separators=(',', ':'))
+                    )
+                )
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO persistent_routes VALUES (?, ?, ?)',
+                    [(custom_id, record.key, name) for custom_id, name in record.handlers.items()]
+                )
+    
+    def get(self, key: str) -> Optional[PersistentRecord]:
+        row = self._db.execute(
+            'SELECT key, components, handlers, message_id FROM persistent_layouts WHERE key = ?',
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return PersistentRecord(row[0], json.loads(row[1]), json.loads(row[2]), row[3])
+    
+    def delete(self, key: str) -> bool:
+        with self._db:
+            self._db.execute('DELETE FROM persistent_routes WHERE key = ?', (key,))
+            return self._db.execute('DELETE FROM persistent_layouts WHERE key = ?', (key,)).rowcount > 0
+    
+    def iter_records(self) -> Iterator[PersistentRecord]:
+        cursor = self._db.execute('SELECT key, components, handlers, message_id FROM persistent_layouts')
+        for key, components, handlers, message_id in cursor:
+            yield PersistentRecord(key, json.loads(components), json.loads(handlers), message_id)
+    
+    def iter_routes(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._db.execute('SELECT custom_id, handler FROM persistent_routes'))
+    
+    def close(self) -> None:
+        self._db.close()
+
+def _custom_ids(components: List[Dict[str, Any]]) -> set:
+    return {
+        component['custom_id']
+        for row in components
+        for component in row.get('components', ())
+        if component.get('custom_id') is not None
+    }
+
+class PersistentRegistry:
+    def __init__(self, bot, store: Optional[PersistentStore] = None, *, router: Optional[InteractionRouter] = None):
+        self.bot = bot
+        self.store = store if store is not None else MemoryStore()
+        self._router = router
+        self._handlers: Dict[str, Handler] = {}
+        self._rehydrated = False
+    
+    @property
+    def router(self) -> InteractionRouter:
+        if self._router is None:
+            self._router = get_router(self.bot)
+        return self._router
+    
+    def add_handler(self, name: str, handler: Handler) -> None:
+        self._handlers[name] = handler
+    
+    def handler(self, name: Optional[str] = None) -> Callable[[T], T]:
+        def decorator(coro: T) -> T:
+            self.add_handler(name or coro.__name__, coro)
+            return coro
+        return decorator
+    
+    def register(
+        self,
+        key: str,
+        message: ComponentMessage,
+        handlers: Dict[str, str],
+        *,
+        message_id: Optional[int] = None
+    ) -> PersistentRecord:
+        components = message.to_dict().get('components', [])
+        
+        missing = set(handlers) - _custom_ids(components)
+        if missing:
+            raise ValueError(f'No component with custom_id {sorted(missing)!r} in layout {key!r}')
+        unknown = set(handlers.values()) - set(self._handlers)
+        if unknown:
+            raise ValueError(f'Unknown persistent handler {sorted(unknown)!r}')
+        
+        record = PersistentRecord(key, components, dict(handlers), message_id)
+        self.store.save(record)
+        
+        if self._rehydrated:
+            self.router.add_routes({custom_id: self._handlers[name] for custom_id, name in handlers.items()})
+        return record
+    
+    def unregister(self, key: str) -> bool:
+        record = self.store.get(key)
+        if record is None:
+            return False
+        
+        if self._rehydrated:
+            for custom_id in record.handlers:
+                self.router.remove_route(custom_id)
+        return self.store.delete(key)
+    
+    def load_message(self, key: str) -> Optional[ComponentMessage]:
+        record = self.store.get(key)
+        if record is None:
+            return None
+        
+        return ComponentMessage(
+            components=[ActionRow.from_dict(row) for row in record.components],
+            timeout=None
+        )
+    
+    def rehydrate(self) -> int:
+        # One pass over the stored routes; nothing is fetched or edited and no
+        # views are built, the router answers for every stored custom_id.
+        handlers = self._handlers
+        routes = {}
+        skipped = 0
+        
+        for custom_id, name in self.store.iter_routes():
+            handler = handlers.get(name)
+            if handler is None:
+                skipped += 1
+                continue
+            routes[custom_id] = handler
+        
+        if skipped:
+            _log.warning('Skipped %d persistent components with no registered handler', skipped)
+        
+        self.router.add_routes(routes)
+        self._rehydrated = True
+        return len(routes)
@@ -0,0 +1,148 @@
+from typing import Optional, Union, Dict, Callable, Any, Awaitable, Hashable, Set, TYPE_CHECKING
+from collections import deque
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from .context import ComponentContext
+
+_log = logging.getLogger(__name__)
+
+KeyFunc = Callable[['ComponentContext'], Optional[Hashable]]
+
+__all__ = (
+    'HandlerPool',
+)
+
+def _message_key(ctx: 'ComponentContext') -> Optional[Hashable]:
+    message = ctx.interaction.message
+    return message.id if message is not None else None
+
+def _user_key(ctx: 'ComponentContext') -> Optional[Hashable]:
+    return ctx.interaction.user.id if ctx.interaction.user is not None else None
+
+def _custom_id_key(ctx: 'ComponentContext') -> Optional[Hashable]:
+    return ctx.custom_id
+
+_KEYS: Dict[str, KeyFunc] = {
+    'message': _message_key,
+    'user': _user_key,
+    'custom_id': _custom_id_key
+}
+
+class _Job:
+    __slots__ = ('ctx', 'call')
+    
+    def __init__(self, ctx: 'ComponentContext', call: Callable[[], Awaitable[Any]]):
+        self.ctx = ctx
+        self.call = call
+
+class HandlerPool:
+    # Runs component handlers on ``workers`` worker tasks instead of one task
+    # per interaction. At most ``max_queue`` interactions wait for a worker;
+    # beyond that new ones are shed and answered by ``on_busy``.
+    #
+    # With ``key`` ('message', 'user', 'custom_id' or a callable taking the
+    # ComponentContext) interactions that share a key run one at a time in
+    # arrival order, while different keys run in parallel. A key of None
+    # means the interaction is not serialized.
+    def __init__(
+        self,
+        *,
+        workers: int = 32,
+        max_queue: int = 1000,
+        key: Optional[Union[str, KeyFunc]] = None,
+        busy_message: Optional[str] = 'Too many requests right now, please try again in a moment.'
+    ):
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        if max_queue < 0:
+            raise ValueError('max_queue must not be negative')
+        if isinstance(key, str):
+            if key not in _KEYS:
+                raise ValueError(f'key must be one of {", ".join(_KEYS)} or a callable')
+            key = _KEYS[key]
+        
+        self.workers = workers
+        self.max_queue = max_queue
+        self.key: Optional[KeyFunc] = key
+        self.busy_message = busy_message
+        self._pending: Dict[Hashable, deque] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._depth = 0
+        self.stats = {'submitted': 0, 'completed': 0, 'shed': 0}
+    
+    @property
+    def depth(self) -> int:
+        return self._depth
+    
+    async def submit(self, ctx: 'ComponentContext', call: Callable[[], Awaitable[Any]]) -> bool:
+        # Queues ``call`` and returns at once; returns False if it was shed.
+        if self._depth >= self.max_queue:
+            self.stats['shed'] += 1
+            await self.on_busy(ctx)
+            return False
+        
+        self._start()
+        job = _Job(ctx, call)
+        key = self.key(ctx) if self.key is not None else None
+        if key is None:
+            key = job
+        
+        self.stats['submitted'] += 1
+        self._depth += 1
+        jobs = self._pending.get(key)
+        if jobs is None:
+            self._pending[key] = deque((job,))
+            self._ready.put_nowait(key)
+        else:
+            jobs.append(job)
+        return True
+    
+    async def on_busy(self, ctx: 'ComponentContext') -> None:
+        ctx.cancel_auto_defer()
+        if self.busy_message is None:
+            return
+        try:
+            await ctx.reply(self.busy_message, ephemeral=True)
+        except Exception as error:
+            _log.debug('Could not send busy response for %r', ctx.custom_id, exc_info=error)
+    
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._pending.clear()
+        self._ready = None
+        self._depth = 0
+    
+    def _start(self) -> None:
+        if self._ready is None:
+            self._ready = asyncio.Queue()
+        while len(self._tasks) < self.workers:
+            task = asyncio.ensure_future(self._worker())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _worker(self) -> None:
+        # A key stays in ``_pending`` while one of its jobs runs, so later jobs
+        # for it queue up behind the running one; it is put back on the ready
+        # queue only once that job has finished.
+        ready = self._ready
+        while True:
+            key = await ready.get()
+            jobs = self._pending[key]
+            job = jobs.popleft()
+            self._depth -= 1
+            try:
+                await job.call()
+            except Exception as error:
+                _log.error('Ignoring exception in pooled handler for %r', job.ctx.custom_id, exc_info=error)
+            finally:
+                self.stats['completed'] += 1
+                if jobs:
+                    ready.put_nowait(key)
+                else:
+                    del self._pending[key]
@@ -0,0 +1,317 @@
+import discord
+from typing import Optional, Union, List, Dict, Callable, Any, Coroutine, Pattern, Tuple, TypeVar
+import asyncio
+import functools
+import inspect
+import logging
+import re
+import time
+import weakref
+
+from .context import ComponentContext
+from .models import _component_types
+from .metrics import DISPATCH_LATENCY, HANDLER_DURATION, _metrics, since
+from .pool import HandlerPool
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+Handler = Callable[[ComponentContext], Coroutine[Any, Any, Any]]
+
+__all__ = (
+    'InteractionRouter',
+    'get_router'
+)
+
+def _check_handler(handler: Handler) -> None:
+    if not inspect.iscoroutinefunction(handler):
+        raise TypeError('Callback must be a coroutine function')
+
+class _PrefixTrie:
+    # Character trie of route prefixes; a node's ``(prefix, handler)`` entry
+    # is stored under the ``None`` key so lookups are a single walk returning
+    # the longest match.
+    __slots__ = ('_root', '_size')
+    
+    def __init__(self):
+        self._root: Dict[Any, Any] = {}
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def get(self, prefix: str) -> Optional[Handler]:
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        entry = node.get(None)
+        return entry[1] if entry is not None else None
+    
+    def insert(self, prefix: str, handler: Handler) -> None:
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        if None not in node:
+            self._size += 1
+        node[None] = (prefix, handler)
+    
+    def remove(self, prefix: str) -> bool:
+        path = []
+        node = self._root
+        for char in prefix:
+            path.append((node, char))
+            node = node.get(char)
+            if node is None:
+                return False
+        
+        if node.pop(None, None) is None:
+            return False
+        
+        self._size -= 1
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+        return True
+    
+    def longest_match(self, key: str) -> Optional[Tuple[str, Handler]]:
+        node = self._root
+        found = node.get(None)
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                break
+            entry = node.get(None)
+            if entry is not None:
+                found = entry
+        return found
+
+class InteractionRouter:
+    # ``auto_defer`` (seconds, or None) arms ComponentContext.auto_defer for
+    # every dispatched interaction; set_auto_defer overrides it per handler.
+    # With a HandlerPool as ``pool``, handlers run on the pool's workers and
+    # dispatch returns as soon as the interaction is queued.
+    def __init__(
+        self,
+        *,
+        auto_defer: Optional[float] = None,
+        defer_ephemeral: bool = False,
+        pool: Optional[HandlerPool] = None
+    ):
+        self._exact: Dict[str, Handler] = {}
+        self._prefixes = _PrefixTrie()
+        self._patterns: List[Tuple[Pattern[str], Handler]] = []
+        self._handlers: List[Handler] = []
+        self._auto_defer: Dict[Handler, Tuple[float, bool]] = {}
+        self.auto_defer = auto_defer
+        self.defer_ephemeral = defer_ephemeral
+        self.pool = pool
+    
+    def attach(self, bot) -> None:
+        bot.listen('on_interaction')(self.dispatch)
+    
+    def add_route(self, custom_id: str, handler: Handler) -> None:
+        _check_handler(handler)
+        current = self._exact.get(custom_id)
+        if current is not None and current is not handler:
+            raise ValueError(f'A handler is already registered for custom_id {custom_id!r}')
+        
+        self._exact[custom_id] = handler
+    
+    def add_routes(self, routes: Dict[str, Handler]) -> None:
+        # Bulk registration: each distinct handler is checked once and the
+        # routes land in the exact map with a single update.
+        for handler in set(routes.values()):
+            _check_handler(handler)
+        
+        exact = self._exact
+        for custom_id, handler in routes.items():
+            current = exact.get(custom_id)
+            if current is not None and current is not handler:
+                raise ValueError(f'A handler is already registered for custom_id {custom_id!r}')
+        
+        exact.update(routes)
+    
+    def remove_route(self, custom_id: str) -> bool:
+        return self._exact.pop(custom_id, None) is not None
+    
+    def add_prefix_route(self, prefix: str, handler: Handler) -> None:
+        _check_handler(handler)
+        current = self._prefixes.get(prefix)
+        if current is not None and current is not handler:
+            raise ValueError(f'A handler is already registered for prefix {prefix!r}')
+        
+        self._prefixes.insert(prefix, handler)
+    
+    def remove_prefix_route(self, prefix: str) -> bool:
+        return self._prefixes.remove(prefix)
+    
+    def add_pattern_route(self, pattern: Union[str, Pattern[str]], handler: Handler) -> None:
+        _check_handler(handler)
+        self._patterns.append((re.compile(pattern), handler))
+    
+    def remove_pattern_route(self, pattern: Union[str, Pattern[str]]) -> bool:
+        pattern = re.compile(pattern)
+        for i, (other, _) in enumerate(self._patterns):
+            if other == pattern:
+                del self._patterns[i]
+                return True
+        return False
+    
+    def add_handler(self, handler: Handler) -> None:
+        # Catch-all handlers run for every component interaction, alongside
+        # the matching route (if any).
+        _check_handler(handler)
+        self._handlers.append(handler)
+    
+    def remove_handler(self, handler: Handler) -> bool:
+        try:
+            self._handlers.remove(handler)
+        except ValueError:
+            return False
+        return True
+    
+    def set_auto_defer(self, handler: Handler, delay: Optional[float], *, ephemeral: bool = False) -> None:
+        # Interactions routed to ``handler`` are deferred if it has not
+        # responded ``delay`` seconds after dispatch. None removes the override.
+        if delay is None:
+            self._auto_defer.pop(handler, None)
+        elif delay < 0:
+            raise ValueError('delay must not be negative')
+        else:
+            self._auto_defer[handler] = (delay, ephemeral)
+    
+    def route(
+        self,
+        custom_id: Optional[str] = None,
+        *,
+        prefix: Optional[str] = None,
+        pattern: Optional[Union[str, Pattern[str]]] = None
+    ) -> Callable[[T], T]:
+        if sum(option is not None for option in (custom_id, prefix, pattern)) != 1:
+            raise TypeError('Exactly one of custom_id, prefix or pattern must be given')
+        
+        def decorator(coro: T) -> T:
+            if custom_id is not None:
+                self.add_route(custom_id, coro)
+            elif prefix is not None:
+                self.add_prefix_route(prefix, coro)
+            else:
+                self.add_pattern_route(pattern, coro)
+            return coro
+        return decorator
+    
+    def resolve(self, custom_id: str) -> Tuple[Optional[Handler], Optional['re.Match[str]']]:
+        handler, match, _ = self._lookup(custom_id)
+        return handler, match
+    
+    def _lookup(self, custom_id: str) -> Tuple[Optional[Handler], Optional['re.Match[str]'], Optional[str]]:
+        # Like resolve, plus the route that matched: the custom_id, prefix or
+        # pattern string it was registered under.
+        handler = self._exact.get(custom_id)
+        if handler is not None:
+            return handler, None, custom_id
+        
+        if self._prefixes:
+            entry = self._prefixes.longest_match(custom_id)
+            if entry is not None:
+                return entry[1], None, entry[0]
+        
+        for pattern, handler in self._patterns:
+            match = pattern.match(custom_id)
+            if match is not None:
+                return handler, match, pattern.pattern
+        
+        return None, None, None
+    
+    async def dispatch(self, interaction: discord.Interaction) -> None:
+        if interaction.type != discord.InteractionType.component:
+            return
+        
+        data = interaction.data
+        if data.get('component_type') not in _component_types:
+            return
+        
+        handler, match, route = self._lookup(data.get('custom_id', ''))
+        if handler is None and not self._handlers:
+            return
+        
+        ctx = ComponentContext(interaction)
+        ctx.match = match
+        ctx.route = route
+        
+        metrics = _metrics
+        if metrics.enabled:
+            metrics.observe(DISPATCH_LATENCY, since(interaction.id), route, ctx.component_type)
+        
+        # The shortest delay set for any handler that will run, the routed one
+        # or a catch-all.
+        defer = None
+        if self._auto_defer:
+            defer = self._auto_defer.get(handler)
+            for other in self._handlers:
+                entry = self._auto_defer.get(other)
+                if entry is not None and (defer is None or entry[0] < defer[0]):
+                    defer = entry
+        if defer is not None:
+            ctx.auto_defer(defer[0], ephemeral=defer[1])
+        elif self.auto_defer is not None:
+            ctx.auto_defer(self.auto_defer, ephemeral=self.defer_ephemeral)
+        
+        if self.pool is not None:
+            await self.pool.submit(ctx, functools.partial(self._run, ctx, handler, route))
+        else:
+            await self._run(ctx, handler, route)
+    
+    async def _run(self, ctx: ComponentContext, handler: Optional[Handler], route: Optional[str]) -> None:
+        # The routed handler and the catch-all handlers run concurrently, as
+        # they did when each was its own on_interaction listener.
+        try:
+            calls = [self._invoke(other, ctx, '*') for other in self._handlers]
+            if handler is not None:
+                calls.insert(0, self._invoke(handler, ctx, route))
+            if len(calls) == 1:
+                await calls[0]
+            else:
+                await asyncio.gather(*calls)
+        finally:
+            ctx.cancel_auto_defer()
+    
+    async def _invoke(self, handler: Handler, ctx: ComponentContext, route: Optional[str] = None) -> None:
+        metrics = _metrics
+        start = time.perf_counter() if metrics.enabled else None
+        try:
+            await handler(ctx)
+        except Exception as error:
+            await self.on_error(ctx, error)
+        finally:
+            if start is not None:
+                metrics.observe(HANDLER_DURATION, time.perf_counter() - start, route, ctx.component_type)
+    
+    async def on_error(self, ctx: ComponentContext, error: Exception) -> None:
+        # Handler errors reach the bot's on_error like those of any other
+        # on_interaction listener. It is awaited inside the handler's except
+        # block, so sys.exc_info() is still set, which bot.dispatch('error')
+        # would lose. Without a client the error is logged here.
+        report = getattr(ctx.bot, 'on_error', None)
+        if report is None:
+            _log.error('Ignoring exception in component handler for %r', ctx.custom_id, exc_info=error)
+        else:
+            await report('on_interaction', ctx.interaction)
+
+_routers: 'weakref.WeakKeyDictionary[Any, InteractionRouter]' = weakref.WeakKeyDictionary()
+
+def get_router(bot, *, pool: Optional[HandlerPool] = None) -> InteractionRouter:
+    # ``pool`` sets the HandlerPool of the bot's router. A router has a single
+    # pool, so passing a different one later is an error.
+    router = _routers.get(bot)
+    if router is None:
+        router = _routers[bot] = InteractionRouter(pool=pool)
+        router.attach(bot)
+    elif pool is not None and router.pool is not pool:
+        if router.pool is not None:
+            raise ValueError('The router of this bot already uses a different HandlerPool')
+        router.pool = pool
+    return router
@@ -0,0 +1,266 @@
+from typing import Optional, Callable, Any, Hashable, Iterator, Set
+from collections import OrderedDict
+import asyncio
+import inspect
+import logging
+import sys
+import time
+import weakref
+
+_log = logging.getLogger(__name__)
+
+EvictCallback = Callable[[Hashable, Any, str], Any]
+
+__all__ = (
+    'SessionStore',
+    'disable_components'
+)
+
+def _deep_sizeof(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_sizeof(key) + _deep_sizeof(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            size += _deep_sizeof(value)
+    return size
+
+def estimate_size(value: Any) -> int:
+    # Payload size of anything with a ``to_dict`` (ComponentMessage and the
+    # components), plus the object itself; a rough figure, but a stable one.
+    # Messages are stored after they were sent, so a payload that fails its
+    # checks counts as the object alone rather than raising.
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is not None:
+        try:
+            payload = to_dict()
+        except ValueError:
+            pass
+        else:
+            return sys.getsizeof(value) + _deep_sizeof(payload)
+    return sys.getsizeof(value)
+
+async def disable_components(key: Hashable, message: Any, reason: str) -> None:
+    # An on_evict callback that disables every component of an evicted
+    # ComponentMessage and edits the sent message, so stale menus stop
+    # accepting clicks.
+    for row in message.components:
+        for component in row.components:
+            component.disabled = True
+    try:
+        await message.edit()
+    except Exception as error:
+        _log.debug('Could not disable components of evicted session %r', key, exc_info=error)
+
+class _Entry:
+    __slots__ = ('value', 'expires_at', 'size')
+    
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+class SessionStore:
+    # Shared store for ComponentMessage state, keyed by message id.
+    #
+    # Entries expire ``ttl`` seconds after they were last put, read or touched,
+    # and the least recently used ones are evicted when more than
+    # ``max_entries`` entries or ``max_bytes`` (as measured by ``sizeof``)
+    # are held. Since the TTL is refreshed on use, LRU order is also expiry
+    # order, so expiring is a walk from the cold end that stops at the first
+    # live entry. With ``weak`` the store keeps only weak references and an
+    # entry disappears once nothing else holds its value.
+    #
+    # ``on_evict(key, value, reason)`` runs for expired ('expired') and
+    # evicted ('evicted') entries and may be a coroutine function. After it,
+    # values with a ``release`` method (ComponentMessage) have it called to
+    # drop their view, message and listeners.
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = 900.0,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = None,
+        weak: bool = False,
+        on_evict: Optional[EvictCallback] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be positive')
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.weak = weak
+        self.on_evict = on_evict
+        self.sizeof = sizeof
+        self._clock = clock
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._bytes = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'collected': 0}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry, self._clock())
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+    
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+    
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl is not None and entry.expires_at <= now
+    
+    def _deref(self, entry: _Entry) -> Any:
+        return entry.value() if self.weak else entry.value
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats['misses'] += 1
+            return default
+        
+        if self._expired(entry, now):
+            self.stats['misses'] += 1
+            self.expire()
+            return default
+        
+        value = self._deref(entry)
+        if value is None:
+            self.stats['misses'] += 1
+            return default
+        
+        self.stats['hits'] += 1
+        self._refresh(key, entry, now)
+        return value
+    
+    def touch(self, key: Hashable) -> bool:
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry, now):
+            return False
+        
+        self._refresh(key, entry, now)
+        return True
+    
+    def _refresh(self, key: Hashable, entry: _Entry, now: float) -> None:
+        if self.ttl is not None:
+            entry.expires_at = now + self.ttl
+        self._entries.move_to_end(key)
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        now = self._clock()
+        self._discard(key)
+        
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        stored = weakref.ref(value, self._collector(key)) if self.weak else value
+        self._entries[key] = _Entry(stored, now + self.ttl if self.ttl is not None else 0.0, size)
+        self._bytes += size
+        
+        self.expire(now)
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1)
+        ):
+            self._evict(next(iter(self._entries)), 'evicted')
+    
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        # Removes an entry without running on_evict.
+        entry = self._discard(key)
+        if entry is None:
+            return default
+        value = self._deref(entry)
+        return default if value is None else value
+    
+    def expire(self, now: Optional[float] = None) -> int:
+        if self.ttl is None:
+            return 0
+        
+        if now is None:
+            now = self._clock()
+        count = 0
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now:
+                break
+            self._evict(key, 'expired')
+            count += 1
+        return count
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+    
+    def _discard(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+    
+    def _collector(self, key: Hashable) -> Callable[[weakref.ref], None]:
+        store = weakref.ref(self)
+        
+        def collected(ref: weakref.ref) -> None:
+            self = store()
+            if self is None:
+                return
+            entry = self._entries.get(key)
+            if entry is not None and entry.value is ref:
+                self._discard(key)
+                self.stats['collected'] += 1
+        return collected
+    
+    def _evict(self, key: Hashable, reason: str) -> None:
+        entry = self._discard(key)
+        self.stats['evictions' if reason == 'evicted' else 'expirations'] += 1
+        value = self._deref(entry)
+        if value is None:
+            return
+        
+        result = None
+        if self.on_evict is not None:
+            try:
+                result = self.on_evict(key, value, reason)
+            except Exception as error:
+                _log.error('Ignoring exception in session eviction callback', exc_info=error)
+        
+        if not inspect.isawaitable(result):
+            self._release(value)
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Evicted outside the event loop: nothing can await the callback.
+            if inspect.iscoroutine(result):
+                result.close()
+            self._release(value)
+            return
+        
+        task = loop.create_task(self._finish(result, value))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _finish(self, result: Any, value: Any) -> None:
+        try:
+            await result
+        except Exception as error:
+            _log.error('Ignoring exception in session eviction callback', exc_info=error)
+        finally:
+            self._release(value)
+    
+    def _release(self, value: Any) -> None:
+        release = getattr(value, 'release', None)
+        if release is not None:
+            release()
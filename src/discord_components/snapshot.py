@@ -0,0 +1,540 @@
+import discord
+from typing import Optional, Union, Iterable, Iterator, List, Dict, Callable, Any, BinaryIO, NamedTuple, Tuple
+import json
+import mmap
+import struct
+
+from .message import ComponentMessage
+from .models import (
+    ActionRow,
+    Button,
+    ChannelSelect,
+    Component,
+    MentionableSelect,
+    RoleSelect,
+    SelectMenu,
+    SelectOption,
+    TextInput,
+    UserSelect,
+    _TrackedList,
+    _value,
+    component_from_dict
+)
+
+__all__ = (
+    'Snapshot',
+    'SnapshotWriter',
+    'handler_name',
+    'encode_snapshot',
+    'decode_snapshot',
+    'dump_snapshots',
+    'load_snapshots',
+    'load_snapshot_file'
+)
+
+# A snapshot stream is the magic and a version byte, then records framed by
+# their length as an unsigned varint. Inside a record, unsigned ints are
+# varints, strings are length-prefixed UTF-8 and optional strings store
+# length + 1 with 0 for None. Ids of 0 mean "none".
+MAGIC = b'DCSN'
+VERSION = 1
+
+_HEADER = MAGIC + bytes((VERSION,))
+_READ_SIZE = 1 << 16
+_double = struct.Struct('<d')
+
+# Component tags; _OTHER components are kept as the JSON of their payload.
+_OTHER = 0
+_BUTTON = 2
+_SELECT = 3
+_TEXT_INPUT = 4
+_USER_SELECT = 5
+_ROLE_SELECT = 6
+_MENTIONABLE_SELECT = 7
+_CHANNEL_SELECT = 8
+
+_TAGS = {
+    Button: _BUTTON,
+    SelectMenu: _SELECT,
+    TextInput: _TEXT_INPUT,
+    UserSelect: _USER_SELECT,
+    RoleSelect: _ROLE_SELECT,
+    MentionableSelect: _MENTIONABLE_SELECT,
+    ChannelSelect: _CHANNEL_SELECT
+}
+
+_SIMPLE_SELECTS = {
+    _USER_SELECT: UserSelect,
+    _ROLE_SELECT: RoleSelect,
+    _MENTIONABLE_SELECT: MentionableSelect
+}
+
+_BUTTON_STYLES = {style.value: style for style in discord.ButtonStyle}
+_TEXT_STYLES = {style.value: style for style in discord.TextStyle}
+_CHANNEL_TYPES = {channel_type.value: channel_type for channel_type in discord.ChannelType}
+
+# Flag bits
+_DISABLED = 1
+_HAS_LABEL = 2
+_HAS_EMOJI = 4
+_HAS_URL = 8
+_HAS_CUSTOM_ID = 16
+_HAS_PLACEHOLDER = 2
+_DEFAULT = 1
+_HAS_DESCRIPTION = 2
+_HAS_MIN_LENGTH = 4
+_HAS_MAX_LENGTH = 8
+_REQUIRED = 16
+_HAS_VALUE = 32
+_HAS_TIMEOUT = 1
+_HAS_EMBEDS = 2
+
+_set = object.__setattr__
+
+class Snapshot(NamedTuple):
+    message: ComponentMessage
+    handlers: Dict[str, str]
+    message_id: Optional[int] = None
+    channel_id: Optional[int] = None
+
+def handler_name(func: Callable) -> str:
+    # The name a listener is stored under when no names are given.
+    return f'{func.__module__}.{func.__qualname__}'
+
+def _write_uint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _write_str(out: bytearray, value: str) -> None:
+    data = value.encode()
+    _write_uint(out, len(data))
+    out += data
+
+def _write_optional_str(out: bytearray, value: Optional[str]) -> None:
+    if value is None:
+        out.append(0)
+        return
+    data = value.encode()
+    _write_uint(out, len(data) + 1)
+    out += data
+
+def _write_emoji(out: bytearray, emoji: Union[str, discord.Emoji, discord.PartialEmoji]) -> None:
+    if isinstance(emoji, str):
+        out.append(0)
+        _write_str(out, emoji)
+    else:
+        out.append(2 if getattr(emoji, 'animated', False) else 1)
+        _write_optional_str(out, emoji.name)
+        _write_uint(out, emoji.id or 0)
+
+def _write_component(out: bytearray, component: Component) -> None:
+    tag = _TAGS.get(type(component), _OTHER)
+    out.append(tag)
+    flags = _DISABLED if component.disabled else 0
+    
+    if tag == _BUTTON:
+        if component.label is not None:
+            flags |= _HAS_LABEL
+        if component.emoji is not None:
+            flags |= _HAS_EMOJI
+        if component.url is not None:
+            flags |= _HAS_URL
+        if component.custom_id is not None:
+            flags |= _HAS_CUSTOM_ID
+        out.append(flags)
+        out.append(_value(component._style))
+        if component.label is not None:
+            _write_str(out, component.label)
+        if component.emoji is not None:
+            _write_emoji(out, component.emoji)
+        if component.url is not None:
+            _write_str(out, component.url)
+        if component.custom_id is not None:
+            _write_str(out, component.custom_id)
+    elif tag == _TEXT_INPUT:
+        if component.placeholder is not None:
+            flags |= _HAS_PLACEHOLDER
+        if component.min_length is not None:
+            flags |= _HAS_MIN_LENGTH
+        if component.max_length is not None:
+            flags |= _HAS_MAX_LENGTH
+        if component.required:
+            flags |= _REQUIRED
+        if component.default is not None:
+            flags |= _HAS_VALUE
+        out.append(flags)
+        _write_str(out, component.custom_id)
+        _write_str(out, component.label)
+        out.append(_value(component._style))
+        if component.placeholder is not None:
+            _write_str(out, component.placeholder)
+        if component.min_length is not None:
+            _write_uint(out, component.min_length)
+        if component.max_length is not None:
+            _write_uint(out, component.max_length)
+        if component.default is not None:
+            _write_str(out, component.default)
+    elif tag == _OTHER:
+        _write_str(out, json.dumps(component._payload(), separators=(',', ':')))
+    else:
+        if component.placeholder is not None:
+            flags |= _HAS_PLACEHOLDER
+        out.append(flags)
+        _write_str(out, component.custom_id)
+        _write_uint(out, component.min_values)
+        _write_uint(out, component.max_values)
+        if component.placeholder is not None:
+            _write_str(out, component.placeholder)
+        
+        if tag == _SELECT:
+            _write_uint(out, len(component.options))
+            for option in component.options:
+                flags = _DEFAULT if option.default else 0
+                if option.description is not None:
+                    flags |= _HAS_DESCRIPTION
+                if option.emoji is not None:
+                    flags |= _HAS_EMOJI
+                out.append(flags)
+                _write_str(out, option.label)
+                _write_str(out, option.value)
+                if option.description is not None:
+                    _write_str(out, option.description)
+                if option.emoji is not None:
+                    _write_emoji(out, option.emoji)
+        elif tag == _CHANNEL_SELECT:
+            _write_uint(out, len(component.channel_types))
+            for channel_type in component.channel_types:
+                _write_uint(out, _value(channel_type))
+
+def encode_snapshot(
+    message: ComponentMessage,
+    *,
+    handlers: Optional[Dict[str, str]] = None,
+    message_id: Optional[int] = None,
+    channel_id: Optional[int] = None
+) -> bytes:
+    # One record: the layout and component state of ``message``, the ids of
+    # the sent message (taken from it unless given) and the handler names by
+    # custom_id (named after the message's listeners unless given).
+    sent = message.message
+    if message_id is None and sent is not None:
+        message_id = sent.id
+    if channel_id is None and sent is not None:
+        channel_id = sent.channel.id
+    if handlers is None:
+        handlers = {custom_id: handler_name(func) for custom_id, func in message._listeners.items()}
+    
+    out = bytearray()
+    _write_uint(out, message_id or 0)
+    _write_uint(out, channel_id or 0)
+    flags = 0
+    if message._timeout is not None:
+        flags |= _HAS_TIMEOUT
+    if message.embeds:
+        flags |= _HAS_EMBEDS
+    out.append(flags)
+    if message._timeout is not None:
+        out += _double.pack(message._timeout)
+    _write_optional_str(out, message.content)
+    if message.embeds:
+        _write_str(out, json.dumps([embed.to_dict() for embed in message.embeds], separators=(',', ':')))
+    
+    _write_uint(out, len(message.components))
+    for row in message.components:
+        _write_uint(out, len(row.components))
+        for component in row.components:
+            _write_component(out, component)
+    
+    _write_uint(out, len(handlers))
+    for custom_id, name in handlers.items():
+        _write_str(out, custom_id)
+        _write_str(out, name)
+    return bytes(out)
+
+def _owned(owner: Any, items: List[Any]) -> _TrackedList:
+    # A tracked list of freshly decoded items. They have no other parent yet,
+    # so they are linked to ``owner`` directly.
+    tracked = _TrackedList(None, items)
+    tracked._owner = owner
+    for item in items:
+        if isinstance(item, (Component, SelectOption)):
+            _set(item, '_parents', owner)
+    return tracked
+
+class _Reader:
+    # Decodes one record from ``data`` (bytes or a memoryview over a mapped
+    # file). Objects are built without going through __init__/__setattr__,
+    # which would drop caches that cannot exist yet.
+    __slots__ = ('data', 'pos')
+    
+    def __init__(self, data: Union[bytes, memoryview], pos: int = 0):
+        self.data = data
+        self.pos = pos
+    
+    def uint(self) -> int:
+        data = self.data
+        pos = self.pos
+        value = data[pos]
+        pos += 1
+        if value & 0x80:
+            value &= 0x7F
+            shift = 7
+            while True:
+                byte = data[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                if not byte & 0x80:
+                    break
+                shift += 7
+        self.pos = pos
+        return value
+    
+    def byte(self) -> int:
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
+    
+    def text(self) -> str:
+        data = self.data
+        pos = self.pos
+        size = data[pos]
+        if size & 0x80:
+            size = self.uint()
+            pos = self.pos
+        else:
+            pos += 1
+        self.pos = pos + size
+        return str(data[pos:pos + size], 'utf-8')
+    
+    def optional_text(self) -> Optional[str]:
+        size = self.uint()
+        if not size:
+            return None
+        pos = self.pos
+        self.pos = pos + size - 1
+        return str(self.data[pos:pos + size - 1], 'utf-8')
+    
+    def emoji(self) -> Union[str, discord.PartialEmoji]:
+        kind = self.byte()
+        if kind == 0:
+            return self.text()
+        name = self.optional_text()
+        return discord.PartialEmoji(name=name, id=self.uint() or None, animated=kind == 2)
+    
+    def component(self) -> Component:
+        tag = self.byte()
+        if tag == _OTHER:
+            return component_from_dict(json.loads(self.text()))
+        
+        flags = self.byte()
+        if tag == _BUTTON:
+            component = Button.__new__(Button)
+            _set(component, '_style', _BUTTON_STYLES[self.byte()])
+            _set(component, 'label', self.text() if flags & _HAS_LABEL else None)
+            _set(component, 'emoji', self.emoji() if flags & _HAS_EMOJI else None)
+            _set(component, 'url', self.text() if flags & _HAS_URL else None)
+            _set(component, 'custom_id', self.text() if flags & _HAS_CUSTOM_ID else None)
+            _set(component, 'disabled', bool(flags & _DISABLED))
+            _set(component, 'row', None)
+            return component
+        
+        if tag == _TEXT_INPUT:
+            component = TextInput.__new__(TextInput)
+            _set(component, 'custom_id', self.text())
+            _set(component, 'label', self.text())
+            _set(component, '_style', _TEXT_STYLES[self.byte()])
+            _set(component, 'placeholder', self.text() if flags & _HAS_PLACEHOLDER else None)
+            _set(component, 'min_length', self.uint() if flags & _HAS_MIN_LENGTH else None)
+            _set(component, 'max_length', self.uint() if flags & _HAS_MAX_LENGTH else None)
+            _set(component, 'required', bool(flags & _REQUIRED))
+            _set(component, 'default', self.text() if flags & _HAS_VALUE else None)
+            _set(component, 'disabled', bool(flags & _DISABLED))
+            return component
+        
+        if tag == _SELECT:
+            cls = SelectMenu
+        elif tag == _CHANNEL_SELECT:
+            cls = ChannelSelect
+        else:
+            cls = _SIMPLE_SELECTS.get(tag)
+            if cls is None:
+                raise ValueError(f'Unknown component tag {tag} in snapshot')
+        
+        component = cls.__new__(cls)
+        _set(component, 'custom_id', self.text())
+        _set(component, 'min_values', self.uint())
+        _set(component, 'max_values', self.uint())
+        _set(component, 'placeholder', self.text() if flags & _HAS_PLACEHOLDER else None)
+        _set(component, 'disabled', bool(flags & _DISABLED))
+        _set(component, 'row', None)
+        
+        if tag == _SELECT:
+            options = []
+            for _ in range(self.uint()):
+                flags = self.byte()
+                option = SelectOption.__new__(SelectOption)
+                _set(option, 'label', self.text())
+                _set(option, 'value', self.text())
+                _set(option, 'description', self.text() if flags & _HAS_DESCRIPTION else None)
+                _set(option, 'emoji', self.emoji() if flags & _HAS_EMOJI else None)
+                _set(option, 'default', bool(flags & _DEFAULT))
+                options.append(option)
+            _set(component, 'options', _owned(component, options))
+        elif tag == _CHANNEL_SELECT:
+            channel_types = [_CHANNEL_TYPES[self.uint()] for _ in range(self.uint())]
+            _set(component, 'channel_types', _owned(component, channel_types))
+        return component
+    
+    def record(self, handlers: Optional[Dict[str, Callable]]) -> Snapshot:
+        message_id = self.uint() or None
+        channel_id = self.uint() or None
+        flags = self.byte()
+        timeout = None
+        if flags & _HAS_TIMEOUT:
+            timeout = _double.unpack_from(self.data, self.pos)[0]
+            self.pos += _double.size
+        content = self.optional_text()
+        embeds = None
+        if flags & _HAS_EMBEDS:
+            embeds = [discord.Embed.from_dict(embed) for embed in json.loads(self.text())]
+        
+        message = ComponentMessage(content=content, embeds=embeds, timeout=timeout)
+        rows = []
+        for _ in range(self.uint()):
+            row = ActionRow.__new__(ActionRow)
+            _set(row, 'components', _owned(row, [self.component() for _ in range(self.uint())]))
+            rows.append(row)
+        message.components.extend(rows)
+        
+        names = {}
+        for _ in range(self.uint()):
+            custom_id = self.text()
+            names[custom_id] = self.text()
+        if handlers:
+            for custom_id, name in names.items():
+                func = handlers.get(name)
+                if func is not None:
+                    message._listeners[custom_id] = func
+        return Snapshot(message, names, message_id, channel_id)
+
+def decode_snapshot(data: Union[bytes, memoryview], *, handlers: Optional[Dict[str, Callable]] = None) -> Snapshot:
+    # Decodes a record made by encode_snapshot. ``handlers`` maps handler
+    # names to callables, which are attached as the message's listeners.
+    reader = _Reader(data)
+    try:
+        snapshot = reader.record(handlers)
+    except (IndexError, KeyError, UnicodeDecodeError, struct.error) as error:
+        raise ValueError(f'Malformed snapshot record: {error!r}') from None
+    if reader.pos != len(data):
+        raise ValueError('Malformed snapshot record: trailing data')
+    return snapshot
+
+class SnapshotWriter:
+    # Streams records to a binary file object, header first.
+    def __init__(self, fp: BinaryIO):
+        self.fp = fp
+        self.count = 0
+        fp.write(_HEADER)
+    
+    def write(self, message: Union[ComponentMessage, Snapshot], **kwargs: Any) -> None:
+        if isinstance(message, Snapshot):
+            kwargs = {'handlers': message.handlers, 'message_id': message.message_id, 'channel_id': message.channel_id, **kwargs}
+            message = message.message
+        record = encode_snapshot(message, **kwargs)
+        frame = bytearray()
+        _write_uint(frame, len(record))
+        frame += record
+        self.fp.write(frame)
+        self.count += 1
+    
+    def write_many(self, messages: Iterable[Union[ComponentMessage, Snapshot]]) -> int:
+        count = self.count
+        for message in messages:
+            self.write(message)
+        return self.count - count
+
+def dump_snapshots(messages: Iterable[Union[ComponentMessage, Snapshot]], fp: BinaryIO) -> int:
+    return SnapshotWriter(fp).write_many(messages)
+
+def _check_header(data: Union[bytes, memoryview]) -> None:
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError('Not a component snapshot stream')
+    if len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+        raise ValueError(f'Unsupported snapshot version, expected {VERSION}')
+
+def _frame_size(data: Union[bytes, memoryview], pos: int) -> Tuple[Optional[int], int]:
+    # (record size, position after the prefix); (None, pos) if the prefix is cut off.
+    value = 0
+    shift = 0
+    end = len(data)
+    while pos < end:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+    return None, pos
+
+def _iter_buffer(data: Union[bytes, memoryview], handlers: Optional[Dict[str, Callable]]) -> Iterator[Snapshot]:
+    _check_header(data)
+    pos = len(_HEADER)
+    end = len(data)
+    while pos < end:
+        size, start = _frame_size(data, pos)
+        if size is None or start + size > end:
+            raise ValueError('Truncated snapshot stream')
+        pos = start + size
+        yield decode_snapshot(data[start:pos], handlers=handlers)
+
+def _iter_file(fp: BinaryIO, handlers: Optional[Dict[str, Callable]]) -> Iterator[Snapshot]:
+    # Reads in fixed-size chunks; only the records of one chunk are in memory.
+    buffer = fp.read(max(_READ_SIZE, len(_HEADER)))
+    _check_header(buffer)
+    buffer = buffer[len(_HEADER):]
+    eof = False
+    while True:
+        view = memoryview(buffer)
+        pos = 0
+        end = len(buffer)
+        while pos < end:
+            size, start = _frame_size(view, pos)
+            if size is None or start + size > end:
+                break
+            pos = start + size
+            yield decode_snapshot(view[start:pos], handlers=handlers)
+        view.release()
+        
+        buffer = buffer[pos:]
+        if eof:
+            if buffer:
+                raise ValueError('Truncated snapshot stream')
+            return
+        chunk = fp.read(max(_READ_SIZE, len(buffer)))
+        if not chunk:
+            eof = True
+        buffer += chunk
+
+def load_snapshots(
+    source: Union[BinaryIO, bytes, bytearray, memoryview, mmap.mmap],
+    *,
+    handlers: Optional[Dict[str, Callable]] = None
+) -> Iterator[Snapshot]:
+    # Streams the records of a snapshot file object or an in-memory (or
+    # memory-mapped) buffer, which is decoded in place without copying.
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return _iter_buffer(memoryview(source), handlers)
+    return _iter_file(source, handlers)
+
+def load_snapshot_file(path: str, *, handlers: Optional[Dict[str, Callable]] = None) -> Iterator[Snapshot]:
+    # Memory-maps ``path`` and streams its records; the mapping is closed once
+    # the iterator is exhausted or closed.
+    with open(path, 'rb') as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield from _iter_buffer(view, handlers)
+            finally:
+                view.release()
@@ -0,0 +1,139 @@
+import discord
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple
+import string
+
+from .message import ComponentMessage
+from .models import ActionRow, _copy_payload
+
+__all__ = (
+    'Slot',
+    'ComponentTemplate'
+)
+
+_FORMAT = 0
+_VALUE = 1
+_NESTED = 2
+
+_formatter = string.Formatter()
+
+class Slot:
+    # Placeholder for a non-string value (``disabled``, ``default``,
+    # ``min_values`` ...) in a template layout. String fields use ``{name}``
+    # placeholders instead.
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __repr__(self) -> str:
+        return f'<Slot {self.name!r}>'
+    
+    def __deepcopy__(self, memo) -> 'Slot':
+        return self
+
+def _field_names(value: str) -> List[str]:
+    return [name for _, name, _, _ in _formatter.parse(value) if name is not None]
+
+def _compile(node: Any, names: set) -> Optional[List[Tuple[Any, int, Any]]]:
+    # Returns the substitutions to apply to ``node`` (a dict or list), or None
+    # when nothing below it is parameterized.
+    plan = []
+    items = node.items() if isinstance(node, dict) else enumerate(node)
+    
+    for key, value in items:
+        if isinstance(value, Slot):
+            names.add(value.name)
+            plan.append((key, _VALUE, value.name))
+        elif isinstance(value, str):
+            fields = _field_names(value)
+            if not fields:
+                continue
+            if any(not field.isidentifier() for field in fields):
+                raise ValueError(f'Template placeholders must be plain names, got {value!r}')
+            names.update(fields)
+            plan.append((key, _FORMAT, value))
+        elif isinstance(value, (dict, list)):
+            nested = _compile(value, names)
+            if nested is not None:
+                plan.append((key, _NESTED, nested))
+    
+    return plan or None
+
+def _render(node: Any, plan: List[Tuple[Any, int, Any]], params: Dict[str, Any]) -> Any:
+    # Copies only the containers on the path to a substitution; everything
+    # else is shared with the skeleton.
+    node = node.copy()
+    for key, kind, arg in plan:
+        if kind == _FORMAT:
+            node[key] = arg.format_map(params)
+        elif kind == _VALUE:
+            node[key] = params[arg]
+        else:
+            node[key] = _render(node[key], arg, params)
+    return node
+
+def _seed_caches(message: ComponentMessage, payload: Dict[str, Any]) -> None:
+    # The components were decoded from ``payload``, so it is already their
+    # serialized form.
+    for row, row_data in zip(message.components, payload.get('components', ())):
+        for component, component_data in zip(row.components, row_data['components']):
+            for option, option_data in zip(getattr(component, 'options', ()), component_data.get('options', ())):
+                object.__setattr__(option, '_cache', option_data)
+            object.__setattr__(component, '_cache', component_data)
+        object.__setattr__(row, '_cache', row_data)
+    # The message's own cache leaves out the embeds, which it serializes on
+    # every call.
+    object.__setattr__(message, '_cache', {key: value for key, value in payload.items() if key != 'embeds'})
+
+class ComponentTemplate:
+    # A ComponentMessage layout compiled once into a frozen payload skeleton.
+    # ``{name}`` placeholders in string fields and Slot values become named
+    # parameters; ``render`` produces a payload and ``instantiate`` a new
+    # ComponentMessage whose serialization cache is already filled.
+    #
+    # Limits that depend on a parameter (a label's length, ``min_values`` and
+    # the like) cannot be checked on the skeleton, and the seeded caches skip
+    # the checks of to_dict, so parameterized templates validate every
+    # instantiated message instead.
+    __slots__ = ('_skeleton', '_plan', '_timeout', 'names', 'defaults')
+    
+    def __init__(self, message: ComponentMessage, **defaults: Any):
+        names = set()
+        self._skeleton = message.to_dict()
+        self._plan = _compile(self._skeleton, names)
+        self._timeout = message._timeout
+        self.names: FrozenSet[str] = frozenset(names)
+        self.defaults = defaults
+    
+    def render(self, **params: Any) -> Dict[str, Any]:
+        # The payload is the caller's own; nothing in it is shared with the
+        # template.
+        return _copy_payload(self._payload(params))
+    
+    def _payload(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Shares everything but the substituted paths with the skeleton, so
+        # it is only used for the read-only caches of instantiated messages.
+        if self.defaults:
+            params = {**self.defaults, **params}
+        
+        missing = self.names.difference(params)
+        if missing:
+            raise TypeError(f'Missing template parameters: {", ".join(sorted(missing))}')
+        
+        if self._plan is None:
+            return self._skeleton
+        return _render(self._skeleton, self._plan, params)
+    
+    def instantiate(self, **params: Any) -> ComponentMessage:
+        payload = self._payload(params)
+        # Embed.from_dict keeps the nested lists (fields) it is given.
+        message = ComponentMessage(
+            content=payload.get('content'),
+            embeds=[discord.Embed.from_dict(_copy_payload(embed)) for embed in payload.get('embeds', ())],
+            components=[ActionRow.from_dict(row) for row in payload.get('components', ())],
+            timeout=self._timeout
+        )
+        if self._plan is not None:
+            message.validate()
+        _seed_caches(message, payload)
+        return message
@@ -0,0 +1,214 @@
+import discord
+from typing import Optional, List, Dict, Callable, Any, Hashable, Sequence, Tuple
+import asyncio
+import itertools
+import time
+
+__all__ = (
+    'FakeHTTPResponse',
+    'FakeTransport',
+    'FakeBot',
+    'FakeChannel',
+    'FakeMessage',
+    'FakeInteraction',
+    'button_interaction',
+    'select_interaction'
+)
+
+_ids = itertools.count(10**17)
+
+class FakeHTTPResponse:
+    __slots__ = ('status', 'reason', 'headers', 'data')
+    
+    def __init__(self, status: int, headers: Optional[Dict[str, str]] = None, data: Any = None):
+        self.status = status
+        self.reason = 'Too Many Requests' if status == 429 else 'OK'
+        self.headers = headers or {}
+        self.data = data
+
+class FakeTransport:
+    # Local stand-in for Discord's REST API. Each bucket accepts ``limit``
+    # requests per ``per`` seconds and answers the rest with a 429 carrying
+    # the usual X-RateLimit-* headers, raised as discord.HTTPException.
+    def __init__(self, *, limit: int = 5, per: float = 5.0, latency: float = 0.0, clock=time.monotonic):
+        self.limit = limit
+        self.per = per
+        self.latency = latency
+        self._clock = clock
+        self._windows: Dict[Hashable, List[float]] = {}
+        self.requests: List[Tuple[Hashable, Any]] = []
+        self.rate_limited = 0
+    
+    async def request(self, bucket: Hashable, payload: Any = None) -> FakeHTTPResponse:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        
+        now = self._clock()
+        window = self._windows.get(bucket)
+        if window is None or now >= window[1]:
+            window = self._windows[bucket] = [0, now + self.per]
+        
+        reset_after = f'{max(window[1] - now, 0):.3f}'
+        if window[0] >= self.limit:
+            self.rate_limited += 1
+            response = FakeHTTPResponse(429, {
+                'X-RateLimit-Limit': str(self.limit),
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset-After': reset_after,
+                'X-RateLimit-Bucket': str(bucket),
+                'Retry-After': reset_after
+            })
+            raise discord.HTTPException(response, {'message': 'You are being rate limited.', 'retry_after': float(reset_after)})
+        
+        window[0] += 1
+        self.requests.append((bucket, payload))
+        return FakeHTTPResponse(200, {
+            'X-RateLimit-Limit': str(self.limit),
+            'X-RateLimit-Remaining': str(self.limit - int(window[0])),
+            'X-RateLimit-Reset-After': reset_after,
+            'X-RateLimit-Bucket': str(bucket)
+        }, payload)
+
+class FakeBot:
+    # Just enough of commands.Bot for listeners: ``listen``/``add_listener``
+    # and an awaitable ``emit`` that runs every listener in order.
+    def __init__(self):
+        self.listeners: Dict[str, List[Callable]] = {}
+        self.user = None
+    
+    def add_listener(self, func: Callable, name: Optional[str] = None) -> None:
+        self.listeners.setdefault(name or func.__name__, []).append(func)
+    
+    def listen(self, name: Optional[str] = None):
+        def decorator(func):
+            self.add_listener(func, name)
+            return func
+        return decorator
+    
+    async def emit(self, event: str, *args: Any) -> None:
+        for listener in self.listeners.get(event, ()):
+            await listener(*args)
+
+class FakeChannel:
+    def __init__(self, id: Optional[int] = None, *, transport: Optional[FakeTransport] = None):
+        self.id = id if id is not None else next(_ids)
+        self.transport = transport
+        self.sent: List[Dict[str, Any]] = []
+    
+    async def send(self, content: Optional[str] = None, **kwargs) -> 'FakeMessage':
+        kwargs['content'] = content
+        if self.transport is not None:
+            await self.transport.request(('channel', self.id), kwargs)
+        self.sent.append(kwargs)
+        return FakeMessage(self, **kwargs)
+
+class FakeMessage:
+    def __init__(self, channel: FakeChannel, id: Optional[int] = None, **fields: Any):
+        self.id = id if id is not None else next(_ids)
+        self.channel = channel
+        self.edits: List[Dict[str, Any]] = []
+        self.fields = fields
+    
+    async def edit(self, **kwargs) -> 'FakeMessage':
+        if self.channel.transport is not None:
+            await self.channel.transport.request(('channel', self.channel.id), kwargs)
+        self.edits.append(kwargs)
+        self.fields.update(kwargs)
+        return self
+
+class _FakeResponse:
+    def __init__(self, interaction: 'FakeInteraction'):
+        self._parent = interaction
+        self._done = False
+        self.type: Optional[str] = None
+    
+    def is_done(self) -> bool:
+        return self._done
+    
+    async def _respond(self, kind: str, kwargs: Dict[str, Any]) -> None:
+        if self._done:
+            raise discord.InteractionResponded(self._parent)
+        self._done = True
+        self.type = kind
+        await self._parent._request(kind, kwargs)
+    
+    async def defer(self, *, ephemeral: bool = False, thinking: bool = False) -> None:
+        await self._respond('defer', {'ephemeral': ephemeral, 'thinking': thinking})
+    
+    async def send_message(self, content: Optional[str] = None, **kwargs) -> None:
+        kwargs['content'] = content
+        await self._respond('send_message', kwargs)
+    
+    async def edit_message(self, **kwargs) -> None:
+        await self._respond('edit_message', kwargs)
+
+class _FakeFollowup:
+    def __init__(self, interaction: 'FakeInteraction'):
+        self._parent = interaction
+    
+    async def send(self, content: Optional[str] = None, **kwargs) -> FakeMessage:
+        kwargs['content'] = content
+        await self._parent._request('followup', kwargs)
+        return FakeMessage(self._parent.channel, **kwargs)
+
+class FakeInteraction(discord.Interaction):
+    # Offline stand-in for a component discord.Interaction. Every response
+    # is recorded in ``calls`` as ``(kind, kwargs)`` and, when a transport is
+    # given, goes through it on the interaction's webhook bucket. It passes
+    # ``isinstance`` checks as a real subclass, but discord.Interaction's
+    # __init__ (which needs a connection state) is never called, so only the
+    # attributes set here are available.
+    
+    # Replace discord.Interaction's state-backed properties with plain
+    # attributes that can be set per instance.
+    client = None
+    guild = None
+    response = None
+    followup = None
+    
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        *,
+        client: Any = None,
+        user: Any = None,
+        guild: Any = None,
+        channel: Optional[FakeChannel] = None,
+        message: Optional[FakeMessage] = None,
+        transport: Optional[FakeTransport] = None
+    ):
+        # A real snowflake for "now", so latency measured from the
+        # interaction's creation time is meaningful.
+        self.id = discord.utils.time_snowflake(discord.utils.utcnow()) | (next(_ids) & 0x3FFFFF)
+        self.type = discord.InteractionType.component
+        self.application_id = 1
+        self.token = f'token-{self.id}'
+        self.data = data
+        self.client = client
+        self.user = user
+        self.guild = guild
+        self.guild_id = getattr(guild, 'id', None)
+        self.channel = channel if channel is not None else FakeChannel(transport=transport)
+        self.message = message if message is not None else FakeMessage(self.channel)
+        self.transport = transport
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.response = _FakeResponse(self)
+        self.followup = _FakeFollowup(self)
+    
+    async def _request(self, kind: str, kwargs: Dict[str, Any]) -> None:
+        if self.transport is not None:
+            await self.transport.request(('webhook', self.token), kwargs)
+        self.calls.append((kind, kwargs))
+    
+    async def edit_original_response(self, **kwargs) -> FakeMessage:
+        await self._request('edit_original_response', kwargs)
+        return self.message
+    
+    async def original_response(self) -> FakeMessage:
+        return self.message
+
+def button_interaction(custom_id: str, **kwargs) -> FakeInteraction:
+    return FakeInteraction({'component_type': 2, 'custom_id': custom_id}, **kwargs)
+
+def select_interaction(custom_id: str, values: Sequence[str] = (), *, component_type: int = 3, **kwargs) -> FakeInteraction:
+    return FakeInteraction({'component_type': component_type, 'custom_id': custom_id, 'values': list(values)}, **kwargs)
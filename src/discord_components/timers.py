@@ -0,0 +1,238 @@
+from typing import Optional, List, Dict, Callable, Any, Hashable, Set, Tuple
+import asyncio
+import inspect
+import logging
+import math
+import time
+
+from .session import disable_components
+
+_log = logging.getLogger(__name__)
+
+ExpireCallback = Callable[[List[Tuple[Hashable, Any]]], Any]
+
+__all__ = (
+    'TimerWheel',
+    'disable_expired'
+)
+
+async def disable_expired(expired: List[Tuple[Hashable, Any]]) -> None:
+    # An on_expire callback that disables the components of every expired
+    # ComponentMessage and edits them concurrently.
+    await asyncio.gather(*(disable_components(key, message, 'expired') for key, message in expired))
+
+class _Timer:
+    __slots__ = ('key', 'value', 'timeout', 'deadline', 'slot')
+    
+    def __init__(self, key: Hashable, value: Any, timeout: float, deadline: float, slot: int):
+        self.key = key
+        self.value = value
+        self.timeout = timeout
+        self.deadline = deadline
+        self.slot = slot
+
+class TimerWheel:
+    # Expiry for many timers on one task: a hashed timing wheel of ``slots``
+    # buckets, each covering ``resolution`` seconds, swept once per tick.
+    #
+    # ``reset`` only moves a timer's deadline forward; the timer stays in its
+    # bucket and is moved to the right one when that bucket is swept, so an
+    # interaction costs O(1) however many timers are live. Timers longer than
+    # the wheel (``slots * resolution``) simply go round again. Expiry is
+    # late by at most one ``resolution``.
+    #
+    # Everything that expires in a sweep is passed to ``on_expire`` as one list
+    # of ``(key, value)`` pairs; it may be a coroutine function. After it,
+    # values with a ``release`` method (ComponentMessage) have it called.
+    def __init__(
+        self,
+        *,
+        timeout: float = 180.0,
+        resolution: float = 1.0,
+        slots: int = 512,
+        on_expire: Optional[ExpireCallback] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if timeout <= 0:
+            raise ValueError('timeout must be positive')
+        if resolution <= 0:
+            raise ValueError('resolution must be positive')
+        if slots < 1:
+            raise ValueError('slots must be at least 1')
+        
+        self.timeout = timeout
+        self.resolution = resolution
+        self.on_expire = on_expire
+        self._clock = clock
+        self._slots: List[Dict[Hashable, _Timer]] = [{} for _ in range(slots)]
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._tick = self._tick_of(clock())
+        self._task: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {'scheduled': 0, 'reset': 0, 'cancelled': 0, 'expired': 0, 'sweeps': 0}
+    
+    def __len__(self) -> int:
+        return len(self._timers)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+    
+    @property
+    def pending(self) -> int:
+        return len(self._timers)
+    
+    def _tick_of(self, when: float) -> int:
+        return math.floor(when / self.resolution)
+    
+    def _place(self, timer: _Timer) -> None:
+        # The bucket of the first tick at or after the deadline.
+        tick = max(math.ceil(timer.deadline / self.resolution), self._tick + 1)
+        timer.slot = tick % len(self._slots)
+        self._slots[timer.slot][timer.key] = timer
+    
+    def schedule(self, key: Hashable, value: Any = None, timeout: Optional[float] = None) -> None:
+        # Arms (or re-arms) the timer for ``key``.
+        self.cancel(key)
+        if timeout is None:
+            timeout = self.timeout
+        
+        now = self._clock()
+        if not self._timers:
+            # Nothing to sweep while the wheel was empty; catch up at once.
+            self._tick = self._tick_of(now)
+        timer = _Timer(key, value, timeout, now + timeout, 0)
+        self._timers[key] = timer
+        self._place(timer)
+        self.stats['scheduled'] += 1
+        self._start()
+    
+    def reset(self, key: Hashable) -> bool:
+        timer = self._timers.get(key)
+        if timer is None:
+            return False
+        
+        timer.deadline = self._clock() + timer.timeout
+        self.stats['reset'] += 1
+        return True
+    
+    def cancel(self, key: Hashable) -> Any:
+        # Removes a timer without expiring it and returns its value.
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return None
+        
+        del self._slots[timer.slot][key]
+        self.stats['cancelled'] += 1
+        return timer.value
+    
+    def deadline(self, key: Hashable) -> Optional[float]:
+        timer = self._timers.get(key)
+        return timer.deadline if timer is not None else None
+    
+    def advance(self, now: Optional[float] = None) -> int:
+        # Sweeps every bucket up to ``now`` and returns the number of expired
+        # timers. Called by the wheel's task; call it directly to drive the
+        # wheel by hand.
+        if now is None:
+            now = self._clock()
+        
+        target = self._tick_of(now)
+        if target <= self._tick:
+            return 0
+        
+        slots = self._slots
+        timers = self._timers
+        expired = []
+        moved = []
+        # Past one full turn every bucket has been swept once.
+        for tick in range(self._tick + 1, min(target, self._tick + len(slots)) + 1):
+            bucket = slots[tick % len(slots)]
+            if not bucket:
+                continue
+            for timer in bucket.values():
+                if timer.deadline <= now:
+                    del timers[timer.key]
+                    expired.append((timer.key, timer.value))
+                else:
+                    moved.append(timer)
+            bucket.clear()
+        
+        self._tick = target
+        for timer in moved:
+            self._place(timer)
+        
+        self.stats['sweeps'] += 1
+        if expired:
+            self.stats['expired'] += len(expired)
+            self._expire(expired)
+        return len(expired)
+    
+    def _expire(self, expired: List[Tuple[Hashable, Any]]) -> None:
+        result = None
+        if self.on_expire is not None:
+            try:
+                result = self.on_expire(expired)
+            except Exception as error:
+                _log.error('Ignoring exception in timer expiry callback', exc_info=error)
+        
+        if not inspect.isawaitable(result):
+            self._release(expired)
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if inspect.iscoroutine(result):
+                result.close()
+            self._release(expired)
+            return
+        
+        task = loop.create_task(self._finish(result, expired))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _finish(self, result: Any, expired: List[Tuple[Hashable, Any]]) -> None:
+        try:
+            await result
+        except Exception as error:
+            _log.error('Ignoring exception in timer expiry callback', exc_info=error)
+        finally:
+            self._release(expired)
+    
+    def _release(self, expired: List[Tuple[Hashable, Any]]) -> None:
+        for _, value in expired:
+            release = getattr(value, 'release', None)
+            if release is not None:
+                try:
+                    release()
+                except Exception as error:
+                    _log.error('Ignoring exception releasing an expired timer value', exc_info=error)
+    
+    def _start(self) -> None:
+        # The sweeping task runs while timers are pending and is started again
+        # by the next schedule once it has exited.
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run())
+    
+    async def _run(self) -> None:
+        while self._timers:
+            await asyncio.sleep(max((self._tick + 1) * self.resolution - self._clock(), 0))
+            try:
+                self.advance()
+            except Exception as error:
+                _log.error('Ignoring exception in timer wheel sweep', exc_info=error)
+    
+    async def close(self) -> None:
+        # Stops the sweeping task and drops every timer without expiring it.
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for bucket in self._slots:
+            bucket.clear()
+        self._timers.clear()
@@ -0,0 +1,71 @@
+import discord
+from discord import ui
+from typing import Any, Dict, TYPE_CHECKING
+
+from .models import (
+    Button,
+    ChannelSelect,
+    Component,
+    MentionableSelect,
+    RoleSelect,
+    SelectMenu,
+    UserSelect
+)
+
+if TYPE_CHECKING:
+    from .message import ComponentMessage
+
+# The bridge between payload models and discord.ui: which view item each
+# component becomes, and the view of a ComponentMessage on a TimerWheel.
+# ComponentMessage imports this module on its first to_view call.
+
+_VIEW_ITEM_TYPES = {
+    Button: (ui.Button, ('style', 'label', 'emoji', 'url', 'custom_id', 'disabled')),
+    SelectMenu: (ui.Select, ('custom_id', 'placeholder', 'min_values', 'max_values', 'disabled', 'options')),
+    ChannelSelect: (ui.ChannelSelect, ('custom_id', 'placeholder', 'min_values', 'max_values', 'disabled', 'channel_types')),
+    RoleSelect: (ui.RoleSelect, ('custom_id', 'placeholder', 'min_values', 'max_values', 'disabled')),
+    UserSelect: (ui.UserSelect, ('custom_id', 'placeholder', 'min_values', 'max_values', 'disabled')),
+    MentionableSelect: (ui.MentionableSelect, ('custom_id', 'placeholder', 'min_values', 'max_values', 'disabled'))
+}
+
+def _view_item_type(cls: type):
+    for base in cls.__mro__:
+        item_type = _VIEW_ITEM_TYPES.get(base)
+        if item_type is not None:
+            return item_type
+    return None
+
+def _view_item_kwargs(component: Component, fields: tuple) -> Dict[str, Any]:
+    kwargs = {name: getattr(component, name) for name in fields}
+    
+    if 'options' in kwargs:
+        kwargs['options'] = [
+            discord.SelectOption(
+                label=opt.label,
+                value=opt.value,
+                description=opt.description,
+                emoji=opt.emoji,
+                default=opt.default
+            ) for opt in kwargs['options']
+        ]
+    if 'channel_types' in kwargs:
+        kwargs['channel_types'] = [
+            discord.ChannelType(channel_type) if type(channel_type) is int else channel_type
+            for channel_type in kwargs['channel_types']
+        ]
+    
+    return kwargs
+
+class _TimedView(ui.View):
+    # The view of a ComponentMessage whose expiry is owned by a TimerWheel:
+    # it has no timeout task of its own and every interaction resets the
+    # message's timer.
+    def __init__(self, message: 'ComponentMessage'):
+        super().__init__(timeout=None)
+        self._component_message = message
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        message = self._component_message
+        if message._timers is not None:
+            message._timers.reset(message)
+        return True
@@ -0,0 +1,47 @@
+from discord_components import OptionCatalog, SelectOption
+
+
+def colours():
+    return OptionCatalog([
+        SelectOption(label='Red apple', value='red'),
+        SelectOption(label='Green apple', value='green'),
+        SelectOption(label='Red wine', value='wine')
+    ])
+
+
+def test_search():
+    catalog = colours()
+    assert [option.value for option in catalog.search('red')] == ['red', 'wine']
+    assert [option.value for option in catalog.search('ap gr')] == ['green']
+
+
+def test_remove_after_option_was_edited():
+    catalog = colours()
+    catalog.get('red').label = 'blue'
+    assert catalog.remove('red')
+    assert [option.value for option in catalog.search('red')] == ['wine']
+    assert catalog.search('blue') == []
+
+
+def test_select_menu_does_not_link_catalog_options():
+    catalog = colours()
+    for _ in range(100):
+        menu = catalog.select_menu('red', custom_id='colour')
+    assert catalog.get('red')._parents is None
+    assert [option['value'] for option in menu.to_dict()['options']] == ['red', 'wine']
+
+
+def test_duplicate_values_in_constructor():
+    catalog = OptionCatalog([SelectOption(label='foo', value='x'), SelectOption(label='bar', value='x')])
+    assert len(catalog) == 1
+    assert catalog.search('foo') == []
+    assert [option.label for option in catalog.search('bar')] == ['bar']
+
+
+def test_duplicate_values_in_extend():
+    catalog = OptionCatalog([SelectOption(label='zebra', value='z'), SelectOption(label='yak', value='y')])
+    catalog.extend([SelectOption(label='alpha', value='x'), SelectOption(label='beta', value='x')])
+    assert catalog._tokens == sorted(set(catalog._tokens))
+    assert [option.value for option in catalog.search('yak')] == ['y']
+    assert catalog.search('alpha') == []
+    assert [option.label for option in catalog.search('beta')] == ['beta']
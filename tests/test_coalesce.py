@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from discord_components import EditCoalescer
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+    
+    async def edit(self, **kwargs):
+        self.calls.append(kwargs)
+        return len(self.calls)
+
+
+def test_edits_within_the_window_are_merged():
+    recorder = Recorder()
+    
+    async def main():
+        coalescer = EditCoalescer(recorder.edit, window=0.01)
+        return await asyncio.gather(
+            coalescer.submit(content='a'),
+            coalescer.submit(content='b', embeds=[]),
+            coalescer.submit(content='c')
+        )
+    
+    assert asyncio.run(main()) == [1, 1, 1]
+    assert recorder.calls == [{'content': 'c', 'embeds': []}]
+
+
+def test_max_batch_flushes_at_once():
+    recorder = Recorder()
+    
+    async def main():
+        coalescer = EditCoalescer(recorder.edit, window=10, max_batch=2)
+        await asyncio.wait_for(asyncio.gather(coalescer.submit(n=1), coalescer.submit(n=2)), 1)
+    
+    asyncio.run(main())
+    assert recorder.calls == [{'n': 2}]
+
+
+def test_max_latency_bounds_a_busy_window():
+    recorder = Recorder()
+    
+    async def main():
+        coalescer = EditCoalescer(recorder.edit, window=0.05, max_latency=0.1)
+        waiters = []
+        for n in range(8):
+            waiters.append(asyncio.ensure_future(coalescer.submit(n=n)))
+            await asyncio.sleep(0.03)
+        await asyncio.gather(*waiters)
+    
+    asyncio.run(main())
+    assert len(recorder.calls) > 1
+    assert recorder.calls[-1] == {'n': 7}
+
+
+def test_flush_and_errors():
+    async def fail(**kwargs):
+        raise RuntimeError('edit failed')
+    
+    async def main():
+        coalescer = EditCoalescer(fail, window=10)
+        waiter = asyncio.ensure_future(coalescer.submit(content='x'))
+        await asyncio.sleep(0)
+        assert coalescer.pending == 1
+        with pytest.raises(RuntimeError):
+            await coalescer.flush()
+        with pytest.raises(RuntimeError):
+            await waiter
+        assert await coalescer.flush() is None
+    
+    asyncio.run(main())
@@ -0,0 +1,21 @@
+import pytest
+
+from discord_components import CustomIdCodec
+
+
+def test_reregistering_the_same_codec():
+    first = CustomIdCodec('reregister', {'page': int}, secret=b'key')
+    second = CustomIdCodec('reregister', {'page': int}, secret=b'key')
+    assert second.decode(first.encode(page=3)).page == 3
+
+
+def test_reregistering_with_different_settings():
+    CustomIdCodec('conflict', {'page': int}, secret=b'key')
+    with pytest.raises(ValueError):
+        CustomIdCodec('conflict', {'page': int, 'user': int}, secret=b'key')
+    with pytest.raises(ValueError):
+        CustomIdCodec('conflict', {'page': int}, secret=b'other')
+    with pytest.raises(ValueError):
+        CustomIdCodec('conflict', {'page': int})
+    with pytest.raises(ValueError):
+        CustomIdCodec('conflict', {'page': int}, secret=b'key', mac_size=8)
@@ -0,0 +1,126 @@
+import asyncio
+import types
+
+import discord
+
+from discord_components import Button, ComponentMessage, OutboundScheduler
+from discord_components.testing import FakeChannel, FakeInteraction, button_interaction
+
+
+def test_broadcast_builds_a_view_per_copy():
+    message = ComponentMessage(content='Vote', components=[[Button(label='Yes', custom_id='yes')]])
+    
+    @message.on_interaction('yes')
+    async def yes(interaction):
+        pass
+    
+    channels = [FakeChannel() for _ in range(3)]
+    result = asyncio.run(message.broadcast(channels))
+    assert len(result) == 3
+    
+    views = [channel.sent[0]['view'] for channel in channels]
+    assert len({id(view) for view in views}) == 3
+    assert all(view.children[0].callback is yes for view in views)
+
+
+def test_broadcast_without_listeners_shares_one_stopped_view():
+    message = ComponentMessage(content='News', components=[[Button(label='Read', custom_id='read')]])
+    channels = [FakeChannel() for _ in range(3)]
+    asyncio.run(message.broadcast(channels))
+    
+    views = [channel.sent[0]['view'] for channel in channels]
+    assert all(view is views[0] for view in views)
+    assert views[0].is_finished()
+    assert views[0].children[0].custom_id == 'read'
+
+
+def test_broadcast_records_bad_results_per_target():
+    class Broken(FakeChannel):
+        async def send(self, content=None, **kwargs):
+            return None
+    
+    channels = [FakeChannel(), Broken(), FakeChannel()]
+    result = asyncio.run(ComponentMessage(content='Hi').broadcast(channels))
+    assert len(result) == 2
+    assert [target for target, _ in result.failures] == [channels[1]]
+
+
+def test_broadcast_to_user_uses_dm_channel_bucket():
+    channel = FakeChannel()
+    state = types.SimpleNamespace(_get_private_channel_by_user=lambda user_id: channel)
+    user = discord.User(state=state, data={'id': '5', 'username': 'a', 'discriminator': '0', 'avatar': None, 'global_name': None})
+    buckets = []
+    
+    class Scheduler(OutboundScheduler):
+        def submit(self, call, *, bucket, priority):
+            buckets.append(bucket)
+            return super().submit(call, bucket=bucket, priority=priority)
+    
+    async def main():
+        scheduler = Scheduler()
+        message = ComponentMessage(content='Hello', scheduler=scheduler)
+        result = await message.broadcast([user])
+        await scheduler.close()
+        return result
+    
+    result = asyncio.run(main())
+    assert len(result) == 1
+    assert channel.sent
+    assert buckets == [('channel', channel.id)]
+
+
+def test_send_to_fake_interaction():
+    interaction = button_interaction('open')
+    assert isinstance(interaction, discord.Interaction)
+    assert type(interaction) is FakeInteraction
+    
+    message = ComponentMessage(content='Hello')
+    asyncio.run(message.send(interaction))
+    assert interaction.calls[0][0] == 'send_message'
+    assert interaction.response.is_done()
+
+
+def test_to_dict_returns_a_copy():
+    message = ComponentMessage(content='Hello', components=[[Button(label='Yes', custom_id='yes')]])
+    data = message.to_dict()
+    data['content'] = 'mutated'
+    data['components'][0]['components'][0]['label'] = 'mutated'
+    assert message.to_dict()['content'] == 'Hello'
+    assert message.to_dict()['components'][0]['components'][0]['label'] == 'Yes'
+
+
+def test_embeds_edited_in_place_are_serialized():
+    embed = discord.Embed(title='Before')
+    message = ComponentMessage(embeds=[embed])
+    assert message.to_dict()['embeds'][0]['title'] == 'Before'
+    embed.title = 'After'
+    assert message.to_dict()['embeds'][0]['title'] == 'After'
+
+
+def test_edits_send_only_changed_fields():
+    channel = FakeChannel()
+    ctx = types.SimpleNamespace(send=channel.send, channel=channel)
+    message = ComponentMessage(content='Hello', components=[[Button(label='Yes', custom_id='yes')]])
+    
+    async def main():
+        sent = await message.send(ctx)
+        stats = dict(ComponentMessage.edit_stats)
+        
+        assert await message.edit() is sent
+        assert sent.edits == []
+        assert ComponentMessage.edit_stats['suppressed'] == stats['suppressed'] + 1
+        
+        message.content = 'Bye'
+        await message.edit()
+        assert sent.edits == [{'content': 'Bye'}]
+        
+        message.components[0].components[0].label = 'No'
+        await message.edit()
+        assert list(sent.edits[1]) == ['view']
+        assert sent.edits[1]['view'].children[0].label == 'No'
+        
+        await message.edit(content='Bye')
+        assert sent.edits[2] == {'content': 'Bye'}
+        assert ComponentMessage.edit_stats['fields_skipped'] > stats['fields_skipped']
+    
+    asyncio.run(main())
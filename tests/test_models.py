@@ -0,0 +1,97 @@
+import pytest
+
+from discord_components import Button, ComponentMessage, LayoutError, SelectMenu, SelectOption
+from discord_components.models import ActionRow
+
+
+def test_default_serialization_keeps_baseline_checks():
+    assert Button(style=2).to_dict() == {'type': 2, 'style': 2, 'disabled': False}
+    assert Button(label='Hi').to_dict()['label'] == 'Hi'
+    assert ActionRow().to_dict() == {'type': 1, 'components': []}
+    assert SelectMenu.from_interaction({'custom_id': 'pick'}).to_dict()['options'] == []
+    
+    with pytest.raises(LayoutError):
+        Button(url='https://example.com', custom_id='a').to_dict()
+    with pytest.raises(LayoutError):
+        ActionRow(*[Button(label=str(n), custom_id=str(n)) for n in range(6)]).to_dict()
+
+
+def test_gap_rows_serialize():
+    message = ComponentMessage()
+    message.add_component(Button(label='Later', custom_id='later'), row=2)
+    assert [len(row['components']) for row in message.to_dict()['components']] == [0, 0, 1]
+
+
+def test_validate_checks_every_limit():
+    with pytest.raises(LayoutError):
+        Button(style=2).validate()
+    with pytest.raises(LayoutError):
+        ActionRow().validate()
+    with pytest.raises(LayoutError):
+        SelectMenu(custom_id='pick', options=[]).validate()
+    
+    message = ComponentMessage(components=[[Button(style=2), SelectMenu(custom_id='pick', options=[])]])
+    with pytest.raises(LayoutError) as info:
+        message.validate(strict=True)
+    assert len(info.value.errors) == 4
+    
+    select = SelectMenu(custom_id='pick', options=[SelectOption(label='a', value='a')])
+    assert select.freeze().verified
+
+
+def menu():
+    options = [SelectOption(label=name, value=name) for name in ('a', 'b')]
+    select = SelectMenu(custom_id='pick', options=options)
+    button = Button(label='Go', custom_id='go')
+    message = ComponentMessage(content='Menu', components=[[button], [select]])
+    return message, button, select, options
+
+
+def test_payloads_are_cached():
+    message, button, select, options = menu()
+    payload = message._payload()
+    assert message._payload() is payload
+    assert button._payload() is payload['components'][0]['components'][0]
+    assert options[0]._payload() is payload['components'][1]['components'][0]['options'][0]
+
+
+def test_attribute_change_invalidates_the_path_up():
+    message, button, select, options = menu()
+    payload = message._payload()
+    row = message.components[1]._payload()
+    first = button._payload()
+    
+    options[1].label = 'B'
+    assert button._payload() is first
+    assert message.components[1]._payload() is not row
+    assert message.to_dict()['components'][1]['components'][0]['options'][1]['label'] == 'B'
+    assert message._payload() is not payload
+
+
+def test_list_mutations_invalidate():
+    message, button, select, options = menu()
+    
+    payload = message._payload()
+    select.options.append(SelectOption(label='c', value='c'))
+    assert len(message._payload()['components'][1]['components'][0]['options']) == 3
+    assert message._payload() is not payload
+    
+    payload = message._payload()
+    message.add_component(Button(label='More', custom_id='more'), row=0)
+    assert [c['custom_id'] for c in message._payload()['components'][0]['components']] == ['go', 'more']
+    
+    message.remove_component('go')
+    assert [c['custom_id'] for c in message._payload()['components'][0]['components']] == ['more']
+    
+    message.clear_components()
+    assert 'components' not in message._payload()
+
+
+def test_shared_option_invalidates_every_parent():
+    option = SelectOption(label='a', value='a')
+    first = SelectMenu(custom_id='one', options=[option])
+    second = SelectMenu(custom_id='two', options=[option])
+    first._payload(), second._payload()
+    option.label = 'A'
+    assert first.to_dict()['options'][0]['label'] == 'A'
+    assert second.to_dict()['options'][0]['label'] == 'A'
@@ -0,0 +1,71 @@
+import asyncio
+
+import discord
+
+from discord_components import OutboundScheduler
+from discord_components.testing import FakeHTTPResponse
+
+
+def test_calls_without_headers_run_concurrently():
+    async def main():
+        scheduler = OutboundScheduler(concurrency=4)
+        release = asyncio.Event()
+        running = []
+        
+        async def call():
+            running.append(1)
+            await release.wait()
+        
+        futures = [scheduler.submit(call, bucket=('channel', 1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert len(running) == 3
+        release.set()
+        await asyncio.gather(*futures)
+        await scheduler.close()
+    
+    asyncio.run(main())
+
+
+def test_limit_is_forgotten_after_429_reset():
+    async def main():
+        scheduler = OutboundScheduler(concurrency=4)
+        attempts = []
+        
+        async def call():
+            attempts.append(1)
+            if len(attempts) == 1:
+                response = FakeHTTPResponse(429, {'Retry-After': '0.01'})
+                raise discord.HTTPException(response, {'message': 'You are being rate limited.'})
+        
+        await scheduler.run(call, bucket=('channel', 1))
+        assert scheduler.stats['retried'] == 1
+        
+        release = asyncio.Event()
+        running = []
+        
+        async def wait():
+            running.append(1)
+            await release.wait()
+        
+        futures = [scheduler.submit(wait, bucket=('channel', 1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert len(running) == 3
+        release.set()
+        await asyncio.gather(*futures)
+        await scheduler.close()
+    
+    asyncio.run(main())
+
+
+def test_idle_buckets_are_dropped():
+    async def main():
+        scheduler = OutboundScheduler()
+        
+        async def call():
+            return None
+        
+        await asyncio.gather(*(scheduler.run(call, bucket=('webhook', 1, str(n))) for n in range(50)))
+        assert not scheduler._buckets
+        await scheduler.close()
+    
+    asyncio.run(main())
@@ -0,0 +1,29 @@
+import asyncio
+
+from discord_components import ComponentMessage, PaginatedSelect
+
+
+def test_values_are_clamped_on_a_short_last_page():
+    select = PaginatedSelect(custom_id='items', source=[str(n) for n in range(30)], min_values=3, max_values=10)
+    message = ComponentMessage()
+    select.attach(message)
+    
+    async def main():
+        data = message.to_dict()['components'][0]['components'][0]
+        assert (len(data['options']), data['min_values'], data['max_values']) == (25, 3, 10)
+        
+        await select.next_page()
+        message.validate()
+        data = message.to_dict()['components'][0]['components'][0]
+        assert (len(data['options']), data['min_values'], data['max_values']) == (5, 3, 5)
+        
+        await select.previous_page()
+        assert (select.min_values, select.max_values) == (3, 10)
+    
+    asyncio.run(main())
+
+
+def test_min_values_follow_a_clamped_max():
+    select = PaginatedSelect(custom_id='items', source=['a', 'b'], min_values=4, max_values=6)
+    select.to_dict()
+    assert (select.min_values, select.max_values) == (2, 2)
@@ -0,0 +1,141 @@
+import asyncio
+import sys
+
+import pytest
+
+from discord_components import HandlerPool, InteractionRouter, component_handler, get_router
+from discord_components.testing import FakeBot, button_interaction
+
+
+def test_auto_defer_routed_handler():
+    bot = FakeBot()
+    
+    @component_handler(bot, 'slow', auto_defer=0.05)
+    async def slow(ctx):
+        await asyncio.sleep(0.2)
+    
+    interaction = button_interaction('slow')
+    asyncio.run(bot.emit('on_interaction', interaction))
+    assert interaction.response.is_done()
+    assert interaction.calls[0][0] == 'defer'
+
+
+def test_auto_defer_catch_all_handler():
+    bot = FakeBot()
+    
+    @component_handler(bot, auto_defer=0.05)
+    async def slow(ctx):
+        await asyncio.sleep(0.2)
+    
+    interaction = button_interaction('anything')
+    asyncio.run(bot.emit('on_interaction', interaction))
+    assert interaction.response.is_done()
+    assert interaction.calls[0][0] == 'defer'
+
+
+def test_auto_defer_not_armed_for_fast_handler():
+    bot = FakeBot()
+    
+    @component_handler(bot, auto_defer=0.05)
+    async def fast(ctx):
+        await ctx.reply('done')
+    
+    interaction = button_interaction('anything')
+    asyncio.run(bot.emit('on_interaction', interaction))
+    assert [kind for kind, _ in interaction.calls] == ['send_message']
+
+
+def test_routing_precedence():
+    router = InteractionRouter()
+    
+    async def exact(ctx):
+        pass
+    
+    async def short(ctx):
+        pass
+    
+    async def long(ctx):
+        pass
+    
+    async def pattern(ctx):
+        pass
+    
+    router.add_pattern_route(r'shop:.*', pattern)
+    router.add_prefix_route('shop:', short)
+    router.add_prefix_route('shop:item:', long)
+    router.add_route('shop:item:1', exact)
+    
+    assert router.resolve('shop:item:1') == (exact, None)
+    assert router.resolve('shop:item:2') == (long, None)
+    assert router.resolve('shop:cart') == (short, None)
+    
+    router.remove_prefix_route('shop:')
+    handler, match = router.resolve('shop:cart')
+    assert handler is pattern and match.group(0) == 'shop:cart'
+    assert router.resolve('other') == (None, None)
+
+
+def test_handlers_run_concurrently():
+    bot = FakeBot()
+    events = []
+    done = []
+    
+    @component_handler(bot, 'ping')
+    async def routed(ctx):
+        await asyncio.wait_for(events[0].wait(), 0.5)
+        done.append('routed')
+    
+    @component_handler(bot)
+    async def catch_all(ctx):
+        events[0].set()
+        done.append('catch_all')
+    
+    async def main():
+        events.append(asyncio.Event())
+        await bot.emit('on_interaction', button_interaction('ping'))
+    
+    asyncio.run(main())
+    assert sorted(done) == ['catch_all', 'routed']
+
+
+def test_errors_reach_bot_on_error():
+    errors = []
+    
+    class Bot(FakeBot):
+        async def on_error(self, event, *args):
+            errors.append((event, args, sys.exc_info()[1]))
+    
+    bot = Bot()
+    
+    @component_handler(bot, 'boom')
+    async def boom(ctx):
+        raise RuntimeError('boom')
+    
+    interaction = button_interaction('boom', client=bot)
+    asyncio.run(bot.emit('on_interaction', interaction))
+    event, args, error = errors[0]
+    assert event == 'on_interaction'
+    assert args == (interaction,)
+    assert isinstance(error, RuntimeError)
+
+
+def test_component_handler_pool():
+    bot = FakeBot()
+    pool = HandlerPool(workers=2)
+    handled = []
+    
+    @component_handler(bot, 'ping', pool=pool)
+    async def ping(ctx):
+        handled.append(ctx.custom_id)
+    
+    async def main():
+        await bot.emit('on_interaction', button_interaction('ping'))
+        await asyncio.sleep(0.01)
+        await pool.close()
+    
+    assert get_router(bot).pool is pool
+    asyncio.run(main())
+    assert handled == ['ping']
+    
+    with pytest.raises(ValueError):
+        get_router(bot, pool=HandlerPool())
@@ -0,0 +1,77 @@
+from discord_components import Button, ComponentMessage, SessionStore
+from discord_components.session import estimate_size
+
+
+def test_size_of_an_invalid_layout_does_not_raise():
+    message = ComponentMessage(components=[[Button(label=str(n), custom_id=str(n)) for n in range(6)]])
+    assert estimate_size(message) > 0
+    
+    store = SessionStore(max_bytes=1 << 20)
+    store.put(1, message)
+    assert store.get(1) is message
+
+
+class Value:
+    def __init__(self):
+        self.released = False
+    
+    def release(self):
+        self.released = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    evicted = []
+    store = SessionStore(ttl=10, clock=clock, on_evict=lambda *args: evicted.append(args))
+    first, second = Value(), Value()
+    store.put(1, first)
+    clock.now = 5
+    store.put(2, second)
+    
+    clock.now = 9
+    assert store.touch(1)
+    clock.now = 16
+    assert store.expire() == 1
+    assert evicted == [(2, second, 'expired')]
+    assert second.released and not first.released
+    assert store.get(1) is first
+    
+    clock.now = 100
+    assert store.get(1) is None
+    assert len(store) == 0
+    assert store.stats['expirations'] == 2
+
+
+def test_least_recently_used_entries_are_evicted():
+    evicted = []
+    store = SessionStore(max_entries=2, on_evict=lambda *args: evicted.append(args))
+    values = [Value() for _ in range(3)]
+    store.put(0, values[0])
+    store.put(1, values[1])
+    assert store.get(0) is values[0]
+    store.put(2, values[2])
+    
+    assert evicted == [(1, values[1], 'evicted')]
+    assert values[1].released
+    assert list(store) == [0, 2]
+    assert store.stats['evictions'] == 1
+    
+    assert store.pop(0) is values[0]
+    assert not values[0].released
+    assert len(evicted) == 1
+
+
+def test_max_bytes_evicts():
+    store = SessionStore(max_entries=None, max_bytes=10, sizeof=lambda value: 4)
+    for key in range(4):
+        store.put(key, Value())
+    assert list(store) == [2, 3]
+    assert store.bytes == 8
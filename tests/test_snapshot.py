@@ -0,0 +1,98 @@
+import io
+
+import discord
+import pytest
+
+from discord_components import Button, ComponentMessage, SelectMenu, SelectOption
+from discord_components.models import ChannelSelect, TextInput, UserSelect
+from discord_components.snapshot import decode_snapshot, dump_snapshots, encode_snapshot, handler_name, load_snapshots
+
+
+async def on_yes(interaction):
+    pass
+
+
+def make_message():
+    embed = discord.Embed(title='Poll', description='Pick one')
+    embed.add_field(name='a', value='b')
+    message = ComponentMessage(
+        content='Pick',
+        embeds=[embed],
+        timeout=60.0,
+        components=[
+            [
+                Button(label='Yes', custom_id='yes', style=discord.ButtonStyle.green, emoji='\N{THUMBS UP SIGN}'),
+                Button(label='Docs', url='https://example.com', style=discord.ButtonStyle.link),
+                Button(label='Off', custom_id='off', disabled=True)
+            ],
+            [
+                SelectMenu(
+                    custom_id='menu',
+                    placeholder='Choose',
+                    min_values=1,
+                    max_values=2,
+                    options=[
+                        SelectOption(label='One', value='1', description='first', default=True),
+                        SelectOption(label='Two', value='2')
+                    ]
+                )
+            ],
+            [UserSelect(custom_id='user')],
+            [ChannelSelect(custom_id='channel', channel_types=[discord.ChannelType.text])]
+        ]
+    )
+    message.on_interaction('yes')(on_yes)
+    return message
+
+
+def test_round_trip():
+    message = make_message()
+    data = message.snapshot()
+    copy = ComponentMessage.from_snapshot(data, handlers={handler_name(on_yes): on_yes})
+    
+    assert copy.to_dict() == message.to_dict()
+    assert copy.content == 'Pick'
+    assert copy.embeds[0].to_dict() == message.embeds[0].to_dict()
+    assert copy._timeout == 60.0
+    assert copy._listeners == {'yes': on_yes}
+    assert copy.snapshot() == data
+
+
+def test_text_input_round_trip():
+    text_input = TextInput(custom_id='name', label='Name', placeholder='you', min_length=2, max_length=20, required=False, default='x')
+    message = ComponentMessage(components=[[text_input]])
+    assert ComponentMessage.from_snapshot(message.snapshot()).to_dict() == message.to_dict()
+
+
+def test_ids_and_handler_names():
+    message = make_message()
+    snapshot = decode_snapshot(encode_snapshot(message, handlers={'yes': 'polls.yes'}, message_id=5, channel_id=7))
+    assert snapshot.handlers == {'yes': 'polls.yes'}
+    assert snapshot.message_id == 5
+    assert snapshot.channel_id == 7
+    assert snapshot.message._listeners == {}
+
+
+def test_dump_and_load():
+    messages = [make_message(), ComponentMessage(content='plain')]
+    fp = io.BytesIO()
+    assert dump_snapshots(messages, fp) == 2
+    
+    data = fp.getvalue()
+    for loaded in (list(load_snapshots(io.BytesIO(data))), list(load_snapshots(data))):
+        assert [snapshot.message.to_dict() for snapshot in loaded] == [message.to_dict() for message in messages]
+
+
+def test_malformed_data_raises():
+    data = make_message().snapshot()
+    with pytest.raises(ValueError):
+        decode_snapshot(data[:-3])
+    with pytest.raises(ValueError):
+        decode_snapshot(data + b'\x00')
+    with pytest.raises(ValueError):
+        list(load_snapshots(b'nope'))
+    
+    fp = io.BytesIO()
+    dump_snapshots([make_message()], fp)
+    with pytest.raises(ValueError):
+        list(load_snapshots(fp.getvalue()[:-1]))
@@ -0,0 +1,56 @@
+import discord
+import pytest
+
+from discord_components import Button, ComponentMessage, ComponentTemplate, LayoutError, SelectMenu, SelectOption, Slot
+from discord_components.models import ActionRow
+
+
+def select_template():
+    options = [SelectOption(label=f'Option {n}', value=str(n)) for n in range(5)]
+    return ComponentTemplate(ComponentMessage(components=[ActionRow(
+        SelectMenu(custom_id='pick:{user}', options=options, min_values=Slot('low'), max_values=Slot('high'))
+    )]))
+
+
+def test_slot_select_values():
+    template = select_template()
+    message = template.instantiate(user='42', low=1, high=3)
+    select = message.to_dict()['components'][0]['components'][0]
+    assert (select['custom_id'], select['min_values'], select['max_values']) == ('pick:42', 1, 3)
+
+
+def test_slot_values_are_validated_when_filled():
+    with pytest.raises(LayoutError):
+        select_template().instantiate(user='42', low=4, high=2)
+
+
+def embed_template():
+    embed = discord.Embed(title='Order {order}')
+    embed.add_field(name='Status', value='open')
+    return ComponentTemplate(ComponentMessage(content='Hi', embeds=[embed]))
+
+
+def test_instantiated_embeds_are_independent():
+    template = embed_template()
+    first = template.instantiate(order='1')
+    first.embeds[0].add_field(name='Extra', value='x')
+    assert len(template.instantiate(order='2').embeds[0].fields) == 1
+
+
+def test_render_returns_a_copy():
+    template = ComponentTemplate(ComponentMessage(content='Hi', embeds=[discord.Embed(title='Fixed')]))
+    template.render()['embeds'][0]['title'] = 'Changed'
+    assert template.render()['embeds'][0]['title'] == 'Fixed'
+    
+    template = embed_template()
+    template.render(order='1')['embeds'][0]['fields'].clear()
+    assert len(template.render(order='2')['embeds'][0]['fields']) == 1
+
+
+def test_formatted_fields_are_validated():
+    template = ComponentTemplate(ComponentMessage(components=[[Button(label='{name}', custom_id='buy:{user}')]]))
+    template.instantiate(name='Apple', user='42')
+    with pytest.raises(LayoutError):
+        template.instantiate(name='x' * 300, user='42')
+    with pytest.raises(LayoutError):
+        template.instantiate(name='Apple', user='1' * 200)
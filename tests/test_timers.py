@@ -0,0 +1,92 @@
+import asyncio
+
+from discord_components import TimerWheel
+
+
+class Value:
+    def __init__(self):
+        self.released = False
+    
+    def release(self):
+        self.released = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_wheel():
+    clock = Clock()
+    batches = []
+    wheel = TimerWheel(timeout=10, resolution=1, slots=8, on_expire=batches.append, clock=clock)
+    return wheel, clock, batches
+
+
+def test_timers_expire_after_timeout():
+    wheel, clock, batches = make_wheel()
+    first, second = Value(), Value()
+    wheel.schedule(1, first)
+    wheel.schedule(2, second)
+    assert wheel.deadline(1) == 10
+    
+    assert wheel.advance(9.5) == 0
+    assert wheel.advance(10) == 2
+    assert batches == [[(1, first), (2, second)]]
+    assert first.released and second.released
+    assert len(wheel) == 0
+
+
+def test_reset_extends_the_deadline():
+    wheel, clock, batches = make_wheel()
+    value = Value()
+    wheel.schedule(1, value)
+    clock.now = 6
+    assert wheel.reset(1)
+    assert wheel.deadline(1) == 16
+    
+    assert wheel.advance(12) == 0
+    assert 1 in wheel
+    assert wheel.advance(16) == 1
+    assert batches == [[(1, value)]]
+    assert not wheel.reset(1)
+
+
+def test_cancel_does_not_expire():
+    wheel, clock, batches = make_wheel()
+    value = Value()
+    wheel.schedule(1, value)
+    assert wheel.cancel(1) is value
+    assert wheel.cancel(1) is None
+    
+    assert wheel.advance(20) == 0
+    assert batches == []
+    assert not value.released
+
+
+def test_timers_longer_than_the_wheel():
+    wheel, clock, batches = make_wheel()
+    wheel.schedule(1, timeout=30)
+    for now in range(1, 30):
+        assert wheel.advance(now) == 0
+    assert wheel.advance(30) == 1
+    assert wheel.stats['expired'] == 1
+
+
+def test_wheel_runs_on_its_own():
+    expired = []
+    
+    async def main():
+        async def on_expire(batch):
+            expired.extend(batch)
+        
+        wheel = TimerWheel(timeout=0.02, resolution=0.01, on_expire=on_expire)
+        wheel.schedule('a', timeout=0.02)
+        await asyncio.sleep(0.1)
+        await wheel.close()
+    
+    asyncio.run(main())
+    assert expired == [('a', None)]
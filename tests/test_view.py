@@ -0,0 +1,89 @@
+import asyncio
+
+from discord_components import Button, ComponentMessage
+
+
+def test_patched_item_drops_listener_of_old_custom_id():
+    button = Button(label='Yes', custom_id='yes')
+    message = ComponentMessage(components=[[button]])
+    
+    @message.on_interaction('yes')
+    async def yes(interaction):
+        pass
+    
+    async def main():
+        view = message.to_view()
+        item = view.children[0]
+        assert item.callback is yes
+        
+        button.custom_id = 'other'
+        assert message.to_view().children[0] is item
+        assert item.custom_id == 'other'
+        assert item.callback is not yes
+    
+    asyncio.run(main())
+
+
+def layout():
+    buttons = [Button(label=str(n), custom_id=str(n)) for n in range(3)]
+    return ComponentMessage(components=[buttons]), buttons
+
+
+def test_unchanged_layout_reuses_the_view_and_items():
+    message, buttons = layout()
+    
+    async def main():
+        view = message.to_view()
+        items = list(view.children)
+        again = message.to_view()
+        assert again is view
+        assert all(a is b for a, b in zip(again.children, items))
+    
+    asyncio.run(main())
+
+
+def test_changed_component_is_patched_in_place():
+    message, buttons = layout()
+    
+    async def main():
+        view = message.to_view()
+        items = list(view.children)
+        buttons[1].label = 'patched'
+        buttons[1].disabled = True
+        
+        assert message.to_view() is view
+        assert view.children[1] is items[1]
+        assert (items[1].label, items[1].disabled) == ('patched', True)
+        assert items[0].label == '0'
+    
+    asyncio.run(main())
+
+
+def test_new_and_removed_components():
+    message, buttons = layout()
+    
+    async def main():
+        view = message.to_view()
+        items = list(view.children)
+        message.remove_component('1')
+        message.add_component(Button(label='new', custom_id='new'), row=1)
+        
+        view = message.to_view()
+        assert [item.custom_id for item in view.children] == ['0', '2', 'new']
+        assert view.children[0] is items[0] and view.children[1] is items[2]
+        assert view.children[2].row == 1
+    
+    asyncio.run(main())
+
+
+def test_stopped_view_is_replaced():
+    message, buttons = layout()
+    
+    async def main():
+        view = message.to_view()
+        view.stop()
+        fresh = message.to_view()
+        assert fresh is not view
+        assert [item.custom_id for item in fresh.children] == ['0', '1', '2']
+    
+    asyncio.run(main())